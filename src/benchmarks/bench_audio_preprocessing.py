@@ -0,0 +1,74 @@
+"""Подготовка аудио к распознаванию: цепочка pydub против одного прохода numpy.
+
+Запись обрабатывается частями по --chunk-seconds, как в конвейере, поэтому
+в памяти одновременно только одна часть: даунмикс, ресемплинг в 16 kHz,
+s16 и нормализация пика.
+Запуск: python -m src.benchmarks.bench_audio_preprocessing --minutes 10 60 180
+"""
+
+import argparse
+import time
+
+import numpy as np
+from pydub import AudioSegment
+
+from src.utils.files.audio.preprocess_pcm import preprocess_pcm
+
+TARGET_RATE = 16000
+
+
+def pydub_chain(data: bytes, frame_rate: int, channels: int) -> bytes:
+    """Прежний путь: копия AudioSegment на каждом шаге."""
+    segment = AudioSegment(
+        data, frame_rate=frame_rate, sample_width=2, channels=channels
+    )
+    segment = segment.set_channels(1).set_frame_rate(TARGET_RATE)
+    segment = segment.set_sample_width(2)
+    return segment.normalize().raw_data
+
+
+def numpy_pass(data: bytes, frame_rate: int, channels: int) -> bytes:
+    return preprocess_pcm(data, frame_rate, channels, 2)
+
+
+def synthetic_chunk(seconds: float, frame_rate: int, channels: int) -> bytes:
+    rng = np.random.default_rng(0)
+    samples = rng.normal(0, 3000, (int(seconds * frame_rate), channels))
+    return np.clip(samples, -32768, 32767).astype("<i2").tobytes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, nargs="+", default=[10, 60, 180])
+    parser.add_argument("--rate", type=int, default=44100)
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--chunk-seconds", type=float, default=50)
+    args = parser.parse_args()
+
+    chunk = synthetic_chunk(args.chunk_seconds, args.rate, args.channels)
+    print(
+        f"Вход: {args.rate} Hz, {args.channels} кан., s16, "
+        f"части по {args.chunk_seconds:.0f} сек"
+    )
+
+    for minutes in args.minutes:
+        chunks = max(1, round(minutes * 60 / args.chunk_seconds))
+        times = {}
+        for name, run in (("pydub", pydub_chain), ("numpy", numpy_pass)):
+            started = time.perf_counter()
+            for _ in range(chunks):
+                run(chunk, args.rate, args.channels)
+            times[name] = time.perf_counter() - started
+
+        realtime = minutes * 60
+        print(
+            f"{minutes:>5.0f} мин: pydub {times['pydub']:.2f} сек "
+            f"(x{realtime / times['pydub']:.0f} реального времени), "
+            f"numpy {times['numpy']:.2f} сек "
+            f"(x{realtime / times['numpy']:.0f}), "
+            f"ускорение x{times['pydub'] / times['numpy']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Извлечение текста DOCX: python-docx Document против потокового разбора
+word/document.xml.
+
+Документ генерируется: --paragraphs абзацев, таблица на каждые 100
+абзацев и --images несжимаемых изображений. Пиковая память - tracemalloc:
+он видит только аллокации Python, так что память дерева lxml в python-docx
+занижена.
+Запуск: python -m src.benchmarks.bench_docx_extraction --paragraphs 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from docx import Document
+from docx.shared import Inches
+from PIL import Image
+
+from src.utils.files.text.extract_docx_text import extract_docx_text
+
+
+def make_docx(path: str, paragraphs: int, images: int) -> None:
+    document = Document()
+    image_dir = tempfile.mkdtemp()
+    rng = np.random.default_rng(0)
+    for number in range(images):
+        image_path = os.path.join(image_dir, f"{number}.png")
+        pixels = rng.integers(0, 255, (800, 800, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(image_path)
+        document.add_picture(image_path, width=Inches(4))
+        os.remove(image_path)
+    os.rmdir(image_dir)
+
+    for number in range(paragraphs):
+        document.add_paragraph(
+            f"{number}. Обсудили сроки релиза, ответственный за миграцию - "
+            f"команда бэкенда, риск {number % 7}."
+        )
+        if number % 100 == 99:
+            table = document.add_table(rows=5, cols=3)
+            for row in table.rows:
+                for column, cell in enumerate(row.cells):
+                    cell.text = f"задача {number}-{column}"
+    document.save(path)
+
+
+def python_docx_text(path: str) -> str:
+    """Прежний путь: полное дерево Document и text += paragraph.text."""
+    doc = Document(path)
+    text = ""
+    for paragraph in doc.paragraphs:
+        text += paragraph.text + "\n"
+    return text
+
+
+def measure(run, path: str) -> tuple[float, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    text = run(path)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024, len(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    parser.add_argument("--images", type=int, default=10)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".docx")
+    os.close(fd)
+    try:
+        make_docx(path, args.paragraphs, args.images)
+        print(
+            f"DOCX: {args.paragraphs} абзацев, {args.images} изображений, "
+            f"{os.path.getsize(path) / 1024 / 1024:.1f} MB"
+        )
+        for name, run in (
+            ("python-docx", python_docx_text),
+            ("streaming", extract_docx_text),
+        ):
+            seconds, peak_mb, chars = measure(run, path)
+            print(
+                f"{name:<12} {seconds:.2f} сек, пик памяти {peak_mb:.1f} MB, "
+                f"{chars} символов"
+            )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
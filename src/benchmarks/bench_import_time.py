@@ -0,0 +1,68 @@
+"""Время импорта приложения при старте API процесса.
+
+Каждый замер - новый интерпретатор с python -X importtime, чтобы модули не
+брались из sys.modules предыдущего запуска. Печатается медиана общего времени
+импорта модуля и то, какие тяжелые библиотеки извлечения текста загружены
+сразу при старте.
+Запуск: python -m src.benchmarks.bench_import_time --module src.main --runs 7
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "pydub",
+    "pypdf",
+    "pytesseract",
+    "speech_recognition",
+    "docx",
+    "PIL",
+    "numpy",
+)
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Накопительное время импорта (мс) по модулям одного запуска."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            # Модуль попадает в лог один раз - при первом импорте
+            times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    # Прогрев: байткод модулей компилируется при первом запуске
+    import_times(args.module)
+    runs = [import_times(args.module) for _ in range(args.runs)]
+
+    total = statistics.median(run[args.module] for run in runs)
+    print(f"import {args.module}: {total:.0f} мс (медиана {args.runs} запусков)")
+
+    loaded = [name for name in HEAVY_MODULES if name in runs[0]]
+    for name in loaded:
+        median = statistics.median(run[name] for run in runs)
+        print(f"  {name:<20} {median:6.0f} мс")
+    if not loaded:
+        print("  тяжелые библиотеки извлечения текста не загружены")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""OCR изображений: прежний путь (полное разрешение, get_languages на каждый
+файл, один проход) против ocr_image (предобработка, полосы параллельно,
+кэш языков).
+
+Корпус синтетический: известный текст рендерится на фото доски (крупный
+шрифт, неравномерный фон, шум), скан страницы и длинный скриншот. Точность -
+доля совпадающих символов с исходным текстом (difflib).
+Запуск: python -m src.benchmarks.bench_ocr --dir /tmp/ocr-corpus
+"""
+
+import argparse
+import difflib
+import os
+import shutil
+import time
+
+import numpy as np
+import pytesseract
+from PIL import Image, ImageDraw, ImageFont
+
+from src.utils.files.image.ocr_image import ocr_image
+
+LINES = [
+    "Release 2.4 planning: migrate billing service to the new queue",
+    "Owner: backend team, deadline Friday, risk: data backfill",
+    "Frontend: dashboard filters, export to CSV, dark theme",
+    "QA: regression suite for payments, load test 500 rps",
+    "Open question: retention policy for audit logs (90 days?)",
+    "Action items: update API docs, notify support, demo on Monday",
+]
+
+
+def render(
+    size: tuple[int, int],
+    font_size: int,
+    lines: list[str],
+    background: str,
+    noise: float,
+    seed: int,
+) -> Image.Image:
+    """Текст построчно на фоне с градиентом освещенности и шумом."""
+    width, height = size
+    rng = np.random.default_rng(seed)
+    gradient = np.linspace(0, 1, width)[None, :] * np.linspace(1, 0.6, height)[:, None]
+    base = 255 if background == "white" else 200
+    pixels = base - 60 * (1 - gradient)
+    image = Image.fromarray(pixels.astype(np.uint8)).convert("RGB")
+
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=font_size)
+    y = font_size
+    for line in lines:
+        draw.text((font_size, y), line, fill=(20, 30, 90), font=font)
+        y += int(font_size * 1.6)
+
+    if noise:
+        array = np.asarray(image).astype(np.float32)
+        array += rng.normal(0, noise, array.shape)
+        image = Image.fromarray(np.clip(array, 0, 255).astype(np.uint8))
+    return image
+
+
+def build_corpus(directory: str) -> list[tuple[str, str]]:
+    """Сохраняет изображения корпуса и возвращает пары (файл, текст)."""
+    os.makedirs(directory, exist_ok=True)
+    cases = {
+        "whiteboard": ((6000, 4000), 110, LINES * 3, "gray", 12.0),
+        "scan": ((2480, 3508), 40, LINES * 12, "white", 4.0),
+        "screenshot": ((1400, 9000), 24, LINES * 60, "white", 0.0),
+    }
+
+    corpus = []
+    for seed, (name, (size, font_size, lines, background, noise)) in enumerate(
+        cases.items()
+    ):
+        # Строки, не поместившиеся на изображение, в эталон не входят
+        lines = lines[: (size[1] - font_size) // int(font_size * 1.6)]
+        path = os.path.join(directory, f"{name}.png")
+        render(size, font_size, lines, background, noise, seed).save(path)
+        corpus.append((path, "\n".join(lines)))
+    return corpus
+
+
+def legacy_ocr(file_path: str) -> str:
+    image = Image.open(file_path)
+    available_langs = pytesseract.get_languages(config="")
+    if "rus" in available_langs and "eng" in available_langs:
+        return pytesseract.image_to_string(image, lang="rus+eng")
+    elif "eng" in available_langs:
+        return pytesseract.image_to_string(image, lang="eng")
+    return pytesseract.image_to_string(image)
+
+
+def accuracy(expected: str, actual: str) -> float:
+    normalize = lambda text: " ".join(text.split())  # noqa: E731
+    return difflib.SequenceMatcher(
+        None, normalize(expected), normalize(actual), autojunk=False
+    ).ratio()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dir", default="./backend/cache/ocr-corpus")
+    args = parser.parse_args()
+
+    if shutil.which(pytesseract.pytesseract.tesseract_cmd) is None:
+        raise SystemExit("Tesseract не найден, установите tesseract-ocr")
+
+    for path, expected in build_corpus(args.dir):
+        for name, run in (("legacy", legacy_ocr), ("ocr_image", ocr_image)):
+            started = time.perf_counter()
+            text = run(path)
+            seconds = time.perf_counter() - started
+            print(
+                f"{os.path.basename(path):<16} {name:<10} {seconds:6.2f} сек  "
+                f"точность {accuracy(expected, text) * 100:5.1f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
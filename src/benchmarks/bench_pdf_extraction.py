@@ -0,0 +1,106 @@
+"""Извлечение текста PDF: последовательно в одном процессе против диапазонов
+страниц в пуле процессов ExtractionService.
+
+PDF генерируется: --pages страниц по --lines строк текста спецификации.
+Запуск: python -m src.benchmarks.bench_pdf_extraction --pages 300 --workers 4
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from src.services.extraction_service import ExtractionService
+from src.utils.files.text.extract_pdf_text import extract_pdf_text
+
+
+def make_text_pdf(path: str, pages: int, lines: int = 50) -> None:
+    """PDF с текстовым слоем Helvetica, по lines строк на странице."""
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for number in range(pages):
+        page = writer.add_blank_page(612, 792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        text = " ".join(
+            f"({number + 1}.{line} The service shall validate request field "
+            f"{line} and return error code {400 + line % 30}.) Tj T*"
+            for line in range(lines)
+        )
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 9 Tf 14 TL 40 760 Td {text} ET".encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def serial_concat(path: str) -> str:
+    """Прежний путь: text += page.extract_text() по всем страницам."""
+    reader = PdfReader(path)
+    text = ""
+    for page in reader.pages:
+        text += page.extract_text()
+    return text
+
+
+async def parallel(path: str, workers: int) -> tuple[str, float]:
+    service = ExtractionService(workers=workers, timeout=600)
+    await service.start()
+    try:
+        started = time.perf_counter()
+        text = await service.extract(path, "application/pdf")
+        return text, time.perf_counter() - started
+    finally:
+        await service.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--lines", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    try:
+        make_text_pdf(path, args.pages, args.lines)
+        print(
+            f"PDF: {args.pages} страниц, {os.path.getsize(path) / 1024:.0f} KB, "
+            f"процессов: {args.workers}"
+        )
+
+        for name, run in (
+            ("text +=", lambda: serial_concat(path)),
+            ("join", lambda: extract_pdf_text(path)),
+        ):
+            started = time.perf_counter()
+            text = run()
+            print(
+                f"{name:<10} {time.perf_counter() - started:.2f} сек, "
+                f"{len(text)} символов"
+            )
+
+        text, seconds = asyncio.run(parallel(path, args.workers))
+        assert text == extract_pdf_text(path)
+        print(f"{'parallel':<10} {seconds:.2f} сек, {len(text)} символов")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Передача части аудио распознавателю: временный WAV файл, WAV в памяти и
+AudioData прямо из PCM (так передают части ASR бэкенды).
+
+Измеряется подготовка AudioData (без запроса к API распознавания).
+Запуск: python -m src.benchmarks.bench_wav_handoff --chunks 50 --dir /tmp
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+import wave
+
+import numpy as np
+import speech_recognition as sr
+from pydub import AudioSegment
+
+FRAME_RATE = 16000
+
+
+def to_wav_buffer(audio_segment: AudioSegment) -> io.BytesIO:
+    """WAV в памяти из PCM части: заголовок RIFF и сырые кадры без перекодирования."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(audio_segment.channels)
+        wav_file.setsampwidth(audio_segment.sample_width)
+        wav_file.setframerate(audio_segment.frame_rate)
+        wav_file.writeframesraw(audio_segment.raw_data)
+    buffer.seek(0)
+    return buffer
+
+
+def via_temp_file(chunk: AudioSegment, directory: str | None) -> sr.AudioData:
+    """Прежний путь: экспорт во временный файл, чтение, удаление."""
+    r = sr.Recognizer()
+    with tempfile.NamedTemporaryFile(
+        suffix=".wav", delete=False, dir=directory
+    ) as temp_wav:
+        temp_wav_path = temp_wav.name
+    try:
+        chunk.export(temp_wav_path, format="wav")
+        with sr.AudioFile(temp_wav_path) as source:
+            r.adjust_for_ambient_noise(source, duration=0.5)
+            return r.record(source)
+    finally:
+        os.remove(temp_wav_path)
+
+
+def via_memory(chunk: AudioSegment) -> sr.AudioData:
+    r = sr.Recognizer()
+    with sr.AudioFile(to_wav_buffer(chunk)) as source:
+        r.adjust_for_ambient_noise(source, duration=0.5)
+        return r.record(source)
+
+
+def via_audio_data(chunk: AudioSegment) -> sr.AudioData:
+    return sr.AudioData(chunk.raw_data, chunk.frame_rate, chunk.sample_width)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunks", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=50)
+    parser.add_argument("--dir", default=None, help="Каталог для временных файлов")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    samples = rng.normal(0, 3000, int(args.seconds * FRAME_RATE)).astype("<i2")
+    chunk = AudioSegment(
+        samples.tobytes(), frame_rate=FRAME_RATE, sample_width=2, channels=1
+    )
+
+    assert via_memory(chunk).frame_data == via_temp_file(chunk, args.dir).frame_data
+    assert via_audio_data(chunk).frame_data == chunk.raw_data
+
+    for name, run in (
+        ("temp file", lambda: via_temp_file(chunk, args.dir)),
+        ("in memory", lambda: via_memory(chunk)),
+        ("audio data", lambda: via_audio_data(chunk)),
+    ):
+        started = time.perf_counter()
+        for _ in range(args.chunks):
+            run()
+        per_chunk = (time.perf_counter() - started) / args.chunks
+        print(f"{name:<10} {per_chunk * 1000:.2f} мс на часть {args.seconds:.0f} сек")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,8 +29,8 @@ async def handle_file_ready_event(data: dict):
                                 "content-type", "application/octet-stream"
                             )
 
-                        async def read(self):
-                            return self.file.read()
+                        async def read(self, size: int = -1):
+                            return self.file.read(size)
 
                         def seek(self, position):
                             return self.file.seek(position)
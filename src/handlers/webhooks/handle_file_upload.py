@@ -125,8 +125,8 @@ async def create_webhook_file_object(file_data: dict):
             self.filename = filename
             self.content_type = file_data.get("mime_type", "text/plain")
 
-        async def read(self):
-            return self.file.read()
+        async def read(self, size: int = -1):
+            return self.file.read(size)
 
         def seek(self, position):
             return self.file.seek(position)
@@ -1,5 +1,6 @@
 import logging
 import os
+import tracemalloc
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -9,7 +10,11 @@ from starlette.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
 
 from src.database import close_db_connection, create_db_and_tables
+from src.middlewares.upload_size_limit import UploadSizeLimitMiddleware
 from src.schemas.main.root_schemas import RootResponseSchema
+from src.services.extraction_service import extraction_service
+from src.services.job_service import job_service
+from src.services.llm_service import shutdown_llm_client, startup_llm_client
 from src.settings.config import settings
 
 # Configure logging
@@ -58,9 +63,22 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator:
     """
     logger.debug("Starting Meet2Jira App...")
 
+    if settings.timings_trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        logger.debug("Memory tracing enabled for stage timings.")
+
     await create_db_and_tables()
     logger.debug("Database tables created/verified.")
 
+    await startup_llm_client()
+    logger.debug("LLM HTTP client initialized.")
+
+    await extraction_service.start()
+    logger.debug("Text extraction pool started.")
+
+    await job_service.start()
+    logger.debug("Processing workers started.")
+
     # # Initialize Name service
     # try:
     #     name_service = await get_name_service()
@@ -76,6 +94,15 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator:
     # Shutdown
     logger.debug("Shutting down Meet2Jira App...")
 
+    await job_service.stop()
+    logger.debug("Processing workers stopped.")
+
+    await extraction_service.stop()
+    logger.debug("Text extraction pool stopped.")
+
+    await shutdown_llm_client()
+    logger.debug("LLM HTTP client closed.")
+
     await close_db_connection()
     logger.debug("Database connection closed.")
 
@@ -104,6 +131,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Лимит размера загрузки проверяется во время приема тела запроса
+app.add_middleware(UploadSizeLimitMiddleware)
+
 
 UPLOAD_DIR = "static/img/uploaded_files"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -133,6 +163,7 @@ from fastadmin import fastapi_app as admin_app
 # Include routers
 from src.routers.auth import auth_router
 from src.routers.file_processing import processing_router
+from src.routers.live import live_router
 from src.routers.meeting import meeting_router
 from src.routers.utils import utils_router
 
@@ -145,6 +176,7 @@ from src.admin.admin import MeetingAdmin, UserAdmin  # noqa: F401
 # Include routers
 app.include_router(auth_router, tags=["Authentication"])
 app.include_router(processing_router, tags=["File Processing"])
+app.include_router(live_router, tags=["Live Meeting"])
 app.include_router(utils_router, tags=["Utils"])
 app.include_router(meeting_router, tags=["Meeting"])
 
@@ -0,0 +1,77 @@
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.settings.config import settings
+from src.utils.files.spool_upload import UploadTooLargeError, upload_too_large_message
+
+# Запас на границы и заголовки частей multipart сверх размера самого файла
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Ограничение размера тела запроса во время приема.
+
+    Запрос с Content-Length больше settings.max_file_size (с запасом на
+    разметку multipart) отклоняется с 413 до чтения тела. Тело без
+    Content-Length (chunked) считается по мере поступления, и прием
+    прерывается, как только лимит превышен. Ответ приложения на прерванное
+    тело (FastAPI отвечает 400 на ошибку разбора формы) заменяется на 413.
+    Точный размер файла затем проверяет spool_upload.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_body_size = settings.max_file_size + MULTIPART_OVERHEAD_BYTES
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_body_size:
+            await self._reject(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body_size:
+                    exceeded = True
+                    raise UploadTooLargeError(
+                        upload_too_large_message(settings.max_file_size)
+                    )
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if exceeded:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except UploadTooLargeError:
+            if not exceeded:
+                raise
+
+        if exceeded and not response_started:
+            await self._reject(scope, receive, send)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            {"detail": upload_too_large_message(settings.max_file_size)},
+            status_code=413,
+            headers={"Connection": "close"},
+        )
+        await response(scope, receive, send)
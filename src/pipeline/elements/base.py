@@ -1,18 +1,38 @@
+import asyncio
 import logging
 from typing import Any
 
+from src.settings.config import settings
+from src.utils.cache.make_cache_key import make_cache_key
+from src.utils.metrics.stage_timer import stage
+
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
 class Element:
-    """Класс для представления элемента, который может быть выполнен с использованием модели и инструментов."""
+    """Класс для представления элемента, который может быть выполнен с использованием модели и инструментов.
+
+    inputs и outputs задают имена значений, которые элемент читает и публикует
+    в контексте конвейера. По ним Pipeline строит граф зависимостей.
+    """
 
-    def __init__(self, model: str, tools: list, prompt: str, obj: Any):
+    def __init__(
+        self,
+        model: str,
+        tools: list,
+        prompt: str,
+        obj: Any,
+        inputs: tuple[str, ...] = (),
+        outputs: tuple[str, ...] = (),
+    ):
         self.model = model
         self.tools = tools
         self.prompt = prompt
         self.obj = obj
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.context: dict[str, Any] = {}
 
     def __call__(self, *args, **kwargs):
         return self.run()
@@ -20,29 +40,197 @@ class Element:
     def run(self) -> dict:
         raise NotImplementedError("Метод run должен быть реализован в подклассе.")
 
+    async def arun(self) -> Any:
+        """Асинхронное выполнение элемента.
+
+        По умолчанию синхронный run выполняется в отдельном потоке, чтобы не
+        блокировать event loop. Подклассы с неблокирующим I/O переопределяют метод.
+        """
+        return await asyncio.to_thread(self.run)
+
+    @property
+    def stage_name(self) -> str:
+        """Имя этапа в замерах конвейера."""
+        return type(self).__name__
+
+    def resolve_prompt(self) -> str:
+        """Промпт с подставленными значениями входов ({имя_входа} в шаблоне)."""
+        if not self.inputs:
+            return self.prompt
+
+        values = {name: _as_text(self.context.get(name)) for name in self.inputs}
+        return self.prompt.format(**values)
+
+    def cache_key(self) -> str:
+        """Ключ для кэширования результата элемента."""
+        return make_cache_key(
+            self.model, self.resolve_prompt(), {"element": type(self).__name__}
+        )
+
+    async def on_cache_hit(self, result: dict) -> None:
+        """Вызывается, когда результат элемента взят из кэша вместо выполнения."""
+
 
 class Pipeline(Element):
-    """Класс для представления конвейера, который выполняет последовательность элементов."""
+    """Класс для представления конвейера, который выполняет граф элементов.
+
+    Элемент запускается, когда готовы все значения из его inputs. Независимые
+    элементы в arun выполняются параллельно, но не более concurrency одновременно.
+    Результаты возвращаются в порядке элементов, ошибка элемента не прерывает
+    конвейер: зависящие от него элементы пропускаются с ошибкой.
+    """
 
-    def __init__(self, model: str, tools: list, elements: list):
-        super().__init__(model, tools, "", None)
+    def __init__(
+        self,
+        model: str,
+        tools: list,
+        elements: list,
+        concurrency: int = settings.pipeline_concurrency,
+        inputs: tuple[str, ...] = (),
+        outputs: tuple[str, ...] = (),
+    ):
+        super().__init__(model, tools, "", None, inputs=inputs, outputs=outputs)
         self.document_type = None
         self.elements = elements
+        self.concurrency = concurrency
 
     def run(self) -> dict:
-        """Выполняет все элементы конвейера."""
-        results = []
+        """Выполняет все элементы конвейера в топологическом порядке."""
+        dependencies, order = self._plan()
+        context = dict(self.context)
+        results: list[Any] = [None] * len(self.elements)
+
+        for index in order:
+            error = self._failed_dependency(index, dependencies, results)
+            if error:
+                results[index] = error
+                continue
+
+            element = self.elements[index]
+            element.context = {name: context.get(name) for name in element.inputs}
+            with stage(element.stage_name):
+                try:
+                    results[index] = self._to_result(element.run())
+                except Exception as e:
+                    results[index] = self._error_result(element, e)
+            self._publish(element, results[index], context)
+
+        return self._build_response(results)
+
+    async def arun(self) -> dict:
+        """Асинхронно выполняет граф элементов, запуская готовые элементы параллельно."""
+        dependencies, _ = self._plan()
+        context = dict(self.context)
+        results: list[Any] = [None] * len(self.elements)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_element(index: int) -> None:
+            element = self.elements[index]
+            element.context = {name: context.get(name) for name in element.inputs}
+            async with semaphore:
+                with stage(element.stage_name):
+                    try:
+                        results[index] = self._to_result(await element.arun())
+                    except Exception as e:
+                        results[index] = self._error_result(element, e)
+            self._publish(element, results[index], context)
+
+        pending = set(range(len(self.elements)))
+        running: dict[asyncio.Task, int] = {}
+        done: set[int] = set()
+
+        while pending or running:
+            for index in sorted(pending):
+                if not dependencies[index] <= done:
+                    continue
+                pending.discard(index)
+
+                error = self._failed_dependency(index, dependencies, results)
+                if error:
+                    results[index] = error
+                    done.add(index)
+                else:
+                    running[asyncio.create_task(run_element(index))] = index
+
+            if not running:
+                continue
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                done.add(running.pop(task))
+
+        return self._build_response(results)
+
+    def _plan(self) -> tuple[list[set[int]], list[int]]:
+        """Строит зависимости элементов и проверяет граф на ошибки и циклы."""
+        producers: dict[str, int] = {}
+        for index, element in enumerate(self.elements):
+            for name in element.outputs:
+                if name in producers:
+                    raise ValueError(f"Значение '{name}' публикуют несколько элементов")
+                producers[name] = index
+
+        dependencies = []
         for element in self.elements:
-            result = element.run()
+            element_dependencies = set()
+            for name in element.inputs:
+                if name in producers:
+                    element_dependencies.add(producers[name])
+                elif name not in self.context:
+                    raise ValueError(f"Нет источника для входа '{name}'")
+            dependencies.append(element_dependencies)
+
+        order: list[int] = []
+        remaining = set(range(len(self.elements)))
+        while remaining:
+            ready = sorted(i for i in remaining if dependencies[i] <= set(order))
+            if not ready:
+                raise ValueError("Граф элементов конвейера содержит цикл")
+            order.extend(ready)
+            remaining.difference_update(ready)
 
-            # For Pydantic models, use model_dump or dict to convert to dict
-            if hasattr(result, "model_dump"):
-                results.append(result.model_dump())
-            elif hasattr(result, "dict"):
-                results.append(result.dict())
+        return dependencies, order
+
+    def _failed_dependency(
+        self, index: int, dependencies: list[set[int]], results: list
+    ) -> dict | None:
+        for dependency in sorted(dependencies[index]):
+            if _is_error(results[dependency]):
+                name = type(self.elements[dependency]).__name__
+                return {
+                    "status": "error",
+                    "error": True,
+                    "error_message": f"Пропущено: зависимость {name} завершилась с ошибкой",
+                }
+        return None
+
+    @staticmethod
+    def _publish(element: Element, result: Any, context: dict) -> None:
+        if _is_error(result):
+            return
+        for name in element.outputs:
+            if len(element.outputs) > 1 and isinstance(result, dict):
+                context[name] = result.get(name)
             else:
-                results.append(result)
+                context[name] = result
+
+    @staticmethod
+    def _error_result(element: Element, error: Exception) -> dict:
+        logger.error(f"Ошибка элемента {type(element).__name__}: {str(error)}")
+        return {"status": "error", "error": True, "error_message": str(error)}
+
+    @staticmethod
+    def _to_result(result: Any) -> Any:
+        # For Pydantic models, use model_dump or dict to convert to dict
+        if hasattr(result, "model_dump"):
+            return result.model_dump()
+        elif hasattr(result, "dict"):
+            return result.dict()
+        return result
 
+    def _build_response(self, results: list) -> dict:
         return {
             "status": "success",
             "results": results,
@@ -52,6 +240,17 @@ class Pipeline(Element):
         }
 
 
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and bool(result.get("error"))
+
+
+def _as_text(value: Any) -> str:
+    """Текстовое представление результата элемента для подстановки в промпт."""
+    if isinstance(value, dict) and "response_text" in value:
+        return value["response_text"]
+    return "" if value is None else str(value)
+
+
 class Tool:
     """Класс для представления инструмента, который может быть использован в конвейере."""
 
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+from typing import Any
+
+from src.pipeline.elements.base import Element, Pipeline
+from src.utils.cache.tiered_cache import TieredCache
+from src.utils.metrics.stage_timer import annotate_stage
+
+logger = logging.getLogger(__name__)
+
+
+class CachedElement(Element):
+    """Обертка над элементом, кэширующая его результат по cache_key().
+
+    Результат возвращается в виде словаря (как в списке results конвейера),
+    ошибочные результаты не кэшируются.
+    """
+
+    def __init__(self, element: Element, cache: TieredCache):
+        super().__init__(
+            element.model,
+            element.tools,
+            element.prompt,
+            element.obj,
+            inputs=element.inputs,
+            outputs=element.outputs,
+        )
+        self.element = element
+        self.cache = cache
+
+    @property
+    def stage_name(self) -> str:
+        return self.element.stage_name
+
+    def cache_key(self) -> str:
+        # Входы, выставленные конвейером, нужны обернутому элементу для промпта
+        self.element.context = self.context
+        return self.element.cache_key()
+
+    def run(self) -> Any:
+        key = self.cache_key()
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"Результат {type(self.element).__name__} взят из кэша")
+            annotate_stage(cache_hit=True)
+            return cached
+
+        result = Pipeline._to_result(self.element.run())
+        self._store(key, result)
+        return result
+
+    async def arun(self) -> Any:
+        key = self.cache_key()
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            logger.debug(f"Результат {type(self.element).__name__} взят из кэша")
+            annotate_stage(cache_hit=True)
+            await self.element.on_cache_hit(cached)
+            return cached
+
+        result = Pipeline._to_result(await self.element.arun())
+        await asyncio.to_thread(self._store, key, result)
+        return result
+
+    def _store(self, key: str, result: Any) -> None:
+        if isinstance(result, dict) and result.get("error"):
+            return
+        try:
+            self.cache.set(key, result)
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить результат в кэш: {str(e)}")
@@ -1,21 +1,32 @@
+import asyncio
 import datetime
 import json
 import logging
 import os
 import tempfile
+from collections.abc import Awaitable, Callable
 
 from fastapi import File
 
 from src.database import AsyncSessionLocal, get_db_session
+from src.models.parsed_task import ParsedTask
 from src.repositories.meeting import MeetingRepository
 from src.schemas.model.meeting import MeetingCreateSchema
 from src.schemas.processing.processing_schemas import ProcessingResponseSchema
-from src.services.llm_service import LlmService
+from src.services.chunked_llm_service import ChunkedLlmService
+from src.services.extraction_service import get_extraction_service
+from src.services.llm_service import LlmService, get_llm_cache
 from src.services.meeting_service import MeetingService
+from src.settings.config import settings
 from src.tools.prompt_generator import PromptGenerator
-from src.utils.files.text.extract_text_from_file import extract_text_from_file
+from src.utils.files.extractors.registry import detect_file_extractor
+from src.utils.files.spool_upload import spool_upload
+from src.utils.llm.estimate_tokens import estimate_file_tokens, estimate_tokens
+from src.utils.metrics.stage_timer import annotate_stage, collect_timings, stage
+from src.utils.metrics.timing_registry import get_timing_registry
 
-from .elements.base import Pipeline
+from .elements.base import Element, Pipeline
+from .elements.cached import CachedElement
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -25,30 +36,131 @@ async def process_document(
     file: File, model: str = "yandex-gpt"
 ) -> ProcessingResponseSchema:
     """Функция для обработки документа с использованием Pipeline."""
-    # Сохраняем файл временно
-    with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_file_path = tmp_file.name
+    # Сохраняем файл временно, не загружая его целиком в память
+    file_ext = os.path.splitext(file.filename or "")[1].lower()
+    fd, tmp_file_path = tempfile.mkstemp(suffix=file_ext)
+    os.close(fd)
 
+    try:
+        upload = await spool_upload(
+            file, tmp_file_path, max_size=settings.max_file_size
+        )
+        return await process_stored_document(
+            file_path=tmp_file_path,
+            filename=file.filename,
+            content_type=file.content_type,
+            model=model,
+            content_hash=upload.sha256,
+        )
+
+    finally:
+        # Удаляем временный файл
+        if os.path.exists(tmp_file_path):
+            os.unlink(tmp_file_path)
+
+
+async def process_stored_document(
+    file_path: str,
+    filename: str,
+    content_type: str,
+    model: str = "yandex-gpt",
+    on_task: Callable[[ParsedTask], Awaitable[None]] | None = None,
+    content_hash: str | None = None,
+) -> ProcessingResponseSchema:
+    """Обработка документа, уже сохраненного на диске.
+
+    on_task вызывается для каждой задачи, как только модель закончила ее генерировать.
+    content_hash - sha256 содержимого файла, посчитанный при сохранении загрузки.
+    Замеры этапов возвращаются в поле timings и сохраняются в реестре замеров.
+    """
+    with collect_timings() as timings:
+        result = await _process_stored_document(
+            file_path=file_path,
+            filename=filename,
+            content_type=content_type,
+            model=model,
+            on_task=on_task,
+            content_hash=content_hash,
+        )
+
+    result.timings = timings.to_dict()
+    get_timing_registry().record(
+        timings,
+        document_name=filename,
+        content_type=content_type,
+        content_hash=content_hash,
+        model=model,
+    )
+    return result
+
+
+def build_task_extraction_element(
+    text: str,
+    model: str = "yandex-gpt",
+    on_task: Callable[[ParsedTask], Awaitable[None]] | None = None,
+) -> Element:
+    """Элемент извлечения задач из текста обсуждения.
+
+    Длинный текст обрабатывается по частям (ChunkedLlmService), ответы модели
+    кэшируются, если включен settings.llm_cache_enabled.
+    """
+    prompt_generator = PromptGenerator(text=text)
+    prompts = prompt_generator.run_chunks(settings.llm_chunk_max_tokens)
+    cache = get_llm_cache() if settings.llm_cache_enabled else None
+
+    if len(prompts) > 1:
+        # Длинный текст: извлекаем задачи по частям и объединяем
+        logger.info(f"Текст разбит на {len(prompts)} частей")
+        return ChunkedLlmService(
+            prompts=prompts, model=model, cache=cache, on_task=on_task
+        )
+
+    llm_element = LlmService(prompt=prompts[0], model=model, on_task=on_task)
+    if cache is not None:
+        llm_element = CachedElement(llm_element, cache=cache)
+    return llm_element
+
+
+async def _process_stored_document(
+    file_path: str,
+    filename: str,
+    content_type: str,
+    model: str,
+    on_task: Callable[[ParsedTask], Awaitable[None]] | None,
+    content_hash: str | None,
+) -> ProcessingResponseSchema:
     try:
         # 1. Извлекаем текст из файла
-        text = extract_text_from_file(tmp_file_path, file.content_type)
+        with stage("extract_text"):
+            # Тип определяется по содержимому, заявленный content type может
+            # быть общим (application/octet-stream)
+            extractor = detect_file_extractor(file_path, content_type)
+            text = await get_extraction_service().extract(
+                file_path, content_type, content_hash, extractor=extractor
+            )
+            annotate_stage(text_chars=len(text), text_tokens=estimate_tokens(text))
+            if extractor.name == "html":
+                # Размер промпта до удаления разметки, для сравнения с text_tokens
+                annotate_stage(
+                    source_tokens=await asyncio.to_thread(
+                        estimate_file_tokens, file_path
+                    )
+                )
         if not text.strip():
             return ProcessingResponseSchema(
                 status="error",
                 error=True,
                 error_message="Extracted text is empty",
                 model=model,
-                document_name=file.filename,
+                document_name=filename,
                 summary={},
             )
 
         # Сохраняем извлеченный текст в БД
         meeting_data = {
-            "title": f"Обработка файла {file.filename}",
-            "file_name": file.filename,
-            "description": f"Обработка файла {file.filename} с помощью модели {model}",
+            "title": f"Обработка файла {filename}",
+            "file_name": filename,
+            "description": f"Обработка файла {filename} с помощью модели {model}",
             "meeting_date": datetime.datetime.now(),
         }
         meeting_schema = MeetingCreateSchema(**meeting_data)
@@ -56,13 +168,16 @@ async def process_document(
         logger.info(f"Создание записи встречи с данными: {meeting_schema}")
 
         try:
-            async with get_db_session() as session:
-                meeting_repo = MeetingRepository(session)
-                meeting_service = MeetingService(meeting_repo)
+            with stage("db_create_meeting"):
+                async with get_db_session() as session:
+                    meeting_repo = MeetingRepository(session)
+                    meeting_service = MeetingService(meeting_repo)
 
-                # Создаем запись встречи в БД
-                created_meeting = await meeting_service.create_meeting(meeting_schema)
-                logger.info(f"Создана запись встречи: {created_meeting}")
+                    # Создаем запись встречи в БД
+                    created_meeting = await meeting_service.create_meeting(
+                        meeting_schema
+                    )
+                    logger.info(f"Создана запись встречи: {created_meeting}")
 
         except Exception as e:
             logger.error(f"Ошибка при создании записи встречи: {str(e)}")
@@ -71,7 +186,7 @@ async def process_document(
                 error=True,
                 error_message=f"Failed to create meeting record: {str(e)}",
                 model=model,
-                document_name=file.filename,
+                document_name=filename,
                 summary={},
             )
 
@@ -79,33 +194,32 @@ async def process_document(
         logger.info(
             f"Генерация промпта для модели {model} с текстом длиной {len(text)} символов"
         )
-        prompt_generator = PromptGenerator(text=text)
-        prompt = prompt_generator.run()
+        llm_element = build_task_extraction_element(text, on_task=on_task)
 
         # 3. Создаем Pipeline с LlmService и запускаем его
         pipeline = Pipeline(
             model=model,
             tools=[],
-            elements=[
-                LlmService(prompt=prompt),
-            ],
+            elements=[llm_element],
         )
 
-        raw_result = pipeline.run()
+        with stage("pipeline"):
+            raw_result = await pipeline.arun()
         if raw_result and created_meeting:
             logger.info("Pipeline успешно выполнен.")
-            async with get_db_session() as session:
-                meeting_repo = MeetingRepository(session)
-                meeting_service_update = MeetingService(meeting_repo)
-
-                await meeting_service_update.update_meeting(
-                    meeting_id=created_meeting.id,
-                    meeting_data={
-                        "status": "processed",
-                        "summary": raw_result.get("results", []),
-                    },
-                )
-                logger.info("Запись в БД успешно обновлена")
+            with stage("db_update_meeting"):
+                async with get_db_session() as session:
+                    meeting_repo = MeetingRepository(session)
+                    meeting_service_update = MeetingService(meeting_repo)
+
+                    await meeting_service_update.update_meeting(
+                        meeting_id=created_meeting.id,
+                        meeting_data={
+                            "status": "processed",
+                            "summary": raw_result.get("results", []),
+                        },
+                    )
+                    logger.info("Запись в БД успешно обновлена")
         else:
             logger.error("Pipeline вернул пустой результат.")
 
@@ -165,7 +279,7 @@ async def process_document(
             status="success",
             error=False,
             model=model,
-            document_name=file.filename,
+            document_name=filename,
             summary=summary_data,
         )
 
@@ -176,10 +290,6 @@ async def process_document(
             error=True,
             error_message=str(e),
             model=model,
-            document_name=file.filename,
+            document_name=filename,
             summary={"error": str(e)},
         )
-
-    finally:
-        # Удаляем временный файл
-        os.unlink(tmp_file_path)
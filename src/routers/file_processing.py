@@ -6,16 +6,23 @@ from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from src.database import AsyncSessionLocal, get_db_session
 from src.handlers.webhooks.handle_file_ready_event import handle_file_ready_event
 from src.handlers.webhooks.handle_file_upload import handle_file_upload
-from src.pipeline.pipeline import process_document
 from src.schemas.jira.jira_schemas import JiraTaskRequest
 from src.schemas.processing.processing_schemas import (
     AcceptResultRequestSchema,
     AcceptResultResponseSchema,
-    ProcessingResponseSchema,
+    ProcessingJobResponseSchema,
     RejectProcessingRequestSchema,
     RejectProcessingResponseSchema,
 )
 from src.services.jira_service import JiraService, get_jira_service
+from src.services.job_service import (
+    JobQueueFullError,
+    JobService,
+    JobStatus,
+    ProcessingJob,
+    get_job_service,
+)
+from src.utils.files.spool_upload import UploadTooLargeError
 
 processing_router = APIRouter(
     prefix="/file",
@@ -28,28 +35,55 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
-@processing_router.post("/process")
+@processing_router.post("/process", status_code=202)
 async def upload_and_process_document(
     file: UploadFile = File(...),
-) -> ProcessingResponseSchema:
-    """Endpoint to process a file."""
+    job_service: JobService = Depends(get_job_service),
+) -> ProcessingJobResponseSchema:
+    """Endpoint to enqueue a file for processing."""
     try:
-        pipeline_response = await process_document(file=file)
-        logger.info(f"Pipeline response: {pipeline_response}.")
+        job = await job_service.submit(file)
+    except UploadTooLargeError as e:
+        logger.error(f"Rejected file {file.filename}: {str(e)}")
+        raise HTTPException(status_code=413, detail=str(e))
+    except JobQueueFullError as e:
+        logger.error(f"Error enqueuing file: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e))
 
-        return pipeline_response
+    return build_job_response(job)
 
-    except Exception as e:
-        logger.error(f"Error processing file: {str(e)}")
-        raw_result = {
-            "status": "error",
-            "error": True,
-            "error_message": str(e),
-            "document_name": file.filename,
-            "summary": {},
-        }
-        validated_result = ProcessingResponseSchema.model_validate(raw_result)
-        return validated_result
+
+@processing_router.get("/jobs/{job_id}")
+async def get_processing_job(
+    job_id: str,
+    job_service: JobService = Depends(get_job_service),
+) -> ProcessingJobResponseSchema:
+    """Endpoint to get the status and result of a processing job."""
+    job = job_service.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    return build_job_response(job)
+
+
+def build_job_response(job: ProcessingJob) -> ProcessingJobResponseSchema:
+    """Convert a processing job to the response schema."""
+    raw_result = {
+        "job_id": job.id,
+        "status": job.status.value,
+        "error": job.status == JobStatus.FAILED,
+        "error_message": job.error_message,
+        "document_name": job.filename,
+        "status_url": processing_router.url_path_for(
+            "get_processing_job", job_id=job.id
+        ),
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "tasks": job.tasks,
+        "result": job.result,
+    }
+    return ProcessingJobResponseSchema.model_validate(raw_result)
 
 
 @processing_router.post("/reject")
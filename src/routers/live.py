@@ -0,0 +1,75 @@
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from src.services.live_meeting_service import LiveMeetingLimitError, LiveMeetingSession
+from src.utils.files.audio.decode_audio_ffmpeg import PCM_FRAME_RATE
+
+live_router = APIRouter(
+    prefix="/live",
+    tags=["Live Meeting"],
+)
+
+logger = logging.getLogger(__name__)
+
+
+@live_router.websocket("/meeting")
+async def live_meeting(
+    websocket: WebSocket,
+    sample_rate: int = PCM_FRAME_RATE,
+    model: str = "yandex-gpt",
+):
+    """Live meeting transcription with rolling draft task extraction.
+
+    The client sends binary frames of PCM s16le mono audio at sample_rate and
+    a text frame {"type": "end"} when the meeting is over. The server sends
+    {"type": "transcript"} for each recognized phrase, {"type": "tasks"} with
+    draft tasks periodically and once more with "final": true before closing.
+    """
+    await websocket.accept()
+    session = LiveMeetingSession(sample_rate=sample_rate, model=model)
+    await session.start()
+    sender = asyncio.create_task(_send_events(websocket, session))
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            if message.get("bytes"):
+                try:
+                    await session.feed(message["bytes"])
+                except LiveMeetingLimitError as e:
+                    await session.events.put({"type": "error", "message": str(e)})
+                    break
+            elif message.get("text") and _is_end(message["text"]):
+                break
+
+        await session.finish()
+        await sender
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info("Клиент живой встречи отключился")
+    finally:
+        # При любом выходе поток распознавания и извлечение задач завершаются
+        await session.close()
+        sender.cancel()
+
+
+async def _send_events(websocket: WebSocket, session: LiveMeetingSession) -> None:
+    while True:
+        event = await session.events.get()
+        if event is None:
+            return
+        await websocket.send_json(event)
+
+
+def _is_end(text: str) -> bool:
+    try:
+        return json.loads(text).get("type") == "end"
+    except (json.JSONDecodeError, AttributeError):
+        return False
@@ -7,7 +7,9 @@ from src.schemas.debug.utils_schemas import (
     JiraInfoResponseSchema,
 )
 from src.services.jira_service import JiraService, get_jira_service
+from src.services.llm_service import get_llm_cache
 from src.settings.config import settings
+from src.utils.metrics.timing_registry import get_timing_registry
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -27,6 +29,22 @@ def list_endpoints(request: Request):
     return url_list
 
 
+@utils_router.get("/llm_cache_stats/")
+def llm_cache_stats() -> dict:
+    """
+    Статистика кэша ответов модели
+    """
+    return get_llm_cache().stats()
+
+
+@utils_router.get("/timings/")
+def timings() -> dict:
+    """
+    Замеры этапов обработки документов: агрегаты по этапам и последние документы
+    """
+    return get_timing_registry().stats()
+
+
 @utils_router.get("/debug_jira_info/")
 async def debug_jira_info() -> JiraInfoResponseSchema:
     """
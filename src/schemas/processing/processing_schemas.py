@@ -1,3 +1,4 @@
+import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -11,6 +12,23 @@ class ProcessingResponseSchema(BaseModel):
     model: str = "default_model"
     document_name: str
     summary: dict[str, Any] = Field(default_factory=dict)
+    timings: dict[str, Any] | None = None
+
+
+class ProcessingJobResponseSchema(BaseModel):
+    """Schema for the status of a background processing job."""
+
+    job_id: str
+    status: str
+    error: bool = False
+    error_message: str | None = None
+    document_name: str
+    status_url: str
+    created_at: datetime.datetime
+    started_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+    tasks: list[dict[str, Any]] = Field(default_factory=list)
+    result: ProcessingResponseSchema | None = None
 
 
 class RejectProcessingResponseSchema(BaseModel):
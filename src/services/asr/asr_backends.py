@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+from src.services.asr.base import AsrBackend
+from src.settings.config import settings
+
+
+def create_asr_backend(name: str) -> AsrBackend:
+    """Создание бэкенда распознавания речи по имени."""
+    match name:
+        case "google":
+            from src.services.asr.google_backend import GoogleAsrBackend
+
+            return GoogleAsrBackend()
+        case "vosk":
+            from src.services.asr.vosk_backend import VoskAsrBackend
+
+            return VoskAsrBackend()
+        case "fake":
+            from src.services.asr.fake_backend import FakeAsrBackend
+
+            return FakeAsrBackend()
+        case _:
+            raise ValueError(f"Неизвестный ASR бэкенд: {name}")
+
+
+@lru_cache(maxsize=1)
+def get_asr_backend() -> AsrBackend:
+    """Бэкенд из settings.asr_backend, один на процесс."""
+    return create_asr_backend(settings.asr_backend)
@@ -0,0 +1,49 @@
+from collections.abc import Iterable, Iterator
+
+
+class AsrBackend:
+    """Интерфейс распознавания речи.
+
+    Аудио передается как PCM s16le mono с частотой sample_rate. transcribe
+    распознает фрагмент целиком, transcribe_stream принимает PCM блоками и
+    выдает текст по мере распознавания фраз.
+    """
+
+    name: str = "base"
+
+    @property
+    def cache_id(self) -> str:
+        """Идентификатор бэкенда и его настроек для ключей кэша расшифровок."""
+        return self.name
+
+    def transcribe(
+        self, pcm: bytes, sample_rate: int, energy_threshold: float | None = None
+    ) -> str:
+        """Распознавание фрагмента. Если речи нет, возвращается пустая строка.
+
+        energy_threshold - порог энергии речи, откалиброванный по всей записи
+        (noise_floor_energy_threshold); бэкенды с платным API обрезают по нему
+        тишину, остальные могут его не использовать.
+        """
+        raise NotImplementedError(
+            "Метод transcribe должен быть реализован в подклассе."
+        )
+
+    def transcribe_stream(
+        self, blocks: Iterable[bytes], sample_rate: int
+    ) -> Iterator[str]:
+        """Потоковое распознавание.
+
+        По умолчанию поток делится на части по паузам в речи (AudioChunkStream),
+        и каждая часть распознается transcribe, как только она закончилась.
+        Бэкенды с настоящим потоковым режимом переопределяют метод.
+        """
+        # numpy и pydub загружаются при первом распознавании, а не при импорте
+        from src.utils.files.audio.audio_chunk_stream import AudioChunkStream
+
+        for chunk in AudioChunkStream(blocks, frame_rate=sample_rate):
+            text = self.transcribe(
+                chunk.audio.raw_data, sample_rate, chunk.energy_threshold
+            )
+            if text:
+                yield text
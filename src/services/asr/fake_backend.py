@@ -0,0 +1,40 @@
+import time
+
+import numpy as np
+
+from src.services.asr.base import AsrBackend
+from src.settings.config import settings
+
+
+class FakeAsrBackend(AsrBackend):
+    """Детерминированный бэкенд для тестов и бенчмарков.
+
+    Вместо распознавания описывает фрагмент: длительность и уровень сигнала.
+    Тишина дает пустую строку. delay_seconds имитирует время распознавания.
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        delay_seconds: float = settings.asr_fake_delay_seconds,
+        silence_threshold_db: float = settings.audio_silence_threshold_db,
+    ):
+        self.delay_seconds = delay_seconds
+        self.silence_threshold_db = silence_threshold_db
+
+    def transcribe(
+        self, pcm: bytes, sample_rate: int, energy_threshold: float | None = None
+    ) -> str:
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+
+        samples = np.frombuffer(pcm[: len(pcm) - len(pcm) % 2], dtype="<i2")
+        if not len(samples):
+            return ""
+
+        rms = np.sqrt(np.mean(np.square(samples.astype(np.float64))))
+        level = 20 * np.log10(max(rms / 32768, 1e-10))
+        if level < self.silence_threshold_db:
+            return ""
+        return f"речь {len(samples) / sample_rate:.2f} сек {level:.0f} dB"
@@ -0,0 +1,57 @@
+import speech_recognition as sr
+from pydub import AudioSegment
+
+from src.services.asr.base import AsrBackend
+from src.settings.config import settings
+from src.utils.files.audio.trim_to_speech import trim_to_speech
+from src.utils.rate_limit.token_bucket import TokenBucket
+
+# Общий для процесса лимит запросов к API распознавания речи
+speech_rate_limiter = TokenBucket(
+    rate=settings.speech_rate_limit, capacity=settings.speech_rate_burst
+)
+
+
+class GoogleAsrBackend(AsrBackend):
+    """Распознавание через Google Web Speech API (speech_recognition).
+
+    Каждый фрагмент - сетевой запрос, частота запросов ограничивается
+    speech_rate_limiter. Ошибки API (sr.RequestError) пробрасываются, чтобы
+    фрагмент можно было повторить.
+    """
+
+    name = "google"
+
+    def __init__(self, language: str = settings.asr_language):
+        self.language = language
+
+    @property
+    def cache_id(self) -> str:
+        return f"{self.name}:{self.language}"
+
+    def transcribe(
+        self, pcm: bytes, sample_rate: int, energy_threshold: float | None = None
+    ) -> str:
+        """Распознавание фрагмента.
+
+        Если передан порог энергии записи, тишина по краям фрагмента
+        обрезается, а фрагмент без окон громче порога не отправляется в API.
+        """
+        if energy_threshold is not None:
+            segment = trim_to_speech(
+                AudioSegment(pcm, frame_rate=sample_rate, sample_width=2, channels=1),
+                energy_threshold,
+            )
+            if segment is None:
+                return ""
+            pcm = segment.raw_data
+
+        # Фрагмент передается целиком: порог энергии sr.Recognizer используется
+        # только listen и adjust_for_ambient_noise, recognize_google его не читает
+        audio = sr.AudioData(pcm, sample_rate, 2)
+
+        speech_rate_limiter.acquire()
+        try:
+            return sr.Recognizer().recognize_google(audio, language=self.language)
+        except sr.UnknownValueError:
+            return ""
@@ -0,0 +1,77 @@
+import logging
+import threading
+
+from src.services.asr.base import AsrBackend
+from src.settings.config import settings
+from src.utils.cache.disk_cache import DiskCache
+from src.utils.cache.make_cache_key import make_cache_key
+from src.utils.files.audio.audio_chunk_stream import AudioChunk
+from src.utils.files.audio.process_audio_chunck import process_audio_chunk
+
+logger = logging.getLogger(__name__)
+
+# Расшифровки частей на диске: переживают падение воркера и общие для процессов
+transcript_cache = DiskCache(
+    directory=settings.asr_cache_dir,
+    ttl_seconds=settings.asr_cache_ttl_seconds,
+    max_bytes=settings.asr_cache_max_bytes,
+)
+
+
+def get_transcript_cache() -> DiskCache:
+    """Получение глобального кэша расшифровок."""
+    return transcript_cache
+
+
+class CachedChunkTranscriber:
+    """Распознавание частей записи с кэшем по (файл, границы части, бэкенд).
+
+    Расшифровка сохраняется сразу после распознавания части, поэтому при
+    повторной обработке того же файла распознаются только недостающие части.
+    Вызывается из нескольких потоков transcribe_audio_chunks.
+    """
+
+    def __init__(
+        self,
+        content_hash: str,
+        backend: AsrBackend,
+        cache: DiskCache | None = None,
+    ):
+        self.content_hash = content_hash
+        self.backend = backend
+        self.cache = cache
+        self.cache_hits = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, chunk: AudioChunk, number: int, total: int | None) -> str:
+        if self.cache is None:
+            return process_audio_chunk(
+                chunk.audio, number, total, self.backend, chunk.energy_threshold
+            )
+
+        key = self.cache_key(chunk)
+        cached = self.cache.get(key)
+        if cached is not None:
+            with self._lock:
+                self.cache_hits += 1
+            return cached
+
+        text = process_audio_chunk(
+            chunk.audio, number, total, self.backend, chunk.energy_threshold
+        )
+        try:
+            self.cache.set(key, text)
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить расшифровку части: {str(e)}")
+        return text
+
+    def cache_key(self, chunk: AudioChunk) -> str:
+        return make_cache_key(
+            self.backend.cache_id,
+            self.content_hash,
+            {
+                "start_ms": chunk.start_ms,
+                "end_ms": chunk.end_ms,
+                "frame_rate": chunk.audio.frame_rate,
+            },
+        )
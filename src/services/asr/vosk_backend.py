@@ -0,0 +1,70 @@
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+from src.services.asr.base import AsrBackend
+from src.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Размер порции PCM, которую распознаватель получает за раз (0.25 сек при 16 kHz)
+VOSK_FEED_BYTES = 8000
+
+
+@lru_cache(maxsize=2)
+def _load_model(model_path: str):
+    try:
+        from vosk import Model, SetLogLevel
+    except ImportError as e:
+        raise RuntimeError(
+            "Для ASR_BACKEND=vosk установите пакет vosk и скачайте модель "
+            "(https://alphacephei.com/vosk/models)"
+        ) from e
+
+    SetLogLevel(-1)
+    logger.info(f"Загрузка модели Vosk из {model_path}")
+    return Model(model_path)
+
+
+class VoskAsrBackend(AsrBackend):
+    """Локальное распознавание на CPU моделью Vosk (Kaldi).
+
+    Работает без сети и лимитов внешнего сервиса. Модель загружается один
+    раз на процесс и используется всеми потоками.
+    """
+
+    name = "vosk"
+
+    def __init__(self, model_path: str = settings.vosk_model_path):
+        self.model_path = model_path
+        self.model = _load_model(model_path)
+
+    @property
+    def cache_id(self) -> str:
+        return f"{self.name}:{self.model_path}"
+
+    def transcribe(
+        self, pcm: bytes, sample_rate: int, energy_threshold: float | None = None
+    ) -> str:
+        return " ".join(self._recognize([pcm], sample_rate))
+
+    def transcribe_stream(
+        self, blocks: Iterable[bytes], sample_rate: int
+    ) -> Iterator[str]:
+        return self._recognize(blocks, sample_rate)
+
+    def _recognize(self, blocks: Iterable[bytes], sample_rate: int) -> Iterator[str]:
+        from vosk import KaldiRecognizer
+
+        recognizer = KaldiRecognizer(self.model, sample_rate)
+        for block in blocks:
+            for start in range(0, len(block), VOSK_FEED_BYTES):
+                if recognizer.AcceptWaveform(block[start : start + VOSK_FEED_BYTES]):
+                    text = json.loads(recognizer.Result()).get("text", "")
+                    if text:
+                        yield text
+
+        text = json.loads(recognizer.FinalResult()).get("text", "")
+        if text:
+            yield text
@@ -0,0 +1,103 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from src.models.parsed_task import ParsedTask
+from src.pipeline.elements.base import Element, Pipeline
+from src.pipeline.elements.cached import CachedElement
+from src.schemas.llm.llm_service_schemas import LLMServiceResponseSchema
+from src.services.llm_service import LlmService
+from src.settings.config import settings
+from src.utils.cache.make_cache_key import make_cache_key
+from src.utils.cache.tiered_cache import TieredCache
+from src.utils.jira.merge_task_blocks import merge_task_blocks
+from src.utils.jira.task_stream_parser import TaskStreamParser
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkedLlmService(Element):
+    """Извлечение задач из длинного текста по схеме map-reduce.
+
+    Каждый промпт (часть текста) обрабатывается отдельным LlmService, части
+    выполняются параллельно с ограничением concurrency. Затем ответы
+    объединяются: дубликаты удаляются, номера TASK-XXX перенумеровываются.
+    """
+
+    def __init__(
+        self,
+        prompts: list[str],
+        model="yandex-gpt",
+        concurrency: int = settings.llm_map_concurrency,
+        cache: TieredCache | None = None,
+        on_task: Callable[[ParsedTask], Awaitable[None]] | None = None,
+    ) -> None:
+        super().__init__(model=model, tools=[], prompt="", obj=None)
+        self.prompts = prompts
+        self.concurrency = concurrency
+        self.cache = cache
+        self.on_task = on_task
+
+    def build_elements(self) -> list[Element]:
+        """Элементы для обработки каждой части текста."""
+        elements = []
+        for prompt in self.prompts:
+            element = LlmService(prompt=prompt, model=self.model)
+            if self.cache is not None:
+                element = CachedElement(element, cache=self.cache)
+            elements.append(element)
+        return elements
+
+    def cache_key(self) -> str:
+        chunk_keys = [element.cache_key() for element in self.build_elements()]
+        return make_cache_key(self.model, "", {"chunks": chunk_keys})
+
+    def run(self) -> LLMServiceResponseSchema:
+        results = [element.run() for element in self.build_elements()]
+        return self._merge(results)
+
+    async def arun(self) -> LLMServiceResponseSchema:
+        logger.info(
+            f"Обработка {len(self.prompts)} частей текста, параллельно до {self.concurrency}"
+        )
+        # Части независимы друг от друга, конвейер выполняет их параллельно
+        map_pipeline = Pipeline(
+            model=self.model,
+            tools=[],
+            elements=self.build_elements(),
+            concurrency=self.concurrency,
+        )
+        response = self._merge((await map_pipeline.arun())["results"])
+
+        if self.on_task is not None and not response.error:
+            parser = TaskStreamParser()
+            for task in parser.feed(response.response_text) + parser.close():
+                await self.on_task(task)
+
+        return response
+
+    def _merge(self, results: list) -> LLMServiceResponseSchema:
+        results = [Pipeline._to_result(result) for result in results]
+        texts = [r["response_text"] for r in results if not r.get("error")]
+        errors = [r.get("error_message") for r in results if r.get("error")]
+
+        if errors:
+            logger.warning(f"Не удалось обработать {len(errors)} частей: {errors}")
+
+        if not texts:
+            return LLMServiceResponseSchema(
+                status="error",
+                error=True,
+                error_message=errors[0] if errors else "Нет частей для обработки",
+                response_text="",
+            )
+
+        return LLMServiceResponseSchema(
+            status="success",
+            response_text=merge_task_blocks(texts),
+            response_data={
+                "chunks": len(results),
+                "failed_chunks": len(errors),
+                "chunk_errors": errors,
+            },
+            model_name=self.model,
+        )
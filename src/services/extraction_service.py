@@ -0,0 +1,249 @@
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from src.settings.config import settings
+from src.utils.files.audio.probe_audio import probe_audio
+from src.utils.files.extractors.file_extractor import FileExtractor
+from src.utils.files.extractors.registry import FILE_EXTRACTORS, detect_file_extractor
+from src.utils.metrics.stage_timer import annotate_worker_usage, measure_call
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionTimeoutError(Exception):
+    """Извлечение текста не уложилось в отведенное время."""
+
+
+def _warm_worker() -> None:
+    """Инициализация процесса: плагины извлечения импортируются один раз заранее.
+
+    В процессе приложения плагины извлечения импортируются лениво, при первом
+    файле своего типа; процессы пула загружают их все сразу при старте.
+    """
+    import speech_recognition  # noqa: F401
+    from PIL import Image
+
+    from src.utils.files.image.tesseract_languages import tesseract_languages
+
+    for extractor in FILE_EXTRACTORS:
+        extractor.load()
+    Image.init()
+
+    try:
+        tesseract_languages()
+    except Exception as e:
+        logger.warning(f"Не удалось получить языки Tesseract: {str(e)}")
+
+
+def _ping() -> bool:
+    return True
+
+
+class ExtractionService:
+    """Пул процессов для CPU-тяжелого извлечения текста (OCR, PDF, DOCX, аудио).
+
+    Пул создается в lifespan приложения. Зависшую задачу нельзя отменить
+    внутри процесса, поэтому при таймауте или отмене процессы пула убиваются
+    и пул пересоздается; задачи, попавшие под перезапуск, повторяются один раз.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.extraction_workers,
+        timeout: float = settings.extraction_timeout,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def start(self) -> None:
+        """Запуск и прогрев процессов пула."""
+        if self._pool is not None or self.workers == 0:
+            return
+
+        self._pool = self._create_pool()
+        loop = asyncio.get_running_loop()
+        # Задачи отправляются разом, поэтому пул поднимает все процессы сразу
+        await asyncio.gather(
+            *(loop.run_in_executor(self._pool, _ping) for _ in range(self.workers))
+        )
+        logger.debug(f"Запущено {self.workers} процессов извлечения текста")
+
+    async def stop(self) -> None:
+        """Остановка пула с завершением процессов."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            self._kill(pool)
+            logger.debug("Процессы извлечения текста остановлены")
+
+    async def extract(
+        self,
+        file_path: str,
+        content_type: str,
+        content_hash: str | None = None,
+        extractor: FileExtractor | None = None,
+    ) -> str:
+        """Извлечение текста из файла в отдельном процессе.
+
+        Плагин извлечения выбирается по сигнатуре файла до отправки в пул, файл
+        неподдерживаемого типа сразу завершается UnsupportedFileTypeError.
+        extractor - плагин, уже выбранный вызывающим (detect_file_extractor).
+        Таймаут распознавания аудио растет с длительностью записи
+        (audio_timeout).
+        """
+        if extractor is None:
+            extractor = detect_file_extractor(file_path, content_type)
+        if extractor.name == "pdf" and self.workers > 1:
+            return await self.extract_pdf(file_path)
+
+        timeout = self.timeout
+        if extractor.name == "audio":
+            timeout = await self.audio_timeout(file_path)
+        return await self.run(
+            extractor.extract, file_path, content_hash, timeout=timeout
+        )
+
+    async def audio_timeout(self, file_path: str) -> float:
+        """Таймаут распознавания записи, растущий с ее длительностью.
+
+        К timeout добавляется settings.extraction_audio_timeout_ratio секунд на
+        каждую секунду записи; длительность читается из заголовков
+        (probe_audio). Если файл не читается как аудио, берется обычный
+        таймаут: ошибку сообщит само извлечение.
+        """
+        try:
+            probe = await asyncio.to_thread(probe_audio, file_path)
+        except Exception as e:
+            logger.debug(f"Длительность аудио не определена: {str(e)}")
+            return self.timeout
+
+        ratio = settings.extraction_audio_timeout_ratio
+        duration = min(probe.duration_seconds, settings.audio_max_duration_seconds)
+        return self.timeout + max(duration, 0.0) * ratio
+
+    async def extract_pdf(self, file_path: str) -> str:
+        """Извлечение текста PDF диапазонами страниц параллельно во всех процессах.
+
+        Каждый процесс открывает файл своим PdfReader и разбирает только свой
+        диапазон; страницы после settings.pdf_max_pages не читаются. Страницы
+        без текстового слоя (сканы) затем распознаются OCR, каждая отдельной
+        задачей пула.
+        """
+        # pypdf импортируется при первом PDF, а не при старте приложения
+        from src.utils.files.text.extract_pdf_text import (
+            extract_pdf_pages,
+            join_pdf_pages,
+            ocr_pdf_page,
+            pdf_page_count,
+            pdf_page_ranges,
+        )
+
+        page_count = await self.run(pdf_page_count, file_path)
+        if settings.pdf_max_pages:
+            page_count = min(page_count, settings.pdf_max_pages)
+
+        ranges = pdf_page_ranges(
+            page_count, self.workers, settings.pdf_min_pages_per_task
+        )
+        pieces = await asyncio.gather(
+            *(
+                self.run(extract_pdf_pages, file_path, pages.start, pages.stop)
+                for pages in ranges
+            )
+        )
+        pages = [page for piece in pieces for page in piece]
+
+        scanned = [number for number, text in enumerate(pages) if text is None]
+        if scanned:
+            logger.debug(f"Страниц PDF без текстового слоя: {len(scanned)}")
+            texts = await asyncio.gather(
+                *(self.run(ocr_pdf_page, file_path, number) for number in scanned)
+            )
+            for number, text in zip(scanned, texts):
+                pages[number] = text
+
+        return join_pdf_pages(pages)
+
+    async def run(
+        self, func: Callable[..., Any], *args: Any, timeout: float | None = None
+    ) -> Any:
+        """Выполнение функции в пуле процессов с таймаутом.
+
+        timeout - время на вызов в секундах, по умолчанию self.timeout.
+
+        CPU время и пиковая память вызова замеряются в процессе пула и
+        добавляются к текущему этапу (worker_cpu_seconds,
+        worker_peak_memory_bytes). Вне приложения (скрипты, тесты) пул не
+        запущен, и функция выполняется в отдельном потоке; ее работа тогда
+        входит в замеры самого этапа.
+        """
+        if timeout is None:
+            timeout = self.timeout
+        if self._pool is None:
+            return await asyncio.wait_for(
+                asyncio.to_thread(func, *args), timeout=timeout
+            )
+
+        for attempt in range(2):
+            pool = self._pool
+            try:
+                result, usage = await asyncio.wait_for(
+                    asyncio.get_running_loop().run_in_executor(
+                        pool, measure_call, func, *args
+                    ),
+                    timeout=timeout,
+                )
+                annotate_worker_usage(usage)
+                return result
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Извлечение текста превысило {timeout} сек, перезапуск пула"
+                )
+                self._restart(pool)
+                raise ExtractionTimeoutError(
+                    f"Извлечение текста не завершилось за {timeout} сек"
+                )
+            except asyncio.CancelledError:
+                self._restart(pool)
+                raise
+            except BrokenProcessPool:
+                # Пул перезапущен из-за чужой задачи или процесс упал
+                self._restart(pool)
+                if attempt == 1:
+                    raise
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        # spawn: дочерние процессы не наследуют потоки и event loop приложения
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+        )
+
+    def _restart(self, pool: ProcessPoolExecutor) -> None:
+        if self._pool is not pool:
+            return
+
+        self._kill(pool)
+        self._pool = self._create_pool()
+
+    @staticmethod
+    def _kill(pool: ProcessPoolExecutor) -> None:
+        processes = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.kill()
+
+
+extraction_service = ExtractionService()
+
+
+def get_extraction_service() -> ExtractionService:
+    """Получение глобального экземпляра ExtractionService."""
+    return extraction_service
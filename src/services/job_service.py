@@ -0,0 +1,203 @@
+import asyncio
+import dataclasses
+import datetime
+import logging
+import os
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from fastapi import UploadFile
+
+from src.models.parsed_task import ParsedTask
+from src.pipeline.pipeline import process_stored_document
+from src.schemas.processing.processing_schemas import ProcessingResponseSchema
+from src.settings.config import settings
+from src.utils.files.spool_upload import spool_upload
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class JobQueueFullError(Exception):
+    """Очередь задач обработки переполнена."""
+
+
+@dataclass
+class ProcessingJob:
+    """Задача фоновой обработки загруженного документа."""
+
+    id: str
+    file_path: str
+    filename: str
+    content_type: str
+    size: int = 0
+    content_hash: str | None = None
+    status: JobStatus = JobStatus.QUEUED
+    result: ProcessingResponseSchema | None = None
+    tasks: list[dict[str, Any]] = field(default_factory=list)
+    error_message: str | None = None
+    created_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+    started_at: datetime.datetime | None = None
+    finished_at: datetime.datetime | None = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+class JobService:
+    """Очередь задач обработки документов с ограниченным пулом асинхронных воркеров."""
+
+    def __init__(
+        self,
+        workers: int = settings.job_workers,
+        queue_size: int = settings.job_queue_size,
+        retention_seconds: int = settings.job_retention_seconds,
+        jobs_dir: str = settings.jobs_dir,
+    ):
+        self.workers = workers
+        self.retention_seconds = retention_seconds
+        self.jobs_dir = jobs_dir
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.jobs: dict[str, ProcessingJob] = {}
+        # Места в очереди, занятые загрузками, которые еще сохраняются на диск
+        self._reserved_slots = 0
+        self._worker_tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Запуск воркеров."""
+        if self._worker_tasks:
+            return
+
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(n), name=f"processing-worker-{n}")
+            for n in range(self.workers)
+        ]
+        logger.debug(f"Запущено {self.workers} воркеров обработки")
+
+    async def stop(self) -> None:
+        """Остановка воркеров. Незавершенные задачи остаются в очереди."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.debug("Воркеры обработки остановлены")
+
+    async def submit(self, file: UploadFile) -> ProcessingJob:
+        """Сохраняет загрузку на диск и ставит задачу в очередь.
+
+        Место в очереди резервируется до сохранения файла, поэтому параллельные
+        загрузки не превышают размер очереди: лишние сразу получают
+        JobQueueFullError. Если файл больше settings.max_file_size,
+        выбрасывается UploadTooLargeError.
+        """
+        self._prune()
+        self._reserve_slot()
+
+        try:
+            job_id = uuid.uuid4().hex
+            os.makedirs(self.jobs_dir, exist_ok=True)
+            file_ext = os.path.splitext(file.filename or "")[1].lower()
+            file_path = os.path.join(self.jobs_dir, f"{job_id}{file_ext}")
+
+            upload = await spool_upload(
+                file, file_path, max_size=settings.max_file_size
+            )
+        finally:
+            self._reserved_slots -= 1
+
+        job = ProcessingJob(
+            id=job_id,
+            file_path=file_path,
+            filename=file.filename,
+            content_type=file.content_type,
+            size=upload.size,
+            content_hash=upload.sha256,
+        )
+        # Зарезервированное место освобождено без ожидания, очередь не заполнена
+        self.queue.put_nowait(job_id)
+        self.jobs[job_id] = job
+        logger.info(f"Задача {job_id} поставлена в очередь ({file.filename})")
+        return job
+
+    def get(self, job_id: str) -> ProcessingJob | None:
+        """Получение задачи по ID."""
+        self._prune()
+        return self.jobs.get(job_id)
+
+    async def _worker(self, number: int) -> None:
+        while True:
+            job_id = await self.queue.get()
+            try:
+                job = self.jobs.get(job_id)
+                if job:
+                    await self._run_job(job)
+            finally:
+                self.queue.task_done()
+
+    async def _run_job(self, job: ProcessingJob) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.datetime.now()
+        logger.info(f"Обработка задачи {job.id}")
+
+        async def publish_task(task: ParsedTask) -> None:
+            job.tasks.append(dataclasses.asdict(task))
+
+        try:
+            result = await process_stored_document(
+                file_path=job.file_path,
+                filename=job.filename,
+                content_type=job.content_type,
+                on_task=publish_task,
+                content_hash=job.content_hash,
+            )
+            job.result = result
+            job.error_message = result.error_message
+            job.status = JobStatus.FAILED if result.error else JobStatus.COMPLETED
+        except Exception as e:
+            logger.error(f"Ошибка при обработке задачи {job.id}: {str(e)}")
+            job.error_message = str(e)
+            job.status = JobStatus.FAILED
+        finally:
+            job.finished_at = datetime.datetime.now()
+            if os.path.exists(job.file_path):
+                os.remove(job.file_path)
+            logger.info(f"Задача {job.id} завершена со статусом {job.status.value}")
+
+    def _reserve_slot(self) -> None:
+        maxsize = self.queue.maxsize
+        if self.queue.full() or (
+            maxsize > 0 and self.queue.qsize() + self._reserved_slots >= maxsize
+        ):
+            raise JobQueueFullError("Очередь обработки переполнена, повторите позже")
+        self._reserved_slots += 1
+
+    def _prune(self) -> None:
+        """Удаление завершенных задач старше срока хранения."""
+        threshold = datetime.datetime.now() - datetime.timedelta(
+            seconds=self.retention_seconds
+        )
+        expired = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.is_finished and job.finished_at < threshold
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+
+job_service = JobService()
+
+
+def get_job_service() -> JobService:
+    """Получение глобального экземпляра JobService."""
+    return job_service
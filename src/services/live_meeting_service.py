@@ -0,0 +1,185 @@
+import asyncio
+import dataclasses
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from src.models.parsed_task import ParsedTask
+from src.pipeline.elements.base import Pipeline
+from src.pipeline.pipeline import build_task_extraction_element
+from src.services.asr.asr_backends import get_asr_backend
+from src.services.asr.base import AsrBackend
+from src.settings.config import settings
+from src.utils.files.audio.decode_audio_ffmpeg import PCM_FRAME_RATE, PCM_SAMPLE_WIDTH
+from src.utils.jira.task_stream_parser import TaskStreamParser
+
+logger = logging.getLogger(__name__)
+
+
+class LiveMeetingLimitError(Exception):
+    """Живая встреча длиннее settings.audio_max_duration_seconds."""
+
+
+class LiveMeetingSession:
+    """Живая расшифровка встречи с периодическим извлечением черновых задач.
+
+    Аудио (PCM s16le mono с частотой sample_rate) подается кадрами через feed
+    и распознается потоковым режимом бэкенда (AsrBackend.transcribe_stream) в
+    собственном потоке сессии: распознавание занимает поток на всю встречу,
+    и общий пул asyncio.to_thread оставлен обработке документов. Раз в extract_interval секунд, если
+    расшифровка пополнилась, задачи извлекаются заново из всей расшифровки.
+    Ответы модели по частям текста кэшируются, поэтому повторно
+    обрабатывается в основном новая часть. События для клиента (фразы
+    расшифровки и черновые задачи) публикуются в очередь events, None в
+    очереди - конец сессии.
+    """
+
+    def __init__(
+        self,
+        backend: AsrBackend | None = None,
+        sample_rate: int = PCM_FRAME_RATE,
+        model: str = "yandex-gpt",
+        extract_interval: float = settings.live_extract_interval_seconds,
+        queue_blocks: int = settings.live_audio_queue_blocks,
+    ):
+        self.backend = backend or get_asr_backend()
+        self.sample_rate = sample_rate
+        self.model = model
+        self.extract_interval = extract_interval
+        self.transcript: list[str] = []
+        self.tasks: list[ParsedTask] = []
+        self.events: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self.bytes_received = 0
+        self._audio: queue.Queue[bytes | None] = queue.Queue(maxsize=queue_blocks)
+        self._extract_lock = asyncio.Lock()
+        self._extracted_phrases = 0
+        # Поток распознавания и поток для ожидания места в очереди кадров
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="live-meeting"
+        )
+        self._recognizer: asyncio.Future | None = None
+        self._ticker: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.bytes_received / (self.sample_rate * PCM_SAMPLE_WIDTH)
+
+    async def start(self) -> None:
+        """Запуск распознавания и периодического извлечения задач."""
+        loop = asyncio.get_running_loop()
+        self._recognizer = loop.run_in_executor(self._executor, self._recognize, loop)
+        self._ticker = asyncio.create_task(self._extract_periodically())
+
+    async def feed(self, pcm: bytes) -> None:
+        """Передача кадра аудио распознавателю.
+
+        Если распознаватель отстает и очередь кадров заполнена, ожидание идет
+        в потоке, не блокируя event loop. Выбрасывает LiveMeetingLimitError,
+        если встреча длиннее settings.audio_max_duration_seconds.
+        """
+        self.bytes_received += len(pcm)
+        if self.duration_seconds > settings.audio_max_duration_seconds:
+            raise LiveMeetingLimitError(
+                f"Встреча длиннее "
+                f"{settings.audio_max_duration_seconds / 60:.0f} мин, "
+                f"аудио больше не принимается"
+            )
+
+        try:
+            self._audio.put_nowait(pcm)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._audio.put, pcm
+            )
+
+    async def finish(self) -> list[ParsedTask]:
+        """Конец встречи: дораспознавание аудио и итоговое извлечение задач."""
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._audio.put, None
+        )
+        await self._recognizer
+        self._ticker.cancel()
+
+        await self._extract(final=True)
+        await self.events.put(None)
+        self._closed = True
+        self._executor.shutdown(wait=False)
+        return self.tasks
+
+    async def close(self) -> None:
+        """Прерывание сессии (клиент отключился, ошибка) без итогового извлечения.
+
+        После finish ничего не делает, поэтому вызывается в любом случае.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._ticker is not None:
+            self._ticker.cancel()
+
+        # Освобождаем место в очереди, чтобы поток распознавания получил конец
+        while True:
+            try:
+                self._audio.get_nowait()
+            except queue.Empty:
+                break
+        self._audio.put_nowait(None)
+        await self.events.put(None)
+        self._executor.shutdown(wait=False)
+
+    def _recognize(self, loop: asyncio.AbstractEventLoop) -> None:
+        blocks = iter(self._audio.get, None)
+        try:
+            for text in self.backend.transcribe_stream(blocks, self.sample_rate):
+                loop.call_soon_threadsafe(self._publish_text, text)
+        except Exception as e:
+            logger.error(f"Ошибка распознавания живой встречи: {str(e)}")
+            loop.call_soon_threadsafe(
+                self.events.put_nowait, {"type": "error", "message": str(e)}
+            )
+            # Дочитываем очередь, чтобы feed не ждал заполненную очередь вечно
+            for _ in blocks:
+                pass
+
+    def _publish_text(self, text: str) -> None:
+        self.transcript.append(text)
+        self.events.put_nowait({"type": "transcript", "text": text})
+
+    async def _extract_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.extract_interval)
+            if len(self.transcript) > self._extracted_phrases:
+                await self._extract()
+
+    async def _extract(self, final: bool = False) -> None:
+        async with self._extract_lock:
+            phrases = len(self.transcript)
+            if phrases and phrases > self._extracted_phrases:
+                # Фраза - абзац: части текста режутся по границам фраз, и при
+                # дописывании расшифровки меняется только последняя часть
+                self.tasks = await self._extract_tasks("\n\n".join(self.transcript))
+                self._extracted_phrases = phrases
+
+            await self.events.put(
+                {
+                    "type": "tasks",
+                    "final": final,
+                    "tasks": [dataclasses.asdict(task) for task in self.tasks],
+                    "transcript_phrases": phrases,
+                    "duration_seconds": round(self.duration_seconds, 1),
+                }
+            )
+
+    async def _extract_tasks(self, text: str) -> list[ParsedTask]:
+        element = build_task_extraction_element(text, model=self.model)
+        result = Pipeline._to_result(await element.arun())
+        if result.get("error"):
+            logger.warning(
+                f"Не удалось извлечь задачи живой встречи: {result.get('error_message')}"
+            )
+            return self.tasks
+
+        parser = TaskStreamParser()
+        return parser.feed(result["response_text"]) + parser.close()
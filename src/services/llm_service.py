@@ -1,52 +1,161 @@
+import json
 import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 
-import httpx as requests
+import httpx
 
+from src.models.parsed_task import ParsedTask
 from src.pipeline.elements.base import Element
 from src.schemas.llm.llm_service_schemas import LLMServiceResponseSchema
+from src.settings.config import settings
+from src.utils.cache.disk_cache import DiskCache
+from src.utils.cache.make_cache_key import make_cache_key
+from src.utils.cache.memory_cache import MemoryCache
+from src.utils.cache.tiered_cache import TieredCache
+from src.utils.jira.task_stream_parser import TaskStreamParser
+from src.utils.metrics.stage_timer import annotate_stage
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Статистика генерации из ответа Ollama (длительности в наносекундах)
+OLLAMA_STATS_FIELDS = (
+    "total_duration",
+    "load_duration",
+    "prompt_eval_count",
+    "prompt_eval_duration",
+    "eval_count",
+    "eval_duration",
+)
+
+# Общий HTTP клиент для асинхронных запросов, управляется lifespan приложения
+_http_client: httpx.AsyncClient | None = None
+
+# Кэш ответов модели по (model, prompt, options)
+llm_response_cache = TieredCache(
+    memory=MemoryCache(
+        max_entries=settings.llm_cache_memory_entries,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+    ),
+    disk=DiskCache(
+        directory=settings.llm_cache_dir,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        max_bytes=settings.llm_cache_max_bytes,
+    ),
+)
+
+
+def create_llm_client() -> httpx.AsyncClient:
+    """Создание HTTP клиента с пулом keep-alive соединений к LLM API."""
+    return httpx.AsyncClient(
+        timeout=settings.llm_timeout,
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+        ),
+        headers={"Content-Type": "application/json"},
+    )
+
+
+async def startup_llm_client() -> None:
+    """Инициализация общего HTTP клиента."""
+    global _http_client
+    if _http_client is None:
+        _http_client = create_llm_client()
+
+
+async def shutdown_llm_client() -> None:
+    """Закрытие общего HTTP клиента."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_llm_client() -> httpx.AsyncClient | None:
+    """Получение общего HTTP клиента, если он инициализирован."""
+    return _http_client
+
+
+def get_llm_cache() -> TieredCache:
+    """Получение глобального кэша ответов модели."""
+    return llm_response_cache
+
 
 class LlmService(Element):
     """Сервис для ламы."""
 
     def __init__(
-        self, prompt: str, model="yandex-gpt", base_url="http://localhost:11434"
+        self,
+        prompt: str,
+        model="yandex-gpt",
+        base_url=settings.llm_base_url,
+        on_task: Callable[[ParsedTask], Awaitable[None]] | None = None,
+        inputs: tuple[str, ...] = (),
+        outputs: tuple[str, ...] = (),
     ) -> None:
-        """Инициализация сервиса LLM."""
+        """Инициализация сервиса LLM.
+
+        Если задан on_task, arun читает ответ модели потоком и вызывает
+        on_task для каждой задачи сразу после того, как ее блок сгенерирован.
+        Если заданы inputs, prompt является шаблоном с полями {имя_входа},
+        в которые подставляются ответы предыдущих элементов конвейера.
+        """
 
         logger.debug(
             "Инициализация LLM сервиса с моделью %s и базовым URL %s", model, base_url
         )
-        super().__init__(model=model, tools=[], prompt="", obj=None)
+        super().__init__(
+            model=model, tools=[], prompt="", obj=None, inputs=inputs, outputs=outputs
+        )
         self.prompt = prompt
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
+        self.on_task = on_task
+        self.stream_text = ""
+        self.stream_data: dict = {}
+        self.stream_bytes = 0
+        self.request_bytes = 0
+        self.metrics: dict = {}
+
+    def build_payload(self, stream: bool = False) -> dict:
+        """Тело запроса к API model."""
+        return {
+            "model": self.model,
+            "prompt": self.resolve_prompt(),
+            "stream": stream,
+            "options": {
+                "temperature": 0.3,
+                "top_p": 0.9,
+                "num_predict": 2048,
+            },
+        }
+
+    def cache_key(self) -> str:
+        payload = self.build_payload()
+        return make_cache_key(payload["model"], payload["prompt"], payload["options"])
+
+    async def on_cache_hit(self, result: dict) -> None:
+        """Публикует задачи из закэшированного ответа так же, как при потоковой генерации."""
+        if self.on_task is None:
+            return
+
+        parser = TaskStreamParser()
+        for task in parser.feed(result.get("response_text", "")) + parser.close():
+            await self.on_task(task)
 
     def run(self) -> LLMServiceResponseSchema:
         """Вызов API model для получения ответа на запрос."""
         try:
             logger.info(f"Вызов модели {self.model}")
 
-            payload = {
-                "model": self.model,
-                "prompt": self.prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,
-                    "top_p": 0.9,
-                    "num_predict": 2048,
-                },
-            }
-
             logger.info(f"Отправка запроса к модели: {self.api_url}")
-            response = requests.post(
+            response = httpx.post(
                 self.api_url,
-                json=payload,
+                json=self.build_payload(),
                 headers={"Content-Type": "application/json"},
-                timeout=120,
+                timeout=settings.llm_timeout,
             )
 
             logger.debug("Запрос отправлен, ожидаем ответа...")
@@ -54,29 +163,159 @@ class LlmService(Element):
             logger.info("Ответ получен успешно.")
 
             response_data = response.json()
-            generated_text = response_data.get("response", "")
-
-            if generated_text and generated_text.strip():
-                cleaned_text = generated_text.strip()
-                logger.debug(f"Получен ответ длиной {len(cleaned_text)} символов.")
-                logger.debug("Ответ успешно обработан.")
-                return LLMServiceResponseSchema(
-                    status="success",
-                    response_text=cleaned_text,
-                    response_data=response_data,
-                    model_name=self.model,
-                )
+            self._record_metrics(
+                len(response.request.content), len(response.content), response_data
+            )
+            return self._build_response(response_data)
+
+        except Exception as e:
+            logger.error(f"Ошибка при вызове API model: {str(e)}")
+            return LLMServiceResponseSchema(
+                status="error", error=True, error_message=str(e), response_text=""
+            )
+
+    async def arun(self) -> LLMServiceResponseSchema:
+        """Асинхронный вызов API model через общий пул соединений."""
+        if self.on_task is not None:
+            return await self._arun_streaming()
+
+        try:
+            logger.info(f"Асинхронный вызов модели {self.model}: {self.api_url}")
+
+            client = get_llm_client()
+            if client is not None:
+                response = await client.post(self.api_url, json=self.build_payload())
             else:
-                logger.error("Модель вернула пустой ответ.")
-                return LLMServiceResponseSchema(
-                    status="error",
-                    error=True,
-                    error_message="Модель вернула пустой ответ. Проверьте настройки модели и запрос.",
-                    response_text="",
-                )
+                # Вне приложения (скрипты, тесты) общий клиент не инициализирован
+                async with create_llm_client() as client:
+                    response = await client.post(
+                        self.api_url, json=self.build_payload()
+                    )
+
+            response.raise_for_status()
+            logger.info("Ответ получен успешно.")
+
+            response_data = response.json()
+            self._record_metrics(
+                len(response.request.content), len(response.content), response_data
+            )
+            return self._build_response(response_data)
 
         except Exception as e:
             logger.error(f"Ошибка при вызове API model: {str(e)}")
             return LLMServiceResponseSchema(
                 status="error", error=True, error_message=str(e), response_text=""
             )
+
+    async def astream(self) -> AsyncIterator[str]:
+        """Потоковый вызов API model, возвращает фрагменты текста по мере генерации.
+
+        Ollama отдает NDJSON: по одному JSON объекту на строку, последний
+        объект содержит done=true и статистику генерации.
+        """
+        self.stream_data = {}
+        self.stream_bytes = 0
+        client = get_llm_client()
+        if client is None:
+            async with create_llm_client() as client:
+                async for fragment in self._astream(client):
+                    yield fragment
+        else:
+            async for fragment in self._astream(client):
+                yield fragment
+
+    async def _astream(self, client: httpx.AsyncClient) -> AsyncIterator[str]:
+        logger.info(f"Потоковый вызов модели {self.model}: {self.api_url}")
+        async with client.stream(
+            "POST", self.api_url, json=self.build_payload(stream=True)
+        ) as response:
+            response.raise_for_status()
+            self.request_bytes = len(response.request.content)
+            async for line in response.aiter_lines():
+                self.stream_bytes += len(line.encode()) + 1
+                if not line.strip():
+                    continue
+
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(chunk["error"])
+
+                fragment = chunk.get("response", "")
+                if fragment:
+                    yield fragment
+
+                if chunk.get("done"):
+                    self.stream_data = chunk
+                    break
+
+    async def astream_tasks(self) -> AsyncIterator[ParsedTask]:
+        """Потоковая генерация с выдачей задач по мере закрытия блоков ### TASK-XXX:."""
+        parser = TaskStreamParser()
+        fragments = []
+
+        async for fragment in self.astream():
+            fragments.append(fragment)
+            for task in parser.feed(fragment):
+                yield task
+
+        self.stream_text = "".join(fragments)
+        for task in parser.close():
+            yield task
+
+    async def _arun_streaming(self) -> LLMServiceResponseSchema:
+        try:
+            async for task in self.astream_tasks():
+                await self.on_task(task)
+
+            logger.info("Потоковый ответ получен успешно.")
+            self._record_metrics(
+                self.request_bytes, self.stream_bytes, self.stream_data
+            )
+            return self._build_response(
+                {**self.stream_data, "response": self.stream_text}
+            )
+
+        except Exception as e:
+            logger.error(f"Ошибка при потоковом вызове API model: {str(e)}")
+            return LLMServiceResponseSchema(
+                status="error", error=True, error_message=str(e), response_text=""
+            )
+
+    def _record_metrics(
+        self, bytes_out: int, bytes_in: int, response_data: dict
+    ) -> None:
+        """Сохраняет объем запроса и ответа и статистику генерации Ollama."""
+        self.metrics = {
+            "model": self.model,
+            "bytes_out": bytes_out,
+            "bytes_in": bytes_in,
+            **{
+                name: response_data[name]
+                for name in OLLAMA_STATS_FIELDS
+                if name in response_data
+            },
+        }
+        annotate_stage(**self.metrics)
+
+    def _build_response(self, response_data: dict) -> LLMServiceResponseSchema:
+        """Преобразование ответа API model в схему ответа сервиса."""
+        generated_text = response_data.get("response", "")
+
+        if generated_text and generated_text.strip():
+            cleaned_text = generated_text.strip()
+            logger.debug(f"Получен ответ длиной {len(cleaned_text)} символов.")
+            logger.debug("Ответ успешно обработан.")
+            return LLMServiceResponseSchema(
+                status="success",
+                response_text=cleaned_text,
+                response_data=response_data,
+                model_name=self.model,
+            )
+        else:
+            logger.error("Модель вернула пустой ответ.")
+            return LLMServiceResponseSchema(
+                status="error",
+                error=True,
+                error_message="Модель вернула пустой ответ. Проверьте настройки модели и запрос.",
+                response_text="",
+            )
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from dotenv import load_dotenv
 from pydantic import ConfigDict, Field, model_validator
@@ -37,13 +38,213 @@ class Settings(BaseSettings):
     redoc_url: str = Field(default="/redoc", description="ReDoc URL")
 
     # File Upload
+    # Запись встречи на audio_max_duration_seconds (4 ч) занимает сотни МБ:
+    # ~230 МБ MP3 128 kbps, ~460 МБ WAV 16 kHz mono
     max_file_size: int = Field(
-        default=10485760, description="Max file size in bytes (10MB)"
+        default=1024 * 1024 * 1024,
+        description="Max upload size in bytes (1 GiB, fits a 4 h meeting recording)",
     )
     upload_dir: str = Field(
         default="./backend/static/images", description="Upload directory"
     )
 
+    # Processing jobs
+    jobs_dir: str = Field(
+        default="./backend/jobs", description="Directory for uploaded job files"
+    )
+    job_workers: int = Field(
+        default=2, ge=1, description="Number of concurrent processing workers"
+    )
+    job_queue_size: int = Field(
+        default=100, ge=1, description="Max number of jobs waiting in the queue"
+    )
+    job_retention_seconds: int = Field(
+        default=3600, description="How long finished jobs are kept for status polling"
+    )
+
+    # Text extraction
+    extraction_workers: int = Field(
+        default=2,
+        ge=0,
+        description="Text extraction worker processes (0 - run in a thread)",
+    )
+    extraction_timeout: float = Field(
+        default=900.0, description="Max time for text extraction of one file (s)"
+    )
+    extraction_audio_timeout_ratio: float = Field(
+        default=1.0,
+        ge=0,
+        description="Extra extraction time per second of probed audio duration (s)",
+    )
+
+    pdf_max_pages: int = Field(
+        default=0, ge=0, description="Max PDF pages to extract text from (0 - all)"
+    )
+    pdf_min_text_chars: int = Field(
+        default=20,
+        ge=0,
+        description="Min non-space characters for a PDF page text layer to be used",
+    )
+    pdf_min_pages_per_task: int = Field(
+        default=16,
+        ge=1,
+        description="Min PDF pages per parallel extraction task",
+    )
+
+    # OCR
+    ocr_target_dpi: int = Field(
+        default=300, ge=1, description="Images above this DPI are downscaled for OCR"
+    )
+    ocr_max_pixels: int = Field(
+        default=12_000_000, ge=1, description="Max image area passed to OCR (px)"
+    )
+    ocr_binarize: bool = Field(
+        default=True, description="Binarize images (Otsu threshold) before OCR"
+    )
+    ocr_tile_height: int = Field(
+        default=1200, ge=100, description="Max band height for parallel OCR (px)"
+    )
+    ocr_workers: int = Field(
+        default=4, ge=1, description="Image bands recognized concurrently"
+    )
+
+    # Audio chunking
+    ffmpeg_binary: str = Field(
+        default="ffmpeg", description="ffmpeg executable used to decode audio"
+    )
+    ffprobe_binary: str = Field(
+        default="ffprobe", description="ffprobe executable used to read audio headers"
+    )
+    audio_max_duration_seconds: float = Field(
+        default=4 * 3600, description="Max duration of an audio recording (s)"
+    )
+    audio_chunk_max_seconds: float = Field(
+        default=50.0, description="Max audio chunk duration sent to the recognizer (s)"
+    )
+    audio_chunk_min_seconds: float = Field(
+        default=15.0,
+        description="Min audio chunk duration before cutting at a pause (s)",
+    )
+    audio_silence_threshold_db: float = Field(
+        default=-40.0,
+        description="Window RMS level treated as silence (dB below the recording peak)",
+    )
+    audio_silence_window_ms: int = Field(
+        default=30, ge=1, description="RMS window for silence detection (ms)"
+    )
+
+    # Speech recognition
+    asr_backend: Literal["google", "vosk", "fake"] = Field(
+        default="google", description="Speech recognition backend"
+    )
+    asr_language: str = Field(default="ru-RU", description="Speech language")
+    vosk_model_path: str = Field(
+        default="./models/vosk-model-small-ru", description="Path to the Vosk model"
+    )
+    asr_noise_percentile: float = Field(
+        default=10.0, description="Window RMS percentile taken as the noise floor"
+    )
+    asr_energy_ratio: float = Field(
+        default=1.5, description="Speech energy threshold over the noise floor"
+    )
+    asr_trim_padding_ms: int = Field(
+        default=300,
+        description="Audio kept around speech when trimming quiet chunk edges",
+    )
+    asr_cache_enabled: bool = Field(
+        default=True, description="Cache transcripts of audio chunks"
+    )
+    asr_cache_dir: str = Field(
+        default="./backend/cache/asr", description="Directory for cached transcripts"
+    )
+    asr_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, description="Transcript cache TTL (s)"
+    )
+    asr_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024, description="Max size of the transcript cache"
+    )
+    asr_fake_delay_seconds: float = Field(
+        default=0.0, description="Simulated recognition time of the fake backend (s)"
+    )
+    speech_workers: int = Field(
+        default=4, ge=1, description="Audio chunks recognized concurrently"
+    )
+    speech_rate_limit: float = Field(
+        default=2.0, gt=0, description="Speech API requests per second per process"
+    )
+    speech_rate_burst: float = Field(
+        default=4.0, ge=1, description="Speech API request burst size"
+    )
+    speech_max_retries: int = Field(
+        default=2, ge=0, description="Retries for a failed audio chunk"
+    )
+    speech_retry_backoff: float = Field(
+        default=1.0, description="Initial delay before retrying an audio chunk (s)"
+    )
+
+    # Live meetings
+    live_extract_interval_seconds: float = Field(
+        default=60.0, description="How often draft tasks are extracted during a meeting"
+    )
+    live_audio_queue_blocks: int = Field(
+        default=256, ge=1, description="Audio frames buffered before the recognizer"
+    )
+
+    # LLM (Ollama)
+    llm_base_url: str = Field(
+        default="http://localhost:11434", description="Ollama API base URL"
+    )
+    llm_timeout: float = Field(default=120.0, description="LLM request timeout (s)")
+    llm_max_connections: int = Field(
+        default=10, ge=1, description="Max pooled connections to the LLM API"
+    )
+    llm_max_keepalive_connections: int = Field(
+        default=10, ge=0, description="Max idle keep-alive connections to the LLM API"
+    )
+    llm_keepalive_expiry: float = Field(
+        default=30.0, description="Idle keep-alive connection expiry (s)"
+    )
+
+    llm_chunk_max_tokens: int = Field(
+        default=2000,
+        description="Max estimated tokens of text per prompt before map-reduce splitting",
+    )
+    llm_map_concurrency: int = Field(
+        default=4, ge=1, description="Max concurrent LLM calls for text chunks"
+    )
+
+    # LLM response cache
+    llm_cache_enabled: bool = Field(default=True, description="Cache LLM responses")
+    llm_cache_dir: str = Field(
+        default="./backend/cache/llm", description="Directory for cached LLM responses"
+    )
+    llm_cache_memory_entries: int = Field(
+        default=128, description="Max LLM responses kept in the in-memory LRU"
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600, description="LLM response cache TTL (s)"
+    )
+    llm_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024, description="Max size of the on-disk LLM cache"
+    )
+
+    # Pipeline
+    pipeline_concurrency: int = Field(
+        default=4, ge=1, description="Max pipeline elements running concurrently"
+    )
+
+    # Stage timings
+    timings_history_size: int = Field(
+        default=100, ge=1, description="Number of processed documents kept in timings"
+    )
+    timings_trace_memory: bool = Field(
+        default=False,
+        description=(
+            "Trace Python allocations (tracemalloc) for per-stage peak memory;"
+            " unreliable when stages run concurrently"
+        ),
+    )
+
     # Logging
     log_level: str = Field(default="DEBUG", description="Logging level")
     log_format: str = Field(default="json", description="Log format (json/text)")
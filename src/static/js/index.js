@@ -13,6 +13,7 @@ let isProcessing = false;
 
 // Конфигурация
 const CONFIG = {
+    jobPollInterval: 2000,
     allowedTypes: [
         'text/plain', 'text/markdown', 'text/x-markdown',
         'application/pdf', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
@@ -370,6 +371,12 @@ const Actions = {
                 throw new Error('Не удалось обработать ответ сервера');
             }
 
+            // Сервер ставит файл в очередь и возвращает задачу обработки
+            if (result.job_id) {
+                console.log('Задача обработки:', result.job_id);
+                result = await Actions.waitForJob(result.status_url);
+            }
+
             console.log('=== PARSED RESPONSE ===');
             console.log('Full result:', result);
             console.log('Result keys:', Object.keys(result));
@@ -417,6 +424,31 @@ const Actions = {
         }
     },
 
+    async waitForJob(statusUrl) {
+        while (true) {
+            await new Promise(resolve => setTimeout(resolve, CONFIG.jobPollInterval));
+
+            const response = await fetch(statusUrl);
+            const job = await response.json();
+
+            if (!response.ok) {
+                throw new Error(Utils.getErrorMessage(job));
+            }
+
+            console.log('Статус задачи:', job.status);
+
+            // Задачи приходят по мере генерации, пока модель еще работает
+            if (job.tasks && job.tasks.length > 0) {
+                uploadText.textContent = `Найдено задач: ${job.tasks.length}...`;
+            }
+
+            if (job.status === 'completed' || job.status === 'failed') {
+                if (job.result) return job.result;
+                throw new Error(job.error_message || 'Ошибка обработки файла');
+            }
+        }
+    },
+
     copySummary(elementId) {
         const element = document.getElementById(elementId);
         if (!element) {
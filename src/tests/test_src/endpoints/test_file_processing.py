@@ -1,34 +1,23 @@
+import os
+
 import pytest
 
-from src.schemas.processing.processing_schemas import ProcessingResponseSchema
 from src.services.jira_service import get_jira_service
 from src.tests.test_src.conftest import MockJiraResult, MockJiraService
 
 
-def test_process_document_success(client, sample_file, monkeypatch):
-    """Тест успешной обработки документа."""
-    # Arrange
-    expected_response = ProcessingResponseSchema(
-        status="success",
-        error=False,
-        document_name="test_file.txt",
-        summary={"tasks": 5, "processed": True},
-    )
-
-    async def mock_process_document(file):
-        return expected_response
-
-    monkeypatch.setattr("src.pipeline.pipeline.process_document", mock_process_document)
-
+def test_process_document_success(client, sample_file):
+    """Тест постановки документа в очередь обработки."""
     # Act
     response = client.post("/file/process", files={"file": sample_file})
 
     # Assert
-    assert response.status_code == 200
+    assert response.status_code == 202
     response_data = response.json()
-    assert response_data["status"] == "success"
+    assert response_data["status"] == "queued"
     assert response_data["error"] is False
     assert response_data["document_name"] == "test_file.txt"
+    assert response_data["status_url"] == f"/file/jobs/{response_data['job_id']}"
 
 
 def test_process_document_no_file(client):
@@ -40,29 +29,114 @@ def test_process_document_no_file(client):
     assert response.status_code == 422
 
 
-def test_process_document_pdf_file(client, sample_pdf_file, monkeypatch):
-    """Тест обработки PDF файла."""
+def test_process_document_pdf_file(client, sample_pdf_file):
+    """Тест постановки PDF файла в очередь обработки."""
+    # Act
+    response = client.post("/file/process", files={"file": sample_pdf_file})
+
+    # Assert
+    assert response.status_code == 202
+    response_data = response.json()
+    assert response_data["status"] == "queued"
+    assert response_data["document_name"] == "test_document.pdf"
+
+
+def test_process_document_queue_full(client, sample_file, monkeypatch):
+    """Тест переполненной очереди обработки."""
     # Arrange
-    expected_response = ProcessingResponseSchema(
-        status="success",
-        error=False,
-        document_name="test_document.pdf",
-        summary={"pages": 1, "text_extracted": True},
+    from src.services.job_service import job_service
+
+    monkeypatch.setattr(job_service.queue, "full", lambda: True)
+
+    # Act
+    response = client.post("/file/process", files={"file": sample_file})
+
+    # Assert
+    assert response.status_code == 503
+
+
+def test_process_document_too_large(client, sample_file, monkeypatch, tmp_path):
+    """Тест отклонения файла больше max_file_size."""
+    # Arrange
+    from src.services.job_service import job_service
+    from src.settings.config import settings
+
+    monkeypatch.setattr(settings, "max_file_size", 4)
+    monkeypatch.setattr(job_service, "jobs_dir", str(tmp_path))
+
+    # Act
+    response = client.post("/file/process", files={"file": sample_file})
+
+    # Assert
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_process_document_rejects_large_content_length(client, monkeypatch, tmp_path):
+    """Тест отклонения загрузки по Content-Length до чтения тела."""
+    # Arrange
+    from src.middlewares.upload_size_limit import MULTIPART_OVERHEAD_BYTES
+    from src.services.job_service import job_service
+    from src.settings.config import settings
+
+    monkeypatch.setattr(settings, "max_file_size", 4)
+    monkeypatch.setattr(job_service, "jobs_dir", str(tmp_path))
+    content = b"x" * (MULTIPART_OVERHEAD_BYTES + 100)
+
+    # Act
+    response = client.post(
+        "/file/process", files={"file": ("big.txt", content, "text/plain")}
     )
 
-    async def mock_process_document(file):
-        return expected_response
+    # Assert
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
 
-    monkeypatch.setattr("src.pipeline.pipeline.process_document", mock_process_document)
+
+def test_process_document_accepts_recording_over_10_mb(client, monkeypatch, tmp_path):
+    """Тест приема записи больше прежнего лимита в 10 МБ с настройками по умолчанию."""
+    # Arrange
+    from src.services.job_service import job_service
+
+    monkeypatch.setattr(job_service, "jobs_dir", str(tmp_path))
+    content = b"\xff\xfb" * (6 * 1024 * 1024)
 
     # Act
-    response = client.post("/file/process", files={"file": sample_pdf_file})
+    response = client.post(
+        "/file/process", files={"file": ("meeting.mp3", content, "audio/mpeg")}
+    )
+
+    # Assert
+    assert response.status_code == 202
+    stored = job_service.get(response.json()["job_id"])
+    assert stored.size == len(content) > 10485760
+    assert os.path.getsize(stored.file_path) == len(content)
+
+
+# Тесты для GET /file/jobs/{job_id} endpoint
+def test_get_processing_job(client, sample_file):
+    """Тест получения статуса задачи обработки."""
+    # Arrange
+    job_id = client.post("/file/process", files={"file": sample_file}).json()["job_id"]
+
+    # Act
+    response = client.get(f"/file/jobs/{job_id}")
 
     # Assert
     assert response.status_code == 200
     response_data = response.json()
-    assert response_data["status"] == "error"
-    assert response_data["document_name"] == "test_document.pdf"
+    assert response_data["job_id"] == job_id
+    assert response_data["status"] in ("queued", "running", "completed", "failed")
+    assert response_data["document_name"] == "test_file.txt"
+
+
+def test_get_processing_job_not_found(client):
+    """Тест получения несуществующей задачи."""
+    # Act
+    response = client.get("/file/jobs/unknown")
+
+    # Assert
+    assert response.status_code == 404
 
 
 # Тесты для POST /file/reject endpoint
@@ -0,0 +1,93 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.schemas.llm.llm_service_schemas import LLMServiceResponseSchema
+from src.services import live_meeting_service
+from src.services.asr.fake_backend import FakeAsrBackend
+
+TASK_TEXT = """### TASK-001: Подготовить демо
+**Время выполнения:** 2 дня
+**Описание:** Собрать стенд для демонстрации.
+**Acceptance Criteria:**
+- Стенд доступен
+**Зависимости:** Нет
+"""
+
+
+class FakeTaskElement:
+    """Элемент извлечения задач, запоминающий полученный текст."""
+
+    texts = []
+
+    def __init__(self, text, model=None):
+        self.texts.append(text)
+
+    async def arun(self):
+        return LLMServiceResponseSchema(status="success", response_text=TASK_TEXT)
+
+
+def test_live_meeting_streams_transcript_and_final_tasks(client, monkeypatch):
+    """Тест живой встречи: фразы приходят по мере распознавания, задачи - в конце."""
+    # Arrange
+    monkeypatch.setattr(
+        live_meeting_service, "get_asr_backend", lambda: FakeAsrBackend(0)
+    )
+    monkeypatch.setattr(
+        live_meeting_service, "build_task_extraction_element", FakeTaskElement
+    )
+    t = np.arange(2 * 16000) / 16000
+    pcm = (8000 * np.sin(2 * np.pi * 440 * t)).astype("<i2").tobytes()
+
+    # Act
+    with client.websocket_connect("/live/meeting?sample_rate=16000") as websocket:
+        for start in range(0, len(pcm), 3200):
+            websocket.send_bytes(pcm[start : start + 3200])
+        websocket.send_text('{"type": "end"}')
+        transcript = websocket.receive_json()
+        final = websocket.receive_json()
+
+    # Assert
+    assert transcript["type"] == "transcript"
+    assert transcript["text"].startswith("речь 2.00 сек")
+    assert final["type"] == "tasks" and final["final"] is True
+    assert [task["task_id"] for task in final["tasks"]] == ["TASK-001"]
+    assert FakeTaskElement.texts == [transcript["text"]]
+
+
+def test_live_meeting_closes_session_on_error(client, monkeypatch):
+    """Тест закрытия сессии и потока распознавания при ошибке в обработчике."""
+    # Arrange
+    monkeypatch.setattr(
+        live_meeting_service, "get_asr_backend", lambda: FakeAsrBackend(0)
+    )
+    sessions = []
+    close = live_meeting_service.LiveMeetingSession.close
+
+    async def failing_feed(session, pcm):
+        raise RuntimeError("ошибка кадра")
+
+    async def recording_close(session):
+        sessions.append(session)
+        await close(session)
+
+    monkeypatch.setattr(live_meeting_service.LiveMeetingSession, "feed", failing_feed)
+    monkeypatch.setattr(
+        live_meeting_service.LiveMeetingSession, "close", recording_close
+    )
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with client.websocket_connect("/live/meeting") as websocket:
+            websocket.send_bytes(b"\x00\x00" * 1600)
+            websocket.receive_json()
+    # Поток распознавания завершается, получив конец очереди кадров
+    sessions[0]._executor.shutdown(wait=True)
+
+    # Assert
+    assert len(sessions) == 1
+    assert sessions[0]._closed
+    assert not any(
+        thread.name.startswith("live-meeting") for thread in threading.enumerate()
+    )
@@ -0,0 +1,49 @@
+import pytest
+
+from src.middlewares.upload_size_limit import (
+    MULTIPART_OVERHEAD_BYTES,
+    UploadSizeLimitMiddleware,
+)
+from src.settings.config import settings
+
+
+@pytest.mark.asyncio
+async def test_upload_size_limit_stops_chunked_body_on_arrival(monkeypatch):
+    """Тест прерывания приема тела без Content-Length при превышении лимита."""
+    # Arrange
+    monkeypatch.setattr(settings, "max_file_size", 4)
+    block = b"x" * 16 * 1024
+    blocks_total = 64
+    received_blocks = 0
+    sent = []
+
+    async def receive():
+        nonlocal received_blocks
+        received_blocks += 1
+        return {
+            "type": "http.request",
+            "body": block,
+            "more_body": received_blocks < blocks_total,
+        }
+
+    async def send(message):
+        sent.append(message)
+
+    async def app(scope, receive, send):
+        # Как FastAPI: ошибка чтения тела превращается в ответ 400
+        try:
+            while (await receive()).get("more_body"):
+                pass
+        except Exception:
+            await send({"type": "http.response.start", "status": 400, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+    scope = {"type": "http", "method": "POST", "path": "/file/process", "headers": []}
+
+    # Act
+    await UploadSizeLimitMiddleware(app)(scope, receive, send)
+
+    # Assert
+    assert sent[0]["status"] == 413
+    assert [message["status"] for message in sent if "status" in message] == [413]
+    assert received_blocks * len(block) <= MULTIPART_OVERHEAD_BYTES + len(block) * 2
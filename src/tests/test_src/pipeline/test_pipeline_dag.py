@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from src.pipeline.elements.base import Element, Pipeline
+
+
+class SleepElement(Element):
+    """Элемент, который ждет delay секунд и возвращает свой промпт с входами."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False, **kwargs):
+        super().__init__(model="test", tools=[], prompt=name, obj=None, **kwargs)
+        self.delay = delay
+        self.fail = fail
+
+    def run(self) -> dict:
+        if self.fail:
+            raise RuntimeError(f"{self.prompt} сломался")
+        return {"response_text": self.resolve_prompt()}
+
+    async def arun(self) -> dict:
+        await asyncio.sleep(self.delay)
+        return self.run()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_independent_elements_concurrently():
+    """Тест параллельного выполнения независимых элементов."""
+    # Arrange
+    elements = [SleepElement(name, delay=0.2) for name in ("a", "b", "c")]
+    pipeline = Pipeline(model="test", tools=[], elements=elements, concurrency=3)
+
+    # Act
+    started = asyncio.get_running_loop().time()
+    result = await pipeline.arun()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    # Assert
+    assert elapsed < 0.5
+    assert [r["response_text"] for r in result["results"]] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_passes_outputs_to_dependent_elements():
+    """Тест передачи результата элемента в промпт зависящего элемента."""
+    # Arrange
+    elements = [
+        SleepElement("итог: {summary}", inputs=("summary",)),
+        SleepElement("саммари", delay=0.05, outputs=("summary",)),
+    ]
+    pipeline = Pipeline(model="test", tools=[], elements=elements)
+
+    # Act
+    result = await pipeline.arun()
+
+    # Assert
+    assert result["results"][0] == {"response_text": "итог: саммари"}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_collects_errors_and_skips_dependents():
+    """Тест сбора ошибок элементов и пропуска зависящих от них элементов."""
+    # Arrange
+    elements = [
+        SleepElement("источник", fail=True, outputs=("text",)),
+        SleepElement("{text}", inputs=("text",)),
+        SleepElement("независимый"),
+    ]
+    pipeline = Pipeline(model="test", tools=[], elements=elements)
+
+    # Act
+    result = await pipeline.arun()
+
+    # Assert
+    failed, skipped, independent = result["results"]
+    assert failed["error"] and "сломался" in failed["error_message"]
+    assert skipped["error"] and "Пропущено" in skipped["error_message"]
+    assert independent == {"response_text": "независимый"}
+    assert pipeline.run()["results"] == result["results"]
+
+
+def test_pipeline_rejects_cycles():
+    """Тест ошибки при циклической зависимости элементов."""
+    # Arrange
+    elements = [
+        SleepElement("{b}", inputs=("b",), outputs=("a",)),
+        SleepElement("{a}", inputs=("a",), outputs=("b",)),
+    ]
+    pipeline = Pipeline(model="test", tools=[], elements=elements)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        pipeline.run()
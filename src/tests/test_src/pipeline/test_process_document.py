@@ -0,0 +1,27 @@
+import pytest
+
+from src.pipeline.pipeline import process_stored_document
+
+
+@pytest.mark.asyncio
+async def test_process_document_estimates_source_tokens_of_sniffed_html(tmp_path):
+    """Тест замера токенов разметки у HTML, распознанного по содержимому."""
+    # Arrange
+    file_path = tmp_path / "export"
+    file_path.write_text(
+        "<!DOCTYPE html><html><script>var rows = [1, 2, 3];</script></html>",
+        encoding="utf-8",
+    )
+
+    # Act
+    result = await process_stored_document(
+        file_path=str(file_path),
+        filename="export",
+        content_type="application/octet-stream",
+    )
+
+    # Assert
+    assert result.error_message == "Extracted text is empty"
+    extra = result.timings["stages"][0]["extra"]
+    assert extra["text_chars"] == 0
+    assert extra["source_tokens"] > 0
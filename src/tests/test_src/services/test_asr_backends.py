@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+from pydub import AudioSegment
+
+from src.services.asr.asr_backends import create_asr_backend
+from src.services.asr.fake_backend import FakeAsrBackend
+from src.services.asr.transcript_cache import CachedChunkTranscriber
+from src.utils.cache.disk_cache import DiskCache
+from src.utils.files.audio.audio_chunk_stream import AudioChunk
+from src.utils.files.audio.process_audio_chunck import process_audio_chunk
+from src.utils.files.audio.transcribe_audio_chunks import transcribe_audio_chunks
+
+PCM_FORMAT = {"frame_rate": 16000, "sample_width": 2, "channels": 1}
+
+
+def make_pcm(seconds: float, amplitude: int, frame_rate: int = 16000) -> bytes:
+    t = np.arange(int(seconds * frame_rate)) / frame_rate
+    return (amplitude * np.sin(2 * np.pi * 440 * t)).astype("<i2").tobytes()
+
+
+def test_fake_backend_is_deterministic():
+    """Тест детерминированного результата фейкового бэкенда."""
+    # Arrange
+    backend = FakeAsrBackend(delay_seconds=0)
+    pcm = make_pcm(1.5, amplitude=8000)
+
+    # Act & Assert
+    assert backend.transcribe(pcm, 16000) == backend.transcribe(pcm, 16000)
+    assert backend.transcribe(pcm, 16000).startswith("речь 1.50 сек")
+    assert backend.transcribe(make_pcm(1, amplitude=0), 16000) == ""
+    assert list(backend.transcribe_stream([pcm[:100], pcm[100:]], 16000)) == [
+        backend.transcribe(pcm, 16000)
+    ]
+
+
+def test_transcribe_audio_chunks_with_backend():
+    """Тест распознавания частей выбранным бэкендом."""
+    # Arrange
+    backend = create_asr_backend("fake")
+    chunks = [
+        AudioSegment(
+            make_pcm(seconds, 8000), frame_rate=16000, sample_width=2, channels=1
+        )
+        for seconds in (1, 2)
+    ]
+
+    # Act
+    texts = transcribe_audio_chunks(
+        chunks,
+        transcribe=lambda chunk, number, total: process_audio_chunk(
+            chunk, number, total, backend=backend
+        ),
+    )
+
+    # Assert
+    assert texts[0].startswith("речь 1.00 сек")
+    assert texts[1].startswith("речь 2.00 сек")
+
+
+def test_create_asr_backend_rejects_unknown_name():
+    """Тест ошибки для неизвестного бэкенда."""
+    # Act & Assert
+    with pytest.raises(ValueError):
+        create_asr_backend("unknown")
+
+
+def test_cached_chunk_transcriber_skips_cached_chunks(tmp_path):
+    """Тест повторной обработки: распознаются только части, которых нет в кэше."""
+    # Arrange
+    calls = []
+
+    class CountingBackend(FakeAsrBackend):
+        def transcribe(self, pcm, sample_rate, energy_threshold=None):
+            calls.append(len(pcm))
+            return super().transcribe(pcm, sample_rate, energy_threshold)
+
+    cache = DiskCache(directory=str(tmp_path), ttl_seconds=60, max_bytes=10**6)
+    chunks = [
+        AudioChunk(start, start + 1000, AudioSegment(make_pcm(1, 8000), **PCM_FORMAT))
+        for start in (0, 1000, 2000)
+    ]
+    first = CachedChunkTranscriber("file-hash", CountingBackend(delay_seconds=0), cache)
+    first(chunks[0], 1, 3)
+
+    # Act
+    second = CachedChunkTranscriber(
+        "file-hash", CountingBackend(delay_seconds=0), cache
+    )
+    texts = transcribe_audio_chunks(chunks, transcribe=second)
+
+    # Assert
+    assert len(calls) == 3
+    assert second.cache_hits == 1
+    assert texts[0] == texts[1] == texts[2]
+
+
+def test_google_backend_trims_silence_below_noise_floor(monkeypatch):
+    """Тест обрезки тишины по порогу энергии до запроса к Google API."""
+    # Arrange
+    import speech_recognition as sr
+
+    from src.services.asr.google_backend import GoogleAsrBackend
+
+    sent = []
+
+    def recognize_google(recognizer, audio, language):
+        sent.append(len(audio.frame_data))
+        return "текст"
+
+    monkeypatch.setattr(sr.Recognizer, "recognize_google", recognize_google)
+    backend = GoogleAsrBackend()
+    silence = make_pcm(1, amplitude=0)
+    pcm = silence + make_pcm(1, amplitude=8000) + silence * 2
+
+    # Act
+    text = backend.transcribe(pcm, 16000, energy_threshold=100.0)
+    silent = backend.transcribe(silence * 3, 16000, energy_threshold=100.0)
+
+    # Assert
+    assert text == "текст"
+    assert silent == ""
+    assert len(sent) == 1
+    assert sent[0] < len(pcm) / 2
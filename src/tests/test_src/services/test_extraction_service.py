@@ -0,0 +1,144 @@
+import asyncio
+import time
+
+import pytest
+
+import src.services.extraction_service as extraction_service_module
+from src.benchmarks.bench_pdf_extraction import make_text_pdf
+from src.services.extraction_service import ExtractionService, ExtractionTimeoutError
+from src.settings.config import settings
+from src.utils.files.audio.probe_audio import AudioProbe
+from src.utils.files.extractors.file_extractor import FileExtractor
+from src.utils.files.text.extract_pdf_text import extract_pdf_text
+from src.utils.metrics.stage_timer import collect_timings, stage
+
+
+@pytest.mark.asyncio
+async def test_extraction_service_extracts_text_in_process(tmp_path):
+    """Тест извлечения текста в пуле процессов."""
+    # Arrange
+    file_path = tmp_path / "notes.txt"
+    file_path.write_text("Текст встречи", encoding="utf-8")
+    service = ExtractionService(workers=1, timeout=60)
+    await service.start()
+
+    try:
+        # Act
+        text = await service.extract(str(file_path), "text/plain")
+
+        # Assert
+        assert text == "Текст встречи"
+    finally:
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_extraction_service_reports_worker_usage_to_stage():
+    """Тест замера CPU времени и памяти в процессе пула для текущего этапа."""
+    # Arrange
+    service = ExtractionService(workers=1, timeout=60)
+    await service.start()
+
+    try:
+        # Act
+        with collect_timings() as timings:
+            with stage("extract_text"):
+                await service.run(sum, range(3_000_000))
+                await service.run(sum, range(3_000_000))
+
+        # Assert
+        extra = timings.stages[0].extra
+        assert extra["worker_cpu_seconds"] > 0
+        assert extra["worker_cpu_seconds"] > timings.stages[0].cpu_seconds
+        assert extra["worker_peak_memory_bytes"] > 0
+    finally:
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_extraction_service_kills_stuck_worker():
+    """Тест перезапуска пула после таймаута зависшей задачи."""
+    # Arrange
+    service = ExtractionService(workers=1, timeout=60)
+    await service.start()
+    stuck_process = next(iter(service._pool._processes.values()))
+
+    try:
+        # Act
+        service.timeout = 0.5
+        with pytest.raises(ExtractionTimeoutError):
+            await service.run(time.sleep, 30)
+        service.timeout = 60
+        stuck_process.join(timeout=5)
+
+        # Assert
+        assert not stuck_process.is_alive()
+        assert await service.run(abs, -1) == 1
+    finally:
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_extraction_service_extracts_pdf_page_ranges_in_parallel(
+    tmp_path, monkeypatch
+):
+    """Тест извлечения PDF диапазонами страниц в нескольких процессах."""
+    # Arrange
+    file_path = str(tmp_path / "spec.pdf")
+    make_text_pdf(file_path, pages=5, lines=2)
+    monkeypatch.setattr(settings, "pdf_min_pages_per_task", 2)
+    service = ExtractionService(workers=2, timeout=60)
+    await service.start()
+
+    try:
+        # Act
+        text = await service.extract(file_path, "application/pdf")
+        monkeypatch.setattr(settings, "pdf_max_pages", 2)
+        limited = await service.extract(file_path, "application/pdf")
+
+        # Assert
+        assert text == extract_pdf_text(file_path)
+        assert [line.split(" ")[0] for line in text.splitlines() if line] == [
+            f"{page}.{line}" for page in range(1, 6) for line in range(2)
+        ]
+        assert limited == extract_pdf_text(file_path, max_pages=2)
+        assert "3.0" not in limited
+    finally:
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_extraction_service_scales_timeout_with_audio_duration(
+    tmp_path, monkeypatch
+):
+    """Тест таймаута распознавания длинной записи по ее длительности."""
+    # Arrange
+    wav_path = tmp_path / "meeting.wav"
+    wav_path.write_bytes(b"RIFF\x24\x00\x00\x00WAVEfmt ")
+    notes_path = tmp_path / "notes.txt"
+    notes_path.write_text("Текст встречи", encoding="utf-8")
+
+    def slow_extract(self, file_path, content_hash=None):
+        time.sleep(0.3)
+        return self.name
+
+    monkeypatch.setattr(FileExtractor, "extract", slow_extract)
+    monkeypatch.setattr(
+        extraction_service_module,
+        "probe_audio",
+        lambda file_path: AudioProbe(
+            duration_seconds=3 * 3600, sample_rate=16000, channels=1, codec="pcm"
+        ),
+    )
+    monkeypatch.setattr(settings, "extraction_audio_timeout_ratio", 0.5)
+    service = ExtractionService(workers=0, timeout=0.1)
+
+    # Act
+    timeout = await service.audio_timeout(str(wav_path))
+    text = await service.extract(str(wav_path), "audio/wav")
+
+    # Assert
+    assert timeout == 0.1 + 3 * 3600 * 0.5
+    assert text == "audio"
+    with pytest.raises(asyncio.TimeoutError):
+        await service.extract(str(notes_path), "text/plain")
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from src.services.job_service import JobQueueFullError, JobService
+
+
+class SlowUpload:
+    """Загрузка, отдающая содержимое по частям с переключением event loop."""
+
+    def __init__(self, filename: str, parts: int = 3):
+        self.filename = filename
+        self.content_type = "text/plain"
+        self._parts = [b"part"] * parts
+
+    async def read(self, size: int = -1) -> bytes:
+        await asyncio.sleep(0)
+        return self._parts.pop() if self._parts else b""
+
+
+@pytest.mark.asyncio
+async def test_submit_reserves_queue_slot_before_spooling(tmp_path):
+    """Тест, что параллельные загрузки не переполняют очередь."""
+    # Arrange
+    service = JobService(workers=0, queue_size=1, jobs_dir=str(tmp_path))
+
+    # Act
+    results = await asyncio.gather(
+        service.submit(SlowUpload("first.txt")),
+        service.submit(SlowUpload("second.txt")),
+        return_exceptions=True,
+    )
+
+    # Assert
+    job, error = results
+    assert isinstance(error, JobQueueFullError)
+    assert list(service.jobs) == [job.id]
+    assert service.queue.qsize() == 1
+    assert [path.name for path in tmp_path.iterdir()] == [f"{job.id}.txt"]
@@ -0,0 +1,117 @@
+import json
+
+import httpx
+import pytest
+
+from src.pipeline.elements.base import Pipeline
+from src.services import llm_service
+from src.services.llm_service import LlmService
+from src.utils.metrics.stage_timer import collect_timings
+
+
+@pytest.fixture
+def mock_llm_client(monkeypatch):
+    """Подменяет общий HTTP клиент LLM на клиент с мок-транспортом."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"response": "  ### TASK-001: API  "})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm_service, "_http_client", client)
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_llm_service_arun_uses_shared_client(mock_llm_client):
+    """Тест асинхронного вызова модели через общий клиент."""
+    # Act
+    result = await LlmService(prompt="Текст встречи").arun()
+
+    # Assert
+    assert result.status == "success"
+    assert result.response_text == "### TASK-001: API"
+    assert len(mock_llm_client) == 1
+    assert mock_llm_client[0].url.path == "/api/generate"
+
+
+@pytest.mark.asyncio
+async def test_pipeline_arun_collects_results(mock_llm_client):
+    """Тест асинхронного выполнения конвейера."""
+    # Arrange
+    pipeline = Pipeline(
+        model="yandex-gpt",
+        tools=[],
+        elements=[LlmService(prompt="Первый"), LlmService(prompt="Второй")],
+    )
+
+    # Act
+    result = await pipeline.arun()
+
+    # Assert
+    assert result["status"] == "success"
+    assert [r["response_text"] for r in result["results"]] == ["### TASK-001: API"] * 2
+
+
+@pytest.mark.asyncio
+async def test_llm_service_streams_tasks(monkeypatch):
+    """Тест потоковой выдачи задач из NDJSON ответа модели."""
+    # Arrange
+    fragments = ["### TASK-001: API\n**Зависимости:** Нет\n", "### TASK-002: UI\n"]
+    lines = [
+        json.dumps({"response": fragment, "done": False}) for fragment in fragments
+    ]
+    lines.append(json.dumps({"response": "", "done": True, "eval_count": 42}))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, content="\n".join(lines).encode())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm_service, "_http_client", client)
+
+    received = []
+
+    async def on_task(task):
+        received.append(task.task_id)
+
+    # Act
+    result = await LlmService(prompt="Текст встречи", on_task=on_task).arun()
+
+    # Assert
+    assert received == ["TASK-001", "TASK-002"]
+    assert result.status == "success"
+    assert result.response_text == "".join(fragments).strip()
+    assert result.response_data["eval_count"] == 42
+
+
+@pytest.mark.asyncio
+async def test_pipeline_records_llm_stage_metrics(monkeypatch):
+    """Тест замеров этапа LlmService: байты запроса/ответа и статистика Ollama."""
+    # Arrange
+    response_data = {"response": "ответ", "eval_count": 7, "eval_duration": 1000}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=response_data)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm_service, "_http_client", client)
+    pipeline = Pipeline(
+        model="yandex-gpt", tools=[], elements=[LlmService(prompt="Текст")]
+    )
+
+    # Act
+    with collect_timings() as timings:
+        await pipeline.arun()
+
+    # Assert
+    (timing,) = timings.stages
+    assert timing.name == "LlmService"
+    assert timing.wall_seconds >= 0 and timing.traced_peak_bytes is None
+    assert timing.extra["eval_count"] == 7
+    assert timing.extra["eval_duration"] == 1000
+    assert timing.extra["bytes_out"] > len("Текст")
+    assert timing.extra["bytes_in"] == len(
+        httpx.Response(200, json=response_data).content
+    )
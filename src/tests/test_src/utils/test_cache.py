@@ -0,0 +1,136 @@
+import os
+import time
+
+import pytest
+
+from src.pipeline.elements.base import Element
+from src.pipeline.elements.cached import CachedElement
+from src.utils.cache.disk_cache import DiskCache
+from src.utils.cache.make_cache_key import make_cache_key
+from src.utils.cache.memory_cache import MemoryCache
+from src.utils.cache.tiered_cache import TieredCache
+
+
+class CountingElement(Element):
+    """Элемент, считающий количество реальных выполнений."""
+
+    def __init__(self, prompt: str, error: bool = False):
+        super().__init__(model="test-model", tools=[], prompt=prompt, obj=None)
+        self.calls = 0
+        self.error = error
+
+    def run(self) -> dict:
+        self.calls += 1
+        return {"response_text": self.prompt.upper(), "error": self.error}
+
+
+@pytest.fixture
+def tiered_cache(tmp_path):
+    return TieredCache(
+        memory=MemoryCache(max_entries=2),
+        disk=DiskCache(directory=str(tmp_path / "cache"), ttl_seconds=60),
+    )
+
+
+def test_make_cache_key_is_stable_for_option_order():
+    """Тест независимости ключа от порядка параметров."""
+    # Act
+    first = make_cache_key("m", "p", {"top_p": 0.9, "temperature": 0.3})
+    second = make_cache_key("m", "p", {"temperature": 0.3, "top_p": 0.9})
+
+    # Assert
+    assert first == second
+    assert first != make_cache_key("m", "p", {"temperature": 0.4, "top_p": 0.9})
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Тест вытеснения давно не использованной записи."""
+    # Arrange
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_disk_cache_expires_entries(tmp_path):
+    """Тест устаревания записей на диске по TTL."""
+    # Arrange
+    cache = DiskCache(directory=str(tmp_path), ttl_seconds=60)
+    cache.set("ab" * 32, {"value": 1})
+    path = cache._path("ab" * 32)
+    os.utime(path, (time.time() - 120, time.time() - 120))
+
+    # Act & Assert
+    assert cache.get("ab" * 32) is None
+    assert not os.path.exists(path)
+
+
+def test_disk_cache_respects_size_limit(tmp_path):
+    """Тест ограничения общего размера кэша на диске."""
+    # Arrange
+    cache = DiskCache(directory=str(tmp_path), max_bytes=250)
+
+    # Act
+    for i in range(10):
+        cache.set(f"{i:02d}" * 32, {"payload": "x" * 50})
+
+    # Assert
+    total = sum(size for _, size, _ in cache._entries())
+    assert total <= 250
+    assert cache.get("09" * 32) == {"payload": "x" * 50}
+
+
+def test_tiered_cache_promotes_disk_hits(tiered_cache):
+    """Тест подъема записи с диска в память и счетчиков попаданий."""
+    # Arrange
+    tiered_cache.set("key", {"value": 1})
+    tiered_cache.memory.clear()
+
+    # Act
+    first = tiered_cache.get("key")
+    second = tiered_cache.get("key")
+    missing = tiered_cache.get("other")
+
+    # Assert
+    assert first == second == {"value": 1}
+    assert missing is None
+    stats = tiered_cache.stats()
+    assert stats["disk_hits"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_element_runs_element_once(tiered_cache):
+    """Тест повторного использования результата элемента из кэша."""
+    # Arrange
+    element = CountingElement(prompt="встреча")
+
+    # Act
+    first = await CachedElement(element, cache=tiered_cache).arun()
+    second = CachedElement(element, cache=tiered_cache).run()
+
+    # Assert
+    assert first == second == {"response_text": "ВСТРЕЧА", "error": False}
+    assert element.calls == 1
+
+
+def test_cached_element_skips_error_results(tiered_cache):
+    """Тест того, что ошибочные результаты не кэшируются."""
+    # Arrange
+    element = CountingElement(prompt="встреча", error=True)
+
+    # Act
+    CachedElement(element, cache=tiered_cache).run()
+    CachedElement(element, cache=tiered_cache).run()
+
+    # Assert
+    assert element.calls == 2
@@ -0,0 +1,103 @@
+from src.tools.prompt_generator import PromptGenerator
+from src.utils.jira.merge_task_blocks import merge_task_blocks
+from src.utils.llm.estimate_tokens import estimate_tokens
+from src.utils.llm.split_text_chunks import split_text_chunks
+
+
+def test_split_text_chunks_respects_token_budget():
+    """Тест разбиения текста на части в пределах бюджета токенов."""
+    # Arrange
+    paragraphs = [f"Абзац {i}. " + "слово " * 40 for i in range(20)]
+    text = "\n\n".join(paragraphs)
+
+    # Act
+    chunks = split_text_chunks(text, max_tokens=200)
+
+    # Assert
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 200 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_split_text_chunks_uses_audio_part_markers():
+    """Тест разбиения расшифровки по маркерам [Часть N]."""
+    # Arrange
+    text = "".join(f"[Часть {i}] " + "речь " * 30 for i in range(1, 5))
+
+    # Act
+    chunks = split_text_chunks(text, max_tokens=60)
+
+    # Assert
+    assert [chunk.split("]")[0] for chunk in chunks] == [
+        "[Часть 1",
+        "[Часть 2",
+        "[Часть 3",
+        "[Часть 4",
+    ]
+
+
+def test_split_text_chunks_splits_oversized_paragraph():
+    """Тест разбиения абзаца, не помещающегося в бюджет."""
+    # Act
+    chunks = split_text_chunks("x" * 1000, max_tokens=100)
+
+    # Assert
+    assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+    assert "".join(chunks) == "x" * 1000
+
+
+def test_prompt_generator_single_chunk_matches_run():
+    """Тест совпадения промпта для короткого текста с обычным режимом."""
+    # Arrange
+    generator = PromptGenerator(text="Короткая встреча")
+
+    # Act & Assert
+    assert generator.run_chunks(max_tokens=1000) == [generator.run()]
+
+
+def test_prompt_generator_keeps_prompts_when_text_grows():
+    """Тест, что дописанный текст меняет только промпт последней части."""
+    # Arrange
+    phrases = [f"Фраза {i} " + "слово " * 40 for i in range(30)]
+    before = PromptGenerator(text="\n\n".join(phrases[:20]))
+    after = PromptGenerator(text="\n\n".join(phrases))
+
+    # Act
+    prompts_before = before.run_chunks(max_tokens=200)
+    prompts_after = after.run_chunks(max_tokens=200)
+
+    # Assert
+    assert len(prompts_after) > len(prompts_before) > 1
+    assert prompts_after[: len(prompts_before) - 1] == prompts_before[:-1]
+
+
+def test_merge_task_blocks_deduplicates_and_renumbers():
+    """Тест объединения задач из частей текста."""
+    # Arrange
+    first = """Предлагаю создать следующие задачи:
+### TASK-001: Разработать API
+**Зависимости:** Нет
+
+---
+### TASK-101: Создать UI
+**Зависимости:** TASK-001
+"""
+    second = """### TASK-001: Настроить CI
+**Зависимости:** Нет
+### TASK-002: Разработать  API!
+**Зависимости:** Нет
+### TASK-102: Форма загрузки
+**Зависимости:** TASK-001, TASK-002
+"""
+
+    # Act
+    merged = merge_task_blocks([first, second])
+
+    # Assert
+    assert merged.startswith("Предлагаю создать следующие задачи:")
+    assert merged.count("### ") == 4
+    assert "### TASK-001: Разработать API" in merged
+    assert "### TASK-101: Создать UI\n**Зависимости:** TASK-001" in merged
+    assert "### TASK-002: Настроить CI" in merged
+    assert "### TASK-102: Форма загрузки\n**Зависимости:** TASK-002, TASK-001" in merged
+    assert "---" not in merged
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import pytest
+
+from src.settings.config import settings
+from src.utils.files.audio.decode_audio_ffmpeg import decode_audio_ffmpeg
+
+
+def write_fake_ffmpeg(path, exit_code: int) -> str:
+    """Скрипт вместо ffmpeg: много ошибок в stderr, затем PCM в stdout."""
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "for n in range(20000):\n"
+        "    sys.stderr.write(f'frame {n}: invalid data found\\n')\n"
+        "sys.stderr.flush()\n"
+        "sys.stdout.buffer.write(b'\\x01\\x00' * 50000)\n"
+        f"sys.exit({exit_code})\n"
+    )
+    os.chmod(path, 0o755)
+    return str(path)
+
+
+def test_decode_audio_ffmpeg_does_not_block_on_stderr(tmp_path, monkeypatch):
+    """Тест декодирования, когда ffmpeg пишет в stderr больше буфера pipe."""
+    # Arrange
+    monkeypatch.setattr(
+        settings, "ffmpeg_binary", write_fake_ffmpeg(tmp_path / "ffmpeg", 0)
+    )
+
+    # Act
+    pcm = b"".join(decode_audio_ffmpeg("damaged.mp3", block_size=4096))
+
+    # Assert
+    assert pcm == b"\x01\x00" * 50000
+
+
+def test_decode_audio_ffmpeg_reports_stderr_tail(tmp_path, monkeypatch):
+    """Тест ошибки декодирования с последними сообщениями ffmpeg."""
+    # Arrange
+    monkeypatch.setattr(
+        settings, "ffmpeg_binary", write_fake_ffmpeg(tmp_path / "ffmpeg", 1)
+    )
+
+    # Act & Assert
+    with pytest.raises(RuntimeError, match="frame 19999") as error:
+        b"".join(decode_audio_ffmpeg("damaged.mp3"))
+    assert "frame 0:" not in str(error.value)
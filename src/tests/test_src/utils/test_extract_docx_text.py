@@ -0,0 +1,81 @@
+import tracemalloc
+import zipfile
+
+from docx import Document
+
+from src.utils.files.text.extract_docx_text import (
+    extract_docx_text,
+    iter_docx_paragraphs,
+)
+
+
+def test_extract_docx_text_keeps_paragraph_order_and_tables(tmp_path):
+    """Тест потокового извлечения абзацев и строк таблиц в порядке документа."""
+    # Arrange
+    file_path = str(tmp_path / "minutes.docx")
+    document = Document()
+    document.add_paragraph("Повестка")
+    paragraph = document.add_paragraph("Срок: ")
+    paragraph.add_run("пятница").bold = True
+    table = document.add_table(rows=2, cols=2)
+    for row, values in zip(table.rows, (("Задача", "Ответственный"), ("API", ""))):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+    table.cell(1, 1).paragraphs[0].text = "Иван"
+    table.cell(1, 1).add_paragraph("Ольга")
+    document.add_paragraph("Итоги")
+    document.save(file_path)
+
+    # Act
+    text = extract_docx_text(file_path)
+
+    # Assert
+    assert text == (
+        "Повестка\n"
+        "Срок: пятница\n"
+        "Задача | Ответственный\n"
+        "API | Иван Ольга\n"
+        "Итоги\n"
+    )
+
+
+def write_table_docx(path, rows: int) -> str:
+    """DOCX из одной таблицы в две колонки с rows строками."""
+    w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    row = (
+        "<w:tr><w:tc><w:p><w:r><w:t>Задача {0}</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>Срок {0}</w:t></w:r></w:p></w:tc></w:tr>"
+    )
+    body = "".join(row.format(n) for n in range(rows))
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{w}"><w:body><w:tbl>{body}</w:tbl>'
+            "<w:p><w:r><w:t>Итоги</w:t></w:r></w:p></w:body></w:document>",
+        )
+    return str(path)
+
+
+def test_iter_docx_paragraphs_frees_rows_of_large_table(tmp_path):
+    """Тест, что память на разбор таблицы не растет с числом ее строк."""
+    # Arrange
+    small = write_table_docx(tmp_path / "small.docx", rows=2_000)
+    large = write_table_docx(tmp_path / "large.docx", rows=20_000)
+
+    def peak_memory(path: str) -> int:
+        tracemalloc.start()
+        try:
+            for _ in iter_docx_paragraphs(path):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Act
+    small_peak = peak_memory(small)
+    large_peak = peak_memory(large)
+    text = extract_docx_text(large)
+
+    # Assert
+    assert large_peak < small_peak * 2
+    assert text.splitlines()[-2:] == ["Задача 19999 | Срок 19999", "Итоги"]
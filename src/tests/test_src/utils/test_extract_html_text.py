@@ -0,0 +1,77 @@
+from src.utils.files.text.extract_html_text import HtmlTextExtractor, extract_html_text
+from src.utils.llm.estimate_tokens import estimate_file_tokens, estimate_tokens
+
+HTML = """<!DOCTYPE html>
+<html><head><title>Протокол</title>
+<style>body { color: red; }</style>
+<script>var html = "<p>не текст</p>";</script></head>
+<body>
+<nav><ul><li><a href="/">Главная</a></li><li>Меню</li></ul></nav>
+<div role="banner">Логотип</div>
+<h2>Встреча   команды</h2>
+<p style="margin: 0">Обсудили   <b>релиз</b> &amp; сроки.<br>Вторая строка</p>
+<ul><li>Пункт один</li><li>Пункт два<ol><li>Вложенный</li></ol></li></ul>
+<table><tr><th>Задача</th><th>Кто</th></tr><tr><td>API</td><td>Иван</td></tr></table>
+</body></html>
+"""
+
+
+def test_extract_html_text_keeps_structure_and_drops_markup(tmp_path):
+    """Тест удаления скриптов, стилей и навигации с сохранением структуры."""
+    # Arrange
+    file_path = tmp_path / "minutes.html"
+    file_path.write_text(HTML, encoding="utf-8")
+
+    # Act
+    text = extract_html_text(str(file_path))
+
+    # Assert
+    assert text == (
+        "Протокол\n"
+        "\n"
+        "## Встреча команды\n"
+        "\n"
+        "Обсудили релиз & сроки.\n"
+        "Вторая строка\n"
+        "\n"
+        "- Пункт один\n"
+        "- Пункт два\n"
+        "  1. Вложенный\n"
+        "\n"
+        "Задача | Кто\n"
+        "API | Иван\n"
+    )
+    assert estimate_tokens(text) < estimate_file_tokens(str(file_path)) / 2
+
+
+def test_html_text_extractor_accepts_arbitrary_fragments():
+    """Тест потокового разбора: результат не зависит от границ фрагментов."""
+    # Arrange
+    parser = HtmlTextExtractor()
+
+    # Act
+    for start in range(0, len(HTML), 7):
+        parser.feed(HTML[start : start + 7])
+    parser.close()
+
+    # Assert
+    whole = HtmlTextExtractor()
+    whole.feed(HTML)
+    whole.close()
+    assert parser.text() == whole.text()
+
+
+def test_html_text_extractor_drops_markers_of_empty_elements():
+    """Тест, что пустые заголовки и пункты списка не дают строк "#" и "-"."""
+    # Arrange
+    parser = HtmlTextExtractor()
+
+    # Act
+    parser.feed(
+        "<h2> </h2><p>Итоги</p><ul><li></li><li><p>Релиз</p></li>"
+        "<li><img src='x.png'></li></ul><ol><li></li><li>Тесты</li></ol>"
+    )
+    parser.close()
+
+    # Assert
+    assert parser.text() == "Итоги\n\n- Релиз\n\n2. Тесты\n"
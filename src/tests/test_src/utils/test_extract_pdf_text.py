@@ -0,0 +1,48 @@
+import pytesseract
+from PIL import Image
+from pypdf import PdfWriter
+
+from src.benchmarks.bench_pdf_extraction import make_text_pdf
+from src.utils.files.image import tesseract_languages
+from src.utils.files.text.extract_pdf_text import (
+    extract_pdf_pages,
+    extract_pdf_text,
+    ocr_pdf_page,
+)
+
+
+def make_mixed_pdf(tmp_path) -> str:
+    """PDF из страницы с текстовым слоем и страницы-скана (только изображение)."""
+    text_path, scan_path = str(tmp_path / "text.pdf"), str(tmp_path / "scan.pdf")
+    make_text_pdf(text_path, pages=1, lines=3)
+    Image.new("RGB", (600, 300), "white").save(scan_path)
+
+    file_path = str(tmp_path / "mixed.pdf")
+    writer = PdfWriter()
+    writer.append(text_path)
+    writer.append(scan_path)
+    writer.write(file_path)
+    return file_path
+
+
+def test_extract_pdf_text_ocrs_only_scanned_pages(tmp_path, monkeypatch):
+    """Тест OCR только для страниц без текстового слоя."""
+    # Arrange
+    file_path = make_mixed_pdf(tmp_path)
+    recognized = []
+    monkeypatch.setattr(tesseract_languages, "tesseract_languages", lambda: {"eng"})
+    monkeypatch.setattr(
+        pytesseract,
+        "image_to_string",
+        lambda image, lang=None: recognized.append(image.size) or "Протокол встречи",
+    )
+
+    # Act
+    pages = extract_pdf_pages(file_path, 0, 2)
+    text = extract_pdf_text(file_path)
+
+    # Assert
+    assert pages[0].startswith("1.0 The service") and pages[1] is None
+    assert text == pages[0] + "\n" + ocr_pdf_page(file_path, 1)
+    assert text.endswith("Протокол встречи")
+    assert len(recognized) == 2
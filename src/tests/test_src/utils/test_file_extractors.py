@@ -0,0 +1,106 @@
+import os
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+from src.benchmarks.bench_import_time import HEAVY_MODULES
+from src.benchmarks.bench_pdf_extraction import make_text_pdf
+from src.utils.files.extractors.registry import (
+    UnsupportedFileTypeError,
+    detect_file_extractor,
+)
+from src.utils.files.text.extract_text_from_file import extract_text_from_file
+
+project_root = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+
+
+def test_detect_file_extractor_prefers_magic_bytes_over_content_type(tmp_path):
+    """Тест выбора плагина по сигнатуре файла, а не по заявленному типу."""
+    # Arrange
+    pdf_path = str(tmp_path / "report.bin")
+    make_text_pdf(pdf_path, pages=1, lines=1)
+    docx_path = tmp_path / "minutes"
+    with zipfile.ZipFile(docx_path, "w") as archive:
+        archive.writestr("word/document.xml", "<w:document/>")
+    zip_path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        archive.writestr("data.csv", "a,b")
+    wav_path = tmp_path / "call"
+    wav_path.write_bytes(b"RIFF\x24\x00\x00\x00WAVEfmt ")
+    html_path = tmp_path / "page.txt"
+    html_path.write_text("﻿\n<!DOCTYPE html><p>Итоги</p>", encoding="utf-8")
+
+    # Act
+    names = [
+        detect_file_extractor(pdf_path, "application/octet-stream").name,
+        detect_file_extractor(str(docx_path), "text/plain").name,
+        detect_file_extractor(str(wav_path), None).name,
+        detect_file_extractor(str(html_path), "text/plain").name,
+    ]
+
+    # Assert
+    assert names == ["pdf", "docx", "audio", "html"]
+    with pytest.raises(UnsupportedFileTypeError):
+        detect_file_extractor(str(zip_path), "application/zip")
+
+
+def test_detect_file_extractor_requires_pdf_signature_at_start(tmp_path):
+    """Тест, что упоминание "%PDF-" в тексте не делает файл PDF."""
+    # Arrange
+    notes_path = tmp_path / "notes.md"
+    notes_path.write_text("# Экспорт\nФайлы сохраняются как %PDF-1.7\n", "utf-8")
+    shifted_path = tmp_path / "scan.pdf"
+    make_text_pdf(str(tmp_path / "source.pdf"), pages=1, lines=1)
+    shifted_path.write_bytes(b"\r\n" + (tmp_path / "source.pdf").read_bytes())
+
+    # Act
+    notes = detect_file_extractor(str(notes_path), "text/markdown")
+    shifted = detect_file_extractor(str(shifted_path), "application/octet-stream")
+
+    # Assert
+    assert notes.name == "text"
+    assert shifted.name == "pdf"
+
+
+def test_extract_text_from_file_falls_back_to_content_type(tmp_path):
+    """Тест выбора плагина по content type и чтения неизвестного текста."""
+    # Arrange
+    markdown_path = tmp_path / "notes.md"
+    markdown_path.write_text("# Итоги\n- релиз", encoding="utf-8")
+    fragment_path = tmp_path / "fragment"
+    fragment_path.write_text("<p>Срок: <b>пятница</b></p>", encoding="utf-8")
+
+    # Act
+    markdown = extract_text_from_file(
+        str(markdown_path), "text/markdown; charset=utf-8"
+    )
+    fragment = extract_text_from_file(str(fragment_path), "text/html")
+    unknown = extract_text_from_file(str(markdown_path), "application/x-unknown")
+
+    # Assert
+    assert markdown == unknown == "# Итоги\n- релиз"
+    assert fragment == "Срок: пятница\n"
+
+
+def test_extract_text_from_file_imports_extractors_lazily():
+    """Тест, что тяжелые библиотеки не импортируются вместе с реестром."""
+    # Arrange
+    code = (
+        "import sys\n"
+        "import src.services.extraction_service\n"
+        f"print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    )
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=project_root,
+    )
+
+    # Assert
+    assert result.stdout.strip() == ""
@@ -0,0 +1,73 @@
+import pytesseract
+from PIL import Image, ImageDraw
+
+from src.utils.files.image import tesseract_languages
+from src.utils.files.image.ocr_image import ocr_image
+from src.utils.files.image.preprocess_for_ocr import preprocess_for_ocr
+from src.utils.files.image.split_image_bands import split_image_bands
+
+
+def make_page(width: int, lines: int, line_height: int = 40) -> Image.Image:
+    """Серая страница с темными строками текста, разделенными пустыми строками."""
+    image = Image.new("RGB", (width, lines * line_height), (200, 200, 200))
+    draw = ImageDraw.Draw(image)
+    for line in range(lines):
+        top = line * line_height + 10
+        draw.rectangle((10, top, width - 10, top + 20), fill=(30, 30, 30))
+    return image
+
+
+def test_ocr_language_is_cached_per_process(monkeypatch):
+    """Тест однократного запроса списка языков Tesseract."""
+    # Arrange
+    calls = []
+    monkeypatch.setattr(
+        pytesseract, "get_languages", lambda config: calls.append(1) or ["eng", "rus"]
+    )
+    tesseract_languages.tesseract_languages.cache_clear()
+
+    try:
+        # Act
+        languages = [tesseract_languages.ocr_language() for _ in range(3)]
+    finally:
+        tesseract_languages.tesseract_languages.cache_clear()
+
+    # Assert
+    assert languages == ["rus+eng"] * 3
+    assert len(calls) == 1
+
+
+def test_preprocess_for_ocr_downscales_and_binarizes():
+    """Тест уменьшения до целевого DPI, перевода в серый и бинаризации."""
+    # Arrange
+    image = make_page(800, 10)
+    image.info["dpi"] = (600, 600)
+
+    # Act
+    prepared = preprocess_for_ocr(image, target_dpi=300)
+
+    # Assert
+    assert prepared.size == (400, 200)
+    assert prepared.mode == "L"
+    assert set(prepared.getdata()) == {0, 255}
+
+
+def test_ocr_image_recognizes_bands_in_order(tmp_path, monkeypatch):
+    """Тест разрезания высокого изображения по пустым строкам и сборки текста."""
+    # Arrange
+    file_path = str(tmp_path / "board.png")
+    make_page(300, 30).save(file_path)
+    monkeypatch.setattr(tesseract_languages, "tesseract_languages", lambda: {"eng"})
+    monkeypatch.setattr(
+        pytesseract,
+        "image_to_string",
+        lambda band, lang=None: f"{lang}:{band.height}\n",
+    )
+
+    # Act
+    bands = split_image_bands(preprocess_for_ocr(Image.open(file_path)), 250)
+    text = ocr_image(file_path, tile_height=250, workers=3)
+
+    # Assert
+    assert [band.height for band in bands] == [250, 240, 240, 240, 230]
+    assert text.splitlines() == [f"eng:{band.height}" for band in bands]
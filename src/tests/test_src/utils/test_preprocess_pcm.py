@@ -0,0 +1,68 @@
+import numpy as np
+from pydub import AudioSegment
+
+from src.utils.files.audio.preprocess_pcm import (
+    pcm_to_mono_float,
+    peak_normalize,
+    preprocess_pcm,
+    resample_poly,
+)
+
+
+def make_tone(frequency: float, seconds: float, frame_rate: int) -> np.ndarray:
+    t = np.arange(int(seconds * frame_rate)) / frame_rate
+    return (8000 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+def test_preprocess_pcm_matches_pydub_chain():
+    """Тест даунмикса и ресемплинга стерео 44.1 kHz в 16 kHz mono как у pydub."""
+    # Arrange
+    left = make_tone(440, 2, 44100)
+    stereo = np.stack([left, left * 0.5], axis=1).astype("<i2").tobytes()
+    segment = AudioSegment(stereo, frame_rate=44100, sample_width=2, channels=2)
+
+    # Act
+    result = np.frombuffer(preprocess_pcm(stereo, 44100, 2, 2), dtype="<i2")
+
+    # Assert
+    expected = segment.set_channels(1).set_frame_rate(16000).normalize()
+    expected = np.array(expected.get_array_of_samples())
+    assert len(result) == len(expected) == 32000
+    assert abs(int(np.abs(result).max()) - int(np.abs(expected).max())) < 50
+    assert np.abs(result[1000:-1000] - expected[1000:-1000]).max() < 2000
+
+
+def test_resample_poly_removes_frequencies_above_nyquist():
+    """Тест антиалиасингового фильтра: тон выше 8 kHz не проходит в 16 kHz."""
+    # Act
+    kept = resample_poly(make_tone(3000, 1, 44100), 16000, 44100)
+    removed = resample_poly(make_tone(10000, 1, 44100), 16000, 44100)
+
+    # Assert
+    assert np.sqrt(np.mean(kept[1000:-1000] ** 2)) > 5000
+    assert np.sqrt(np.mean(removed[1000:-1000] ** 2)) < 50
+
+
+def test_pcm_to_mono_float_and_peak_normalize_sample_widths():
+    """Тест чтения 8/16/24/32 бит в одной шкале и нормализации пика на месте."""
+    # Arrange
+    values = np.array([0.5, -0.25])
+    encoded = {
+        1: (values * 128 + 128).astype(np.uint8).tobytes(),
+        2: (values * 32768).astype("<i2").tobytes(),
+        3: b"".join(int(v * 2**23).to_bytes(3, "little", signed=True) for v in values),
+        4: (values * 2**31).astype("<i4").tobytes(),
+    }
+
+    # Act
+    decoded = {
+        width: pcm_to_mono_float(data, 1, width) for width, data in encoded.items()
+    }
+    gain = peak_normalize(decoded[2])
+
+    # Assert
+    for width in (1, 3, 4):
+        assert np.allclose(decoded[width], values * 32768)
+    assert np.isclose(gain, 2 * 10 ** (-0.1 / 20))
+    assert np.isclose(decoded[2][0], 32768 * 10 ** (-0.1 / 20))
+    assert peak_normalize(np.zeros(4, dtype=np.float32)) == 1.0
@@ -0,0 +1,96 @@
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from src.services.asr.fake_backend import FakeAsrBackend
+from src.settings.config import settings
+from src.utils.files.audio import extract_audio_text
+from src.utils.files.audio.probe_audio import (
+    AudioProbe,
+    InvalidAudioError,
+    preflight_audio,
+    probe_audio,
+)
+
+
+def write_wav(path, seconds: float, frame_rate: int = 16000) -> str:
+    """Записывает тихий WAV заданной длительности."""
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(frame_rate)
+        wav_file.writeframes(b"\x00" * int(seconds * frame_rate) * 4)
+    return str(path)
+
+
+def test_probe_audio_reads_wav_header(tmp_path):
+    """Тест чтения параметров WAV из заголовка."""
+    # Arrange
+    file_path = write_wav(tmp_path / "meeting.wav", seconds=1.5)
+
+    # Act
+    probe = probe_audio(file_path)
+
+    # Assert
+    assert probe.duration_seconds == 1.5
+    assert probe.sample_rate == 16000
+    assert probe.channels == 2
+    assert probe.codec == "pcm_s16le"
+    assert probe.wave_readable
+
+
+def test_preflight_audio_rejects_too_long_recording(tmp_path, monkeypatch):
+    """Тест отклонения записи длиннее допустимого."""
+    # Arrange
+    file_path = write_wav(tmp_path / "meeting.wav", seconds=3)
+    monkeypatch.setattr(settings, "audio_max_duration_seconds", 2)
+
+    # Act & Assert
+    with pytest.raises(InvalidAudioError):
+        preflight_audio(file_path)
+
+
+def test_preflight_audio_rejects_empty_wav(tmp_path):
+    """Тест отклонения пустого WAV."""
+    # Arrange
+    file_path = write_wav(tmp_path / "empty.wav", seconds=0)
+
+    # Act & Assert
+    with pytest.raises(InvalidAudioError):
+        preflight_audio(file_path)
+
+
+def test_extract_audio_text_decodes_float_wav_with_ffmpeg(tmp_path, monkeypatch):
+    """Тест, что короткий float WAV идет через ffmpeg, а не через wave."""
+    # Arrange
+    samples = (0.5 * np.sin(np.arange(16000) / 5)).astype("<f4").tobytes()
+    file_path = tmp_path / "float.wav"
+    file_path.write_bytes(
+        b"RIFF"
+        + struct.pack("<I", 36 + len(samples))
+        + b"WAVEfmt "
+        + struct.pack("<IHHIIHH", 16, 3, 1, 16000, 64000, 4, 32)
+        + b"data"
+        + struct.pack("<I", len(samples))
+        + samples
+    )
+    # Параметры, которые вернул бы ffprobe
+    monkeypatch.setattr(
+        extract_audio_text,
+        "preflight_audio",
+        lambda path: AudioProbe(1.0, 16000, 1, "pcm_f32le"),
+    )
+    pcm = (np.frombuffer(samples, "<f4") * 32767).astype("<i2").tobytes()
+    monkeypatch.setattr(extract_audio_text, "decode_audio_ffmpeg", lambda path: [pcm])
+    monkeypatch.setattr(
+        extract_audio_text, "get_asr_backend", lambda: FakeAsrBackend(0)
+    )
+    monkeypatch.setattr(settings, "asr_cache_enabled", False)
+
+    # Act
+    text = extract_audio_text.extract_audio_text(str(file_path))
+
+    # Assert
+    assert text.startswith("[Часть 1]")
@@ -0,0 +1,140 @@
+import numpy as np
+from pydub import AudioSegment
+
+from src.utils.files.audio.audio_chunk_stream import AudioChunkStream
+from src.utils.files.audio.noise_floor import noise_floor_energy_threshold
+from src.utils.files.audio.split_audio_on_silence import (
+    split_audio_on_silence,
+    window_rms_db,
+)
+
+FRAME_RATE = 16000
+
+
+def make_audio(*parts: tuple[str, float]) -> AudioSegment:
+    """Собирает аудио из частей ("speech" - тон, "silence" - тишина)."""
+    samples = []
+    for kind, seconds in parts:
+        t = np.arange(int(seconds * FRAME_RATE)) / FRAME_RATE
+        level = 8000 if kind == "speech" else 0
+        samples.append((level * np.sin(2 * np.pi * 440 * t)).astype("<i2"))
+    return AudioSegment(
+        np.concatenate(samples).tobytes(),
+        frame_rate=FRAME_RATE,
+        sample_width=2,
+        channels=1,
+    )
+
+
+def test_window_rms_db_detects_silence():
+    """Тест расчета RMS энергии окон."""
+    # Arrange
+    audio = make_audio(("speech", 1), ("silence", 1))
+
+    # Act
+    levels = window_rms_db(audio, window_ms=100)
+
+    # Assert
+    assert len(levels) == 20
+    assert (levels[:10] > -20).all()
+    assert (levels[10:] < -90).all()
+
+
+def test_split_audio_on_silence_cuts_at_pauses_and_drops_silence():
+    """Тест разбиения по паузам и отбрасывания тихих частей."""
+    # Arrange
+    audio = make_audio(
+        ("speech", 20),
+        ("silence", 1),
+        ("speech", 20),
+        ("silence", 1),
+        ("speech", 5),
+        ("silence", 60),
+    )
+
+    # Act
+    chunks = split_audio_on_silence(
+        audio, max_duration_seconds=30, min_duration_seconds=10
+    )
+
+    # Assert
+    # Вторая часть режется в конце паузы перед 30 сек, остаток тишины отброшен
+    assert [round(len(chunk) / 1000) for chunk in chunks] == [21, 30]
+
+
+def test_audio_chunk_stream_matches_in_memory_split():
+    """Тест потокового разбиения блоками PCM с тем же результатом, что и в памяти."""
+    # Arrange
+    audio = make_audio(
+        ("speech", 20),
+        ("silence", 1),
+        ("speech", 40),
+        ("silence", 30),
+        ("speech", 12),
+    )
+    raw = audio.raw_data
+    blocks = [raw[i : i + 10_001] for i in range(0, len(raw), 10_001)]
+    options = {"max_duration_seconds": 30, "min_duration_seconds": 10}
+
+    # Act
+    stream = AudioChunkStream(blocks, frame_rate=FRAME_RATE, **options)
+    streamed = list(stream)
+
+    # Assert
+    expected = split_audio_on_silence(audio, **options)
+    assert [chunk.audio.raw_data for chunk in streamed] == [
+        chunk.raw_data for chunk in expected
+    ]
+    assert [chunk.audio.raw_data for chunk in streamed] == [
+        audio[chunk.start_ms : chunk.end_ms].raw_data for chunk in streamed
+    ]
+    assert stream.duration_seconds == len(audio) / 1000
+
+
+def test_audio_chunk_stream_cuts_quiet_recording_relative_to_its_peak():
+    """Тест разбиения тихой записи (~-46 dBFS) так же, как после normalize."""
+    # Arrange
+    audio = make_audio(
+        ("speech", 40),
+        ("silence", 1),
+        ("speech", 40),
+        ("silence", 1),
+        ("speech", 38),
+    ).apply_gain(-32)
+    raw = audio.raw_data
+    blocks = [raw[i : i + 32_000] for i in range(0, len(raw), 32_000)]
+
+    # Act
+    chunks = list(AudioChunkStream(blocks, frame_rate=FRAME_RATE))
+
+    # Assert
+    expected = split_audio_on_silence(audio.normalize())
+    assert -48 < audio.dBFS < -45
+    assert len(chunks) == len(expected) == 3
+    assert [len(chunk.audio) for chunk in chunks] == [len(chunk) for chunk in expected]
+
+
+def test_noise_floor_is_calibrated_once_per_recording():
+    """Тест калибровки порога энергии по шуму один раз на всю запись."""
+    # Arrange
+    rng = np.random.default_rng(0)
+    noise = (rng.standard_normal(FRAME_RATE * 4) * 100).astype("<i2")
+    speech = make_audio(("speech", 20), ("silence", 1), ("speech", 40))
+    audio = speech.overlay(
+        AudioSegment(noise.tobytes(), frame_rate=FRAME_RATE, sample_width=2, channels=1)
+        * 16
+    )
+    raw = audio.raw_data
+    blocks = [raw[i : i + 32_000] for i in range(0, len(raw), 32_000)]
+
+    # Act
+    threshold = noise_floor_energy_threshold(audio[20_000:21_000], ratio=1.0)
+    stream = AudioChunkStream(
+        blocks, frame_rate=FRAME_RATE, max_duration_seconds=30, min_duration_seconds=10
+    )
+    chunks = list(stream)
+
+    # Assert
+    assert 80 < threshold < 120
+    assert len(chunks) > 1
+    assert {chunk.energy_threshold for chunk in chunks} == {stream.energy_threshold}
@@ -0,0 +1,44 @@
+import hashlib
+from io import BytesIO
+
+import pytest
+
+from src.utils.files.spool_upload import UploadTooLargeError, spool_upload
+
+
+class AsyncBytes:
+    """Асинхронный файл в памяти, как UploadFile."""
+
+    def __init__(self, content: bytes):
+        self.file = BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+
+@pytest.mark.asyncio
+async def test_spool_upload_writes_chunks_and_hashes(tmp_path):
+    """Тест сохранения загрузки кусками с подсчетом sha256."""
+    # Arrange
+    content = b"meeting" * 1000
+    path = tmp_path / "upload.bin"
+
+    # Act
+    upload = await spool_upload(AsyncBytes(content), str(path), chunk_size=100)
+
+    # Assert
+    assert path.read_bytes() == content
+    assert upload.size == len(content)
+    assert upload.sha256 == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_spool_upload_rejects_oversized_file(tmp_path):
+    """Тест прерывания загрузки, превысившей максимальный размер."""
+    # Arrange
+    path = tmp_path / "upload.bin"
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await spool_upload(AsyncBytes(b"x" * 1000), str(path), max_size=500)
+    assert not path.exists()
@@ -0,0 +1,61 @@
+from src.utils.jira.task_stream_parser import TaskStreamParser
+
+TASKS_TEXT = """Предлагаю создать следующие задачи:
+### TASK-001: Разработать API
+**Время выполнения:** 3 дня
+**Описание:** Основные эндпоинты.
+**Acceptance Criteria:**
+- Эндпоинты отвечают
+**Зависимости:** Нет
+
+---
+### TASK-101: Создать UI
+**Описание:** Форма загрузки.
+**Зависимости:** TASK-001
+"""
+
+
+def test_task_stream_parser_emits_task_when_block_closes():
+    """Тест выдачи задачи сразу после завершения ее блока."""
+    # Arrange
+    parser = TaskStreamParser()
+    first_block_end = TASKS_TEXT.index("---")
+
+    # Act
+    tasks = parser.feed(TASKS_TEXT[:first_block_end])
+
+    # Assert
+    assert [task.task_id for task in tasks] == ["TASK-001"]
+    assert tasks[0].title == "Разработать API"
+    assert tasks[0].time_estimate == "3 дня"
+    assert tasks[0].acceptance_criteria == ["Эндпоинты отвечают"]
+
+
+def test_task_stream_parser_handles_arbitrary_fragments():
+    """Тест разбора текста, поступающего фрагментами по несколько символов."""
+    # Arrange
+    parser = TaskStreamParser()
+
+    # Act
+    tasks = []
+    for i in range(0, len(TASKS_TEXT), 7):
+        tasks.extend(parser.feed(TASKS_TEXT[i : i + 7]))
+    tasks.extend(parser.close())
+
+    # Assert
+    assert [task.task_id for task in tasks] == ["TASK-001", "TASK-101"]
+    assert tasks[1].dependencies == ["TASK-001"]
+
+
+def test_task_stream_parser_closes_unterminated_block():
+    """Тест выдачи последней задачи при завершении потока."""
+    # Arrange
+    parser = TaskStreamParser()
+
+    # Act
+    tasks = parser.feed("### TASK-201: Написать тесты\n**Описание:** Покрыть API")
+    tasks.extend(parser.close())
+
+    # Assert
+    assert [task.task_id for task in tasks] == ["TASK-201"]
+    assert tasks[0].description == "Покрыть API"
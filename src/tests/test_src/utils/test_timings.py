@@ -0,0 +1,72 @@
+import tracemalloc
+
+from src.utils.metrics.stage_timer import annotate_stage, collect_timings, stage
+from src.utils.metrics.timing_registry import TimingRegistry
+
+
+def test_stage_is_noop_without_collector():
+    """Тест замера этапа вне collect_timings."""
+    # Act
+    with stage("extract_text") as timing:
+        annotate_stage(text_chars=10)
+
+    # Assert
+    assert timing is None
+
+
+def test_timing_registry_aggregates_stages():
+    """Тест агрегации замеров этапов по документам."""
+    # Arrange
+    registry = TimingRegistry(history_size=1)
+
+    # Act
+    for name in ("a.pdf", "b.pdf"):
+        with collect_timings() as timings:
+            with stage("extract_text"):
+                annotate_stage(text_chars=10)
+        registry.record(timings, document_name=name)
+    stats = registry.stats()
+
+    # Assert
+    assert stats["stages"]["extract_text"]["count"] == 2
+    assert [doc["document_name"] for doc in stats["recent"]] == ["b.pdf"]
+    assert stats["recent"][0]["stages"][0]["extra"] == {"text_chars": 10}
+
+
+def test_stage_records_its_own_memory_delta():
+    """Тест изменения памяти, отнесенного к этапу, а не к процессу целиком."""
+    # Arrange
+    size = 64 * 1024 * 1024
+
+    # Act
+    with collect_timings() as timings:
+        with stage("load"):
+            data = bytearray(size)
+        with stage("count"):
+            data.count(0)
+    load, count = timings.stages
+
+    # Assert
+    assert load.memory_delta_bytes > size // 2
+    assert abs(count.memory_delta_bytes) < size // 4
+    assert load.traced_peak_bytes is None
+
+
+def test_stage_records_traced_peak_above_stage_start():
+    """Тест пика tracemalloc за этап, если трассировка включена."""
+    # Arrange
+    size = 8 * 1024 * 1024
+    tracemalloc.start()
+
+    # Act
+    try:
+        with collect_timings() as timings:
+            with stage("parse"):
+                data = bytearray(size)
+                del data
+    finally:
+        tracemalloc.stop()
+    (timing,) = timings.stages
+
+    # Assert
+    assert size <= timing.traced_peak_bytes < size * 2
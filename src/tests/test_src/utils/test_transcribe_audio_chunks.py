@@ -0,0 +1,51 @@
+import threading
+import time
+
+from src.utils.files.audio.transcribe_audio_chunks import transcribe_audio_chunks
+from src.utils.rate_limit.token_bucket import TokenBucket
+
+
+def test_token_bucket_limits_rate():
+    """Тест ограничения частоты после исчерпания запаса токенов."""
+    # Arrange
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    # Act
+    started = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert elapsed >= 0.09
+    assert bucket.acquire(timeout=0) is False
+
+
+def test_transcribe_audio_chunks_keeps_order_and_retries():
+    """Тест параллельного распознавания с повтором упавшей части."""
+    # Arrange
+    attempts = {}
+    lock = threading.Lock()
+
+    def transcribe(chunk, number, total):
+        with lock:
+            attempts[number] = attempts.get(number, 0) + 1
+        if chunk == "flaky" and attempts[number] == 1:
+            raise RuntimeError("429 Too Many Requests")
+        if chunk == "broken":
+            raise RuntimeError("Bad Request")
+        time.sleep(0.05)
+        return chunk.upper()
+
+    # Act
+    results = transcribe_audio_chunks(
+        iter(["a", "flaky", "broken", "b"]),
+        transcribe=transcribe,
+        max_workers=4,
+        max_retries=1,
+        retry_backoff=0.01,
+    )
+
+    # Assert
+    assert results == ["A", "FLAKY", None, "B"]
+    assert attempts == {1: 1, 2: 2, 3: 2, 4: 1}
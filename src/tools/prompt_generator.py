@@ -1,4 +1,5 @@
 from src.pipeline.elements.base import Tool
+from src.utils.llm.split_text_chunks import split_text_chunks
 
 
 class PromptGenerator(Tool):
@@ -15,6 +16,26 @@ class PromptGenerator(Tool):
 
     def run(self) -> str:
         """Возвращает специализированный промпт для конкретного типа документа."""
+        return self.build_prompt(self.text)
+
+    def run_chunks(self, max_tokens: int) -> list[str]:
+        """Возвращает промпты для частей текста, не превышающих max_tokens.
+
+        В заголовке части нет общего числа частей: когда текст дописывается
+        (расшифровка живой встречи), промпты прежних частей не меняются и
+        ответы на них берутся из кэша.
+        """
+        chunks = split_text_chunks(self.text, max_tokens)
+        if len(chunks) <= 1:
+            return [self.run()]
+
+        return [
+            self.build_prompt(f"[Фрагмент {i} длинного обсуждения]\n{chunk}")
+            for i, chunk in enumerate(chunks, 1)
+        ]
+
+    def build_prompt(self, text: str) -> str:
+        """Подставляет текст обсуждения в шаблон промпта."""
 
         prompts = {
             "primary": f"""Ты - эксперт по созданию технических задач для IT-команды. На основе входных данных создай структурированный план разработки с задачами.
@@ -72,7 +93,7 @@ class PromptGenerator(Tool):
                 Начинай ответ с: "Предлагаю создать следующие задачи:"
                 Создавай краткий, но полный план разработки готовый к использованию без контекста.
 
-                Текст обсуждения следующий: f"{self.text}"
+                Текст обсуждения следующий: f"{text}"
             """
         }
 
@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """Кэш JSON значений на локальном диске с TTL и ограничением общего размера.
+
+    Каждая запись хранится в отдельном файле <dir>/<key[:2]>/<key>.json.
+    При превышении max_bytes удаляются записи с самым старым временем доступа.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Any | None:
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if (
+                self.ttl_seconds is not None
+                and time.time() - stat.st_mtime > self.ttl_seconds
+            ):
+                self._remove(path, stat.st_size)
+                return None
+
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+
+            # Обновляем время доступа для вытеснения давно не используемых записей
+            os.utime(path, (time.time(), stat.st_mtime))
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Не удалось прочитать запись кэша {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        with self._lock:
+            if self._size is not None:
+                self._size += os.path.getsize(path) - previous_size
+        self._evict()
+
+    def clear(self) -> None:
+        for path, size, _ in self._entries():
+            self._remove(path, size)
+
+    def _entries(self) -> list[tuple[str, int, float]]:
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_atime))
+        return entries
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            if self._size <= self.max_bytes:
+                return
+
+        for path, size, _ in sorted(self._entries(), key=lambda entry: entry[2]):
+            if self._size <= self.max_bytes:
+                break
+            self._remove(path, size)
+
+    def _remove(self, path: str, size: int) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size -= size
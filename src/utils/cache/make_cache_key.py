@@ -0,0 +1,13 @@
+import hashlib
+import json
+from typing import Any
+
+
+def make_cache_key(model: str, prompt: str, options: dict[str, Any] | None) -> str:
+    """Ключ кэша: SHA-256 от модели, промпта и параметров генерации."""
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "options": options or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,63 @@
+import threading
+from typing import Any
+
+from src.utils.cache.disk_cache import DiskCache
+from src.utils.cache.memory_cache import MemoryCache
+
+
+class TieredCache:
+    """Двухуровневый кэш: LRU в памяти и постоянный кэш на диске.
+
+    Попадание на диске поднимает запись в память. Счетчики попаданий и
+    промахов доступны через stats().
+    """
+
+    def __init__(self, memory: MemoryCache, disk: DiskCache | None = None):
+        self.memory = memory
+        self.disk = disk
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "sets": 0}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self._count("disk_hits")
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+        self._count("sets")
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            **counters,
+            "hits": hits,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+        }
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
@@ -0,0 +1,155 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+from pydub import AudioSegment
+
+from src.settings.config import settings
+from src.utils.files.audio.decode_audio_ffmpeg import PCM_FRAME_RATE, PCM_SAMPLE_WIDTH
+from src.utils.files.audio.noise_floor import noise_floor_energy_threshold
+from src.utils.files.audio.split_audio_on_silence import (
+    chunk_window_limits,
+    next_cut,
+    silence_split_ranges,
+    window_rms_db,
+)
+
+
+@dataclass
+class AudioChunk:
+    """Часть записи и ее границы в миллисекундах от начала файла.
+
+    energy_threshold - порог энергии речи, откалиброванный по
+    уровню шума всей записи (None - порог неизвестен, тишина не обрезается).
+    """
+
+    start_ms: int
+    end_ms: int
+    audio: AudioSegment
+    energy_threshold: float | None = None
+
+
+class AudioChunkStream:
+    """Разбиение потока PCM s16le mono на части по паузам в речи.
+
+    В памяти держится не больше одной части и одного блока, поэтому
+    потребление памяти не зависит от длительности записи. Правила разбиения
+    те же, что у split_audio_on_silence.
+
+    Порог тишины silence_threshold_db отсчитывается от пика записи, как
+    после normalize всей записи: тихая запись режется так же, как громкая.
+    Пик берется по уже прочитанной части (с окном просмотра), поэтому до
+    самого громкого места порог может быть ниже, и тихие окна скорее
+    остаются в частях, чем отбрасываются.
+
+    Уровень шума измеряется один раз, по первому окну просмотра (до
+    audio_chunk_max_seconds), и порог энергии передается во все части.
+    """
+
+    def __init__(
+        self,
+        blocks: Iterable[bytes],
+        frame_rate: int = PCM_FRAME_RATE,
+        max_duration_seconds: float = settings.audio_chunk_max_seconds,
+        min_duration_seconds: float = settings.audio_chunk_min_seconds,
+        silence_threshold_db: float = settings.audio_silence_threshold_db,
+        window_ms: int = settings.audio_silence_window_ms,
+    ):
+        self.blocks = blocks
+        self.frame_rate = frame_rate
+        self.max_duration_seconds = max_duration_seconds
+        self.min_duration_seconds = min_duration_seconds
+        self.silence_threshold_db = silence_threshold_db
+        self.window_ms = window_ms
+        self.bytes_read = 0
+        self.energy_threshold: float | None = None
+        # Максимальная амплитуда сэмплов прочитанной части записи
+        self.peak = 0
+
+    @property
+    def duration_seconds(self) -> float:
+        """Длительность прочитанной части записи."""
+        return self.bytes_read / (self.frame_rate * PCM_SAMPLE_WIDTH)
+
+    def __iter__(self) -> Iterator[AudioChunk]:
+        max_windows, min_windows = chunk_window_limits(
+            self.max_duration_seconds, self.min_duration_seconds, self.window_ms
+        )
+        window_bytes = self.frame_rate * self.window_ms // 1000 * PCM_SAMPLE_WIDTH
+        # Одно лишнее окно, чтобы next_cut мог искать паузу до самой границы
+        lookahead_bytes = (max_windows + 1) * window_bytes
+        buffer = bytearray()
+        # Начало буфера в миллисекундах от начала записи
+        offset_ms = 0
+
+        for block in self.blocks:
+            self.bytes_read += len(block)
+            buffer += block
+
+            while len(buffer) >= lookahead_bytes:
+                segment = self._segment(buffer[:lookahead_bytes])
+                self._calibrate(segment)
+                self._track_peak(segment)
+                silent = window_rms_db(segment, self.window_ms) < (
+                    self._relative_silence_threshold_db()
+                )
+                end = next_cut(
+                    np.flatnonzero(silent), 0, len(silent), min_windows, max_windows
+                )
+                end_ms = end * self.window_ms
+                if not silent[:end].all():
+                    yield AudioChunk(
+                        offset_ms,
+                        offset_ms + end_ms,
+                        segment[:end_ms],
+                        self.energy_threshold,
+                    )
+                del buffer[: end * window_bytes]
+                offset_ms += end_ms
+
+        if buffer:
+            segment = self._segment(buffer)
+            self._calibrate(segment)
+            self._track_peak(segment)
+            for start_ms, end_ms in silence_split_ranges(
+                segment,
+                self.max_duration_seconds,
+                self.min_duration_seconds,
+                self._relative_silence_threshold_db(),
+                self.window_ms,
+            ):
+                yield AudioChunk(
+                    offset_ms + start_ms,
+                    offset_ms + end_ms,
+                    segment[start_ms:end_ms],
+                    self.energy_threshold,
+                )
+
+    def _calibrate(self, segment: AudioSegment) -> None:
+        if self.energy_threshold is None:
+            self.energy_threshold = noise_floor_energy_threshold(
+                segment, self.window_ms
+            )
+
+    def _track_peak(self, segment: AudioSegment) -> None:
+        samples = np.frombuffer(segment.raw_data, dtype="<i2")
+        if len(samples):
+            self.peak = max(self.peak, int(np.abs(samples.astype(np.int32)).max()))
+
+    def _relative_silence_threshold_db(self) -> float:
+        """Порог тишины в dBFS исходного сигнала с учетом пика записи."""
+        if not self.peak:
+            # В записи пока только цифровая тишина, normalize ее не меняет
+            return self.silence_threshold_db
+        full_scale = float(1 << (8 * PCM_SAMPLE_WIDTH - 1))
+        return self.silence_threshold_db + 20 * np.log10(self.peak / full_scale)
+
+    def _segment(self, data: bytearray) -> AudioSegment:
+        # Неполный последний сэмпл отбрасывается
+        data = bytes(data[: len(data) - len(data) % PCM_SAMPLE_WIDTH])
+        return AudioSegment(
+            data,
+            frame_rate=self.frame_rate,
+            sample_width=PCM_SAMPLE_WIDTH,
+            channels=1,
+        )
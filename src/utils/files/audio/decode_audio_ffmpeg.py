@@ -0,0 +1,70 @@
+import logging
+import subprocess
+import tempfile
+from collections.abc import Iterator
+from typing import IO
+
+from src.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+PCM_FRAME_RATE = 16000
+PCM_SAMPLE_WIDTH = 2
+PCM_BLOCK_SIZE = 64 * 1024
+# Сколько последних байт stderr ffmpeg попадает в текст ошибки
+STDERR_TAIL_BYTES = 4096
+
+
+def decode_audio_ffmpeg(
+    file_path: str,
+    frame_rate: int = PCM_FRAME_RATE,
+    block_size: int = PCM_BLOCK_SIZE,
+) -> Iterator[bytes]:
+    """Потоковое декодирование аудио в PCM s16le mono через pipe ffmpeg.
+
+    Возвращает блоки по block_size байт, файл целиком в память не загружается.
+    Если генератор закрыт раньше времени, процесс ffmpeg завершается.
+    stderr пишется во временный файл, а не в pipe: на поврежденной записи
+    ffmpeg сообщает об ошибке на каждый кадр, и непрочитанный pipe stderr
+    заполнился бы и остановил декодирование.
+    """
+    command = [
+        settings.ffmpeg_binary,
+        "-nostdin",
+        "-v",
+        "error",
+        "-i",
+        file_path,
+        "-f",
+        "s16le",
+        "-acodec",
+        "pcm_s16le",
+        "-ac",
+        "1",
+        "-ar",
+        str(frame_rate),
+        "pipe:1",
+    ]
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=stderr_file, bufsize=0
+        )
+        try:
+            while block := process.stdout.read(block_size):
+                yield block
+
+            if process.wait() != 0:
+                raise RuntimeError(
+                    f"ffmpeg не смог декодировать файл: {_tail(stderr_file)}"
+                )
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+
+def _tail(stderr_file: IO[bytes]) -> str:
+    size = stderr_file.seek(0, 2)
+    stderr_file.seek(max(0, size - STDERR_TAIL_BYTES))
+    return stderr_file.read().decode(errors="replace").strip()
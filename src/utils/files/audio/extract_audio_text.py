@@ -0,0 +1,152 @@
+import logging
+import wave
+from dataclasses import replace
+
+from pydub import AudioSegment
+
+from src.services.asr.asr_backends import get_asr_backend
+from src.services.asr.transcript_cache import (
+    CachedChunkTranscriber,
+    get_transcript_cache,
+)
+from src.settings.config import settings
+from src.utils.files.audio.audio_chunk_stream import AudioChunk, AudioChunkStream
+from src.utils.files.audio.decode_audio_ffmpeg import (
+    PCM_FRAME_RATE,
+    PCM_SAMPLE_WIDTH,
+    decode_audio_ffmpeg,
+)
+from src.utils.files.audio.noise_floor import noise_floor_energy_threshold
+from src.utils.files.audio.preprocess_pcm import (
+    float_to_pcm16,
+    pcm_to_mono_float,
+    peak_normalize,
+    preprocess_pcm,
+)
+from src.utils.files.audio.probe_audio import preflight_audio
+from src.utils.files.audio.transcribe_audio_chunks import transcribe_audio_chunks
+from src.utils.files.file_sha256 import file_sha256
+
+logger = logging.getLogger(__name__)
+
+
+def extract_audio_text(file_path: str, content_hash: str | None = None) -> str:
+    """Расшифровка аудиофайла по частям.
+
+    content_hash (sha256 файла) - ключ кэша расшифровок частей; если не
+    передан, считается по файлу.
+    """
+    try:
+        # Параметры из заголовков, до декодирования
+        probe = preflight_audio(file_path)
+        logger.debug(
+            f"Аудио: {probe.duration_seconds:.1f}сек, {probe.sample_rate}Hz, "
+            f"{probe.channels} кан., {probe.codec}"
+        )
+
+        transcriber = CachedChunkTranscriber(
+            content_hash=content_hash or file_sha256(file_path),
+            backend=get_asr_backend(),
+            cache=(get_transcript_cache() if settings.asr_cache_enabled else None),
+        )
+
+        if probe.wave_readable and probe.duration_seconds <= 50:
+            # Короткий PCM WAV - обрабатываем целиком: даунмикс и ресемплинг
+            # в 16 kHz s16 одним проходом по буферу numpy
+            with wave.open(file_path, "rb") as wav_file:
+                params = wav_file.getparams()
+                data = wav_file.readframes(params.nframes)
+            segment = AudioSegment(
+                preprocess_pcm(
+                    data,
+                    params.framerate,
+                    params.nchannels,
+                    params.sampwidth,
+                    normalize=False,
+                ),
+                frame_rate=PCM_FRAME_RATE,
+                sample_width=PCM_SAMPLE_WIDTH,
+                channels=1,
+            )
+            return transcriber(
+                AudioChunk(
+                    0,
+                    len(segment),
+                    segment,
+                    noise_floor_energy_threshold(segment),
+                ),
+                1,
+                1,
+            )
+
+        # Длинный WAV, WAV, который не читает wave (float, extensible), и
+        # остальные форматы: ffmpeg декодирует файл потоком сразу в 16 kHz
+        # mono s16, части по паузам распознаются по мере декодирования, и
+        # запись целиком в памяти не держится.
+        # Расшифровки частей кэшируются, при повторе распознаются только
+        # недостающие части
+        stream = AudioChunkStream(decode_audio_ffmpeg(file_path))
+        chunk_texts = transcribe_audio_chunks(
+            (_normalize_chunk(chunk) for chunk in stream),
+            transcribe=transcriber,
+        )
+        total_chunks = len(chunk_texts)
+        duration = stream.duration_seconds
+        logger.debug(
+            f"Аудиофайл {duration:.1f}сек распознан по {total_chunks} частям, "
+            f"из кэша: {transcriber.cache_hits}"
+        )
+
+        all_text = []
+        processed_chunks = 0
+
+        for i, chunk_text in enumerate(chunk_texts, 1):
+            if chunk_text is None:
+                all_text.append(f"[Часть {i}] Ошибка обработки")
+                continue
+
+            if chunk_text.strip():
+                all_text.append(f"[Часть {i}] {chunk_text}")
+            processed_chunks += 1
+
+        if not all_text:
+            raise Exception("Не удалось распознать речь ни в одной части файла")
+
+        # Объединяем весь текст
+        final_text = "\n\n".join(all_text)
+
+        # Добавляем информацию об обработке
+        summary = "\n\n--- ИНФОРМАЦИЯ ОБ ОБРАБОТКЕ ---\n"
+        summary += f"Длительность файла: {duration:.1f} секунд\n"
+        summary += f"Обработано частей: {processed_chunks}/{total_chunks}\n"
+        summary += f"Частей из кэша: {transcriber.cache_hits}\n"
+        summary += f"Общий объем текста: {len(final_text)} символов"
+
+        return final_text + summary
+
+    except Exception as e:
+        if "Bad Request" in str(e):
+            raise Exception(
+                "Ошибка обработки аудио. Возможные причины:\n"
+                "• Плохое качество записи\n"
+                "• Нет речи в файле\n"
+                "• Слишком тихая запись\n"
+                "• Неподдерживаемый формат"
+            )
+        raise e
+
+
+def _normalize_chunk(chunk: AudioChunk) -> AudioChunk:
+    """Нормализация громкости части с пересчетом порога энергии на то же усиление."""
+    samples = pcm_to_mono_float(chunk.audio.raw_data, 1, PCM_SAMPLE_WIDTH)
+    gain = peak_normalize(samples)
+    audio = AudioSegment(
+        float_to_pcm16(samples),
+        frame_rate=chunk.audio.frame_rate,
+        sample_width=PCM_SAMPLE_WIDTH,
+        channels=1,
+    )
+    threshold = chunk.energy_threshold
+    if threshold is not None:
+        threshold *= gain
+    return replace(chunk, audio=audio, energy_threshold=threshold)
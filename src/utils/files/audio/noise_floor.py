@@ -0,0 +1,27 @@
+import numpy as np
+from pydub import AudioSegment
+
+from src.settings.config import settings
+from src.utils.files.audio.split_audio_on_silence import window_rms_db
+
+
+def noise_floor_energy_threshold(
+    audio_segment: AudioSegment,
+    window_ms: int = settings.audio_silence_window_ms,
+    percentile: float = settings.asr_noise_percentile,
+    ratio: float = settings.asr_energy_ratio,
+) -> float:
+    """Порог энергии речи по уровню шума записи.
+
+    Уровень шума - percentile-й процентиль RMS окон (тихие окна между
+    фразами), порог - шум, умноженный на ratio, в единицах RMS сэмплов.
+    Окна тише порога по краям части не отправляются на распознавание
+    (trim_to_speech).
+    """
+    levels_db = window_rms_db(audio_segment, window_ms)
+    if not len(levels_db):
+        return 0.0
+
+    noise_db = float(np.percentile(levels_db, percentile))
+    full_scale = float(1 << (8 * audio_segment.sample_width - 1))
+    return full_scale * 10 ** (noise_db / 20) * ratio
@@ -0,0 +1,165 @@
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.utils.files.audio.decode_audio_ffmpeg import PCM_FRAME_RATE
+
+# Полуширина фильтра ресемплинга в переходах через ноль sinc
+RESAMPLE_ZERO_CROSSINGS = 10
+RESAMPLE_KAISER_BETA = 5.0
+# Запас до полной шкалы при нормализации, как у AudioSegment.normalize
+NORMALIZE_HEADROOM_DB = 0.1
+
+INT16_FULL_SCALE = 32768.0
+
+
+def preprocess_pcm(
+    data: bytes,
+    sample_rate: int,
+    channels: int,
+    sample_width: int,
+    target_rate: int = PCM_FRAME_RATE,
+    normalize: bool = True,
+) -> bytes:
+    """Подготовка PCM к распознаванию: моно, target_rate, s16le, нормализация пика.
+
+    Заменяет цепочку set_channels/set_frame_rate/set_sample_width/normalize
+    pydub: вместо копии на каждом шаге - один буфер float32 в шкале int16,
+    над которым даунмикс, полифазный ресемплинг и нормализация выполняются
+    векторно, и одно преобразование в int16 в конце.
+    """
+    samples = pcm_to_mono_float(data, channels, sample_width)
+    samples = resample_poly(samples, target_rate, sample_rate)
+    if normalize:
+        peak_normalize(samples)
+    return float_to_pcm16(samples)
+
+
+def pcm_to_mono_float(data: bytes, channels: int, sample_width: int) -> np.ndarray:
+    """Интерливированный PCM в моно float32 в шкале int16 (среднее каналов).
+
+    Каналы складываются сразу в один моно буфер float32, без промежуточного
+    многоканального массива.
+    """
+    match sample_width:
+        case 1:
+            frames = np.frombuffer(data, dtype=np.uint8)
+        case 2:
+            frames = np.frombuffer(data, dtype="<i2")
+        case 3:
+            frames = np.frombuffer(data, dtype=np.uint8)
+        case 4:
+            frames = np.frombuffer(data, dtype="<i4")
+        case _:
+            raise ValueError(f"Неподдерживаемая разрядность PCM: {sample_width} байт")
+
+    if sample_width == 3:
+        # Старший байт со знаком, младшие два - беззнаковые
+        raw = frames[: len(frames) - len(frames) % 3].reshape(-1, 3)
+        frames = raw[:, 2].astype(np.int8).astype("<i4") << 16
+        frames |= raw[:, 1].astype("<i4") << 8
+        frames |= raw[:, 0]
+
+    frames = frames[: len(frames) - len(frames) % channels].reshape(-1, channels)
+    samples = frames[:, 0].astype(np.float32)
+    for channel in range(1, channels):
+        samples += frames[:, channel]
+
+    # Приведение к шкале int16 и усреднение каналов одним умножением
+    offset, scale = {1: (128.0, 256.0), 2: (0.0, 1.0), 3: (0.0, 1 / 256)}.get(
+        sample_width, (0.0, 1 / 65536)
+    )
+    if offset:
+        samples -= offset * channels
+    samples *= scale / channels
+    return samples
+
+
+def resample_poly(samples: np.ndarray, up: int, down: int) -> np.ndarray:
+    """Полифазный ресемплинг в up/down раз с антиалиасинговым FIR фильтром.
+
+    Выход m - свертка входа с фазой (m * down + L) % up фильтра, где L -
+    полуширина фильтра. Фазы повторяются с периодом up, а окна входа для
+    соседних периодов сдвинуты на down, поэтому весь ресемплинг - одно
+    умножение матрицы окон входа (вид на буфер со сдвигом строк) на
+    разреженную матрицу фаз.
+    """
+    factor = gcd(up, down)
+    up, down = up // factor, down // factor
+    if up == down:
+        return samples
+
+    taps = _lowpass_filter(up, down)
+    half_len = (len(taps) - 1) // 2
+    taps_per_phase = -(-len(taps) // up)
+    n_out = -(-len(samples) * up // down)
+
+    # phases[p, k] = taps[p + k * up]
+    padded_taps = np.zeros(taps_per_phase * up, dtype=np.float32)
+    padded_taps[: len(taps)] = taps
+    phases = padded_taps.reshape(taps_per_phase, up).T
+
+    # Строка матрицы окон - group выходов подряд (целое число периодов фаз),
+    # чтобы окна соседних строк перекрывались не больше чем на длину фильтра
+    periods = max(1, -(-taps_per_phase // down))
+    group, stride = up * periods, down * periods
+
+    columns = np.arange(group)
+    positions = columns * down + half_len
+    phase, base = positions % up, positions // up
+    width = int(base.max()) + taps_per_phase + 1
+
+    # weights[base_j - k + taps_per_phase, j] = phases[phase_j, k]
+    k = np.arange(taps_per_phase)[:, None]
+    weights = np.zeros((width, group), dtype=np.float32)
+    weights[base[None, :] - k + taps_per_phase, columns[None, :]] = phases[phase].T
+
+    rows = -(-n_out // group)
+    padded = np.zeros(
+        max((rows - 1) * stride + width, len(samples) + taps_per_phase),
+        dtype=np.float32,
+    )
+    padded[taps_per_phase : taps_per_phase + len(samples)] = samples
+    windows = sliding_window_view(padded, width)[::stride][:rows]
+
+    return (windows @ weights).reshape(-1)[:n_out]
+
+
+def peak_normalize(
+    samples: np.ndarray, headroom_db: float = NORMALIZE_HEADROOM_DB
+) -> float:
+    """Нормализация пика float32 буфера в шкале int16 на месте.
+
+    Возвращает примененный коэффициент усиления (1.0 для тишины).
+    """
+    if not len(samples):
+        return 1.0
+    peak = float(np.abs(samples).max())
+    if peak == 0:
+        return 1.0
+
+    gain = INT16_FULL_SCALE * 10 ** (-headroom_db / 20) / peak
+    samples *= gain
+    return gain
+
+
+def float_to_pcm16(samples: np.ndarray) -> bytes:
+    """float32 в шкале int16 в PCM s16le с ограничением на месте."""
+    np.clip(samples, -INT16_FULL_SCALE, INT16_FULL_SCALE - 1, out=samples)
+    return samples.astype("<i2").tobytes()
+
+
+@lru_cache(maxsize=16)
+def _lowpass_filter(up: int, down: int) -> np.ndarray:
+    """Windowed-sinc фильтр Кайзера с частотой среза 1 / max(up, down).
+
+    Усиление на нулевой частоте равно up, чтобы каждая фаза сохраняла уровень.
+    """
+    max_rate = max(up, down)
+    half_len = RESAMPLE_ZERO_CROSSINGS * max_rate
+    n = np.arange(-half_len, half_len + 1)
+    taps = np.sinc(n / max_rate) * np.kaiser(len(n), RESAMPLE_KAISER_BETA)
+    taps *= up / taps.sum()
+    return taps.astype(np.float32)
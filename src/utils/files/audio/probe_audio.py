@@ -0,0 +1,107 @@
+import json
+import subprocess
+import wave
+from dataclasses import dataclass
+
+from src.settings.config import settings
+
+
+class InvalidAudioError(ValueError):
+    """Файл не является аудио, которое можно обработать."""
+
+
+@dataclass
+class AudioProbe:
+    """Параметры аудио, прочитанные из заголовков контейнера."""
+
+    duration_seconds: float
+    sample_rate: int
+    channels: int
+    codec: str
+    # Заголовок разобран модулем wave: PCM читается напрямую, без ffmpeg.
+    # Float и WAVE_FORMAT_EXTENSIBLE WAV wave не читает, их параметры из ffprobe
+    wave_readable: bool = False
+
+
+def probe_audio(file_path: str) -> AudioProbe:
+    """Чтение длительности и формата аудио без декодирования.
+
+    WAV читается из RIFF заголовка модулем wave, остальные форматы - через
+    ffprobe (метаданные контейнера и первого аудио потока).
+    """
+    try:
+        return _probe_wav(file_path)
+    except (wave.Error, EOFError):
+        return _probe_ffprobe(file_path)
+
+
+def preflight_audio(file_path: str) -> AudioProbe:
+    """Проверка аудио до декодирования и распознавания.
+
+    Выбрасывает InvalidAudioError, если файл не читается как аудио, пуст
+    или длиннее settings.audio_max_duration_seconds.
+    """
+    probe = probe_audio(file_path)
+
+    if probe.duration_seconds <= 0 or probe.sample_rate <= 0 or probe.channels <= 0:
+        raise InvalidAudioError("Файл аудио пуст или имеет нулевую длительность")
+    if probe.duration_seconds > settings.audio_max_duration_seconds:
+        raise InvalidAudioError(
+            f"Запись слишком длинная ({probe.duration_seconds / 60:.1f} мин). "
+            f"Максимальная длительность: "
+            f"{settings.audio_max_duration_seconds / 60:.0f} мин"
+        )
+    return probe
+
+
+def _probe_wav(file_path: str) -> AudioProbe:
+    with wave.open(file_path, "rb") as wav_file:
+        sample_rate = wav_file.getframerate()
+        return AudioProbe(
+            duration_seconds=wav_file.getnframes() / sample_rate if sample_rate else 0,
+            sample_rate=sample_rate,
+            channels=wav_file.getnchannels(),
+            codec=f"pcm_s{wav_file.getsampwidth() * 8}le",
+            wave_readable=True,
+        )
+
+
+def _probe_ffprobe(file_path: str) -> AudioProbe:
+    command = [
+        settings.ffprobe_binary,
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "format=duration:stream=codec_name,sample_rate,channels,duration",
+        "-of",
+        "json",
+        file_path,
+    ]
+    try:
+        completed = subprocess.run(
+            command, capture_output=True, text=True, timeout=30, check=False
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise InvalidAudioError(f"Не удалось прочитать параметры аудио: {e}")
+
+    if completed.returncode != 0:
+        raise InvalidAudioError(
+            f"Не удалось прочитать параметры аудио: {completed.stderr.strip()}"
+        )
+
+    data = json.loads(completed.stdout or "{}")
+    streams = data.get("streams") or []
+    if not streams:
+        raise InvalidAudioError("В файле нет аудио потока")
+
+    stream = streams[0]
+    # Длительность контейнера есть почти всегда, у потока - не во всех форматах
+    duration = data.get("format", {}).get("duration") or stream.get("duration")
+    return AudioProbe(
+        duration_seconds=float(duration or 0),
+        sample_rate=int(stream.get("sample_rate") or 0),
+        channels=int(stream.get("channels") or 0),
+        codec=stream.get("codec_name", ""),
+    )
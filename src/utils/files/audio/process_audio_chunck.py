@@ -1,35 +1,32 @@
-import os
-import tempfile
-
-import speech_recognition as sr
-
-
-def process_audio_chunk(audio_chunk, chunk_number, total_chunks):
-    """Обработка одного фрагмента аудио"""
-    r = sr.Recognizer()
-
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_wav:
-        temp_wav_path = temp_wav.name
-
-    try:
-        # Экспортируем фрагмент в WAV
-        audio_chunk.export(temp_wav_path, format="wav")
-
-        with sr.AudioFile(temp_wav_path) as source:
-            r.adjust_for_ambient_noise(source, duration=0.5)
-            audio = r.record(source)
-
-            try:
-                text = r.recognize_google(audio, language="ru-RU")
-                print(f"Обработан фрагмент {chunk_number}/{total_chunks}")
-                return text
-            except sr.UnknownValueError:
-                print(f"Фрагмент {chunk_number}/{total_chunks}: речь не распознана")
-                return ""
-            except sr.RequestError as e:
-                print(f"Ошибка API для фрагмента {chunk_number}: {e}")
-                return ""
-
-    finally:
-        if os.path.exists(temp_wav_path):
-            os.remove(temp_wav_path)
+import logging
+
+from src.services.asr.asr_backends import get_asr_backend
+from src.services.asr.base import AsrBackend
+
+logger = logging.getLogger(__name__)
+
+
+def process_audio_chunk(
+    audio_chunk,
+    chunk_number,
+    total_chunks,
+    backend: AsrBackend | None = None,
+    energy_threshold: float | None = None,
+):
+    """Обработка одного фрагмента аудио (PCM s16 mono) бэкендом распознавания
+
+    energy_threshold - порог энергии, откалиброванный один раз на запись.
+    Ошибки бэкенда пробрасываются, чтобы часть можно было повторить.
+    """
+    backend = backend or get_asr_backend()
+    # При потоковом декодировании общее число частей заранее неизвестно
+    total_chunks = total_chunks or "?"
+
+    text = backend.transcribe(
+        audio_chunk.raw_data, audio_chunk.frame_rate, energy_threshold
+    )
+    if text:
+        logger.debug(f"Обработан фрагмент {chunk_number}/{total_chunks}")
+    else:
+        logger.debug(f"Фрагмент {chunk_number}/{total_chunks}: речь не распознана")
+    return text
@@ -0,0 +1,116 @@
+import numpy as np
+from pydub import AudioSegment
+
+from src.settings.config import settings
+
+# Количество окон, обрабатываемых за раз, чтобы не копировать запись целиком
+RMS_BLOCK_WINDOWS = 4096
+
+
+def window_rms_db(audio_segment: AudioSegment, window_ms: int) -> np.ndarray:
+    """RMS энергия окон по window_ms в dBFS (0 - максимальная громкость)."""
+    sample_width = audio_segment.sample_width
+    if sample_width == 1:
+        # 8-битный PCM беззнаковый
+        samples = np.frombuffer(audio_segment.raw_data, dtype=np.uint8)
+        offset = 128.0
+    else:
+        samples = np.frombuffer(audio_segment.raw_data, dtype=f"<i{sample_width}")
+        offset = 0.0
+    samples = samples.reshape(-1, audio_segment.channels)
+
+    window = max(1, audio_segment.frame_rate * window_ms // 1000)
+    windows = -(-len(samples) // window)
+    rms = np.empty(windows, dtype=np.float64)
+
+    block = window * RMS_BLOCK_WINDOWS
+    for start in range(0, len(samples), block):
+        part = samples[start : start + block].astype(np.float64).mean(axis=1)
+        part -= offset
+        count = -(-len(part) // window)
+        part = np.pad(part, (0, count * window - len(part)))
+        first = start // window
+        rms[first : first + count] = np.sqrt(
+            np.mean(np.square(part.reshape(count, window)), axis=1)
+        )
+
+    full_scale = float(1 << (8 * sample_width - 1))
+    return 20 * np.log10(np.maximum(rms / full_scale, 1e-10))
+
+
+def split_audio_on_silence(
+    audio_segment: AudioSegment,
+    max_duration_seconds: float = settings.audio_chunk_max_seconds,
+    min_duration_seconds: float = settings.audio_chunk_min_seconds,
+    silence_threshold_db: float = settings.audio_silence_threshold_db,
+    window_ms: int = settings.audio_silence_window_ms,
+) -> list[AudioSegment]:
+    """Разделить аудио на части не длиннее max_duration_seconds по паузам в речи.
+
+    Часть режется в последней тихой точке (RMS окна ниже silence_threshold_db)
+    между min_duration_seconds и max_duration_seconds от ее начала. Если пауз
+    нет, часть режется по max_duration_seconds. Полностью тихие части
+    отбрасываются.
+    """
+    ranges = silence_split_ranges(
+        audio_segment,
+        max_duration_seconds,
+        min_duration_seconds,
+        silence_threshold_db,
+        window_ms,
+    )
+    return [audio_segment[start:end] for start, end in ranges]
+
+
+def silence_split_ranges(
+    audio_segment: AudioSegment,
+    max_duration_seconds: float,
+    min_duration_seconds: float,
+    silence_threshold_db: float,
+    window_ms: int,
+) -> list[tuple[int, int]]:
+    """Границы частей split_audio_on_silence в миллисекундах."""
+    silent = window_rms_db(audio_segment, window_ms) < silence_threshold_db
+    max_windows, min_windows = chunk_window_limits(
+        max_duration_seconds, min_duration_seconds, window_ms
+    )
+    silent_indices = np.flatnonzero(silent)
+
+    ranges = []
+    start = 0
+    while start < len(silent):
+        end = next_cut(silent_indices, start, len(silent), min_windows, max_windows)
+        if not silent[start:end].all():
+            ranges.append((start * window_ms, min(end * window_ms, len(audio_segment))))
+        start = end
+
+    return ranges
+
+
+def chunk_window_limits(
+    max_duration_seconds: float, min_duration_seconds: float, window_ms: int
+) -> tuple[int, int]:
+    """Максимальная и минимальная длина части в окнах RMS."""
+    max_windows = max(1, int(max_duration_seconds * 1000 // window_ms))
+    min_windows = min(max_windows, int(min_duration_seconds * 1000 // window_ms))
+    return max_windows, max(min_windows, 1)
+
+
+def next_cut(
+    silent_indices: np.ndarray,
+    start: int,
+    total: int,
+    min_windows: int,
+    max_windows: int,
+) -> int:
+    """Окно, перед которым заканчивается часть, начатая в окне start."""
+    end = start + max_windows
+    if end >= total:
+        return total
+
+    # Режем перед последним тихим окном в допустимом диапазоне длины,
+    # следующая часть начнется с паузы
+    lo, hi = np.searchsorted(silent_indices, [start + min_windows, end])
+    if hi > lo:
+        return int(silent_indices[hi - 1])
+    return end
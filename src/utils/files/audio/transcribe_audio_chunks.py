@@ -0,0 +1,89 @@
+import heapq
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from src.settings.config import settings
+from src.utils.files.audio.process_audio_chunck import process_audio_chunk
+
+logger = logging.getLogger(__name__)
+
+
+def transcribe_audio_chunks(
+    chunks: Iterable,
+    transcribe: Callable[..., str] = process_audio_chunk,
+    max_workers: int = settings.speech_workers,
+    max_retries: int = settings.speech_max_retries,
+    retry_backoff: float = settings.speech_retry_backoff,
+) -> list[str | None]:
+    """Параллельное распознавание частей аудио с сохранением порядка.
+
+    Одновременно выполняется не более max_workers частей, лимит частоты
+    запросов к сетевому API соблюдает сам бэкенд распознавания. Упавшая часть
+    повторяется до max_retries раз с экспоненциальной задержкой; пока она ждет
+    повтора, поток свободен для других частей. Для частей, которые так и не удалось
+    распознать, возвращается None.
+
+    chunks может быть генератором: следующая часть берется только когда
+    освобождается поток, поэтому в памяти держатся лишь части в работе.
+    """
+    total = len(chunks) if isinstance(chunks, Sized) else None
+    source = enumerate(chunks)
+    pending: dict[int, object] = {}
+    results: list[str | None] = []
+    attempts: dict[int, int] = {}
+    ready: deque[int] = deque()
+    delayed: list[tuple[float, int]] = []
+    running: dict[Future, int] = {}
+    exhausted = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while not exhausted or ready or delayed or running:
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                ready.append(heapq.heappop(delayed)[1])
+
+            while len(running) < max_workers:
+                if ready:
+                    index = ready.popleft()
+                elif not exhausted:
+                    item = next(source, None)
+                    if item is None:
+                        exhausted = True
+                        continue
+                    index, pending[index] = item
+                    results.append(None)
+                else:
+                    break
+
+                future = executor.submit(transcribe, pending[index], index + 1, total)
+                running[future] = index
+
+            timeout = max(0.0, delayed[0][0] - now) if delayed else None
+            if not running:
+                if delayed:
+                    time.sleep(timeout)
+                continue
+
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    attempts[index] = attempts.get(index, 0) + 1
+                    if attempts[index] <= max_retries:
+                        delay = retry_backoff * 2 ** (attempts[index] - 1)
+                        logger.warning(
+                            f"Ошибка распознавания части {index + 1}: {e}. "
+                            f"Повтор через {delay:.1f} сек"
+                        )
+                        heapq.heappush(delayed, (time.monotonic() + delay, index))
+                        continue
+
+                    logger.error(f"Часть {index + 1} не распознана: {e}")
+                del pending[index]
+
+    return results
@@ -0,0 +1,33 @@
+import numpy as np
+from pydub import AudioSegment
+
+from src.settings.config import settings
+from src.utils.files.audio.split_audio_on_silence import window_rms_db
+
+
+def trim_to_speech(
+    audio_segment: AudioSegment,
+    energy_threshold: float,
+    window_ms: int = settings.audio_silence_window_ms,
+    padding_ms: int = settings.asr_trim_padding_ms,
+) -> AudioSegment | None:
+    """Обрезка окон тише energy_threshold по краям фрагмента.
+
+    energy_threshold - в единицах RMS сэмплов (noise_floor_energy_threshold).
+    Вокруг первого и последнего громкого окна оставляется padding_ms, чтобы не
+    срезать начало и конец слов. None - во фрагменте нет ни одного окна
+    громче порога, и отправлять его на распознавание незачем.
+    """
+    levels_db = window_rms_db(audio_segment, window_ms)
+    if not len(levels_db) or energy_threshold <= 0:
+        return audio_segment
+
+    full_scale = float(1 << (8 * audio_segment.sample_width - 1))
+    threshold_db = 20 * np.log10(energy_threshold / full_scale)
+    loud = np.flatnonzero(levels_db > threshold_db)
+    if not len(loud):
+        return None
+
+    start = max(0, int(loud[0]) * window_ms - padding_ms)
+    end = min(len(audio_segment), (int(loud[-1]) + 1) * window_ms + padding_ms)
+    return audio_segment[start:end]
@@ -0,0 +1,34 @@
+import importlib
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FileExtractor:
+    """Плагин извлечения текста из файлов одного вида.
+
+    target - функция извлечения в виде "модуль:функция". Модуль (и его тяжелые
+    библиотеки: pypdf, pytesseract, pydub...) импортируется при первом
+    извлечении, а не при импорте реестра. magic проверяет первые байты файла
+    (заголовок и путь к файлу), content_types - заявленные типы, по которым
+    плагин выбирается, если сигнатура не распознана.
+    """
+
+    name: str
+    target: str
+    content_types: frozenset[str]
+    magic: Callable[[bytes, str], bool] | None = None
+    # Передавать ли функции sha256 файла (ключ кэша расшифровок аудио)
+    pass_content_hash: bool = False
+
+    def load(self) -> Callable[..., str]:
+        """Функция извлечения; модуль импортируется при первом вызове."""
+        module_name, function_name = self.target.split(":")
+        return getattr(importlib.import_module(module_name), function_name)
+
+    def extract(self, file_path: str, content_hash: str | None = None) -> str:
+        """Извлечение текста из файла."""
+        extract = self.load()
+        if self.pass_content_hash:
+            return extract(file_path, content_hash)
+        return extract(file_path)
@@ -0,0 +1,176 @@
+import codecs
+import logging
+import zipfile
+
+from src.utils.files.extractors.file_extractor import FileExtractor
+
+logger = logging.getLogger(__name__)
+
+# Сколько байт начала файла читается для определения типа
+SNIFF_BYTES = 4096
+
+PDF_SIGNATURE = b"%PDF-"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+GIF_SIGNATURES = (b"GIF87a", b"GIF89a")
+ZIP_SIGNATURE = b"PK\x03\x04"
+UTF8_BOM = b"\xef\xbb\xbf"
+UTF16_LE_BOM = b"\xff\xfe"
+# Бренды контейнера MP4 (ftyp) с аудиодорожкой, которую декодирует ffmpeg
+MP4_BRANDS = frozenset(
+    {b"M4A ", b"M4B ", b"mp41", b"mp42", b"isom", b"iso2", b"dash", b"3gp4", b"3gp5"}
+)
+HTML_PREFIXES = (b"<!doctype html", b"<html", b"<head", b"<body")
+
+
+class UnsupportedFileTypeError(Exception):
+    """Ни сигнатура, ни заявленный content type файла не поддерживаются."""
+
+
+def _is_pdf(header: bytes, file_path: str) -> bool:
+    if header.startswith(PDF_SIGNATURE):
+        return True
+    # Спецификация допускает мусор перед заголовком в первых 1024 байтах, но
+    # строку "%PDF-" может содержать и текст, поэтому со смещением сигнатура
+    # принимается только у файла с расширением .pdf
+    return file_path.lower().endswith(".pdf") and PDF_SIGNATURE in header[:1024]
+
+
+def _is_image(header: bytes, file_path: str) -> bool:
+    return header.startswith((PNG_SIGNATURE, JPEG_SIGNATURE, *GIF_SIGNATURES))
+
+
+def _is_docx(header: bytes, file_path: str) -> bool:
+    # DOCX - ZIP архив, от других архивов (xlsx, zip) отличается word/document.xml;
+    # читается только центральный каталог архива
+    if not header.startswith(ZIP_SIGNATURE):
+        return False
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            return "word/document.xml" in archive.NameToInfo
+    except zipfile.BadZipFile:
+        return False
+
+
+def _is_audio(header: bytes, file_path: str) -> bool:
+    if header.startswith((b"ID3", b"OggS", b"fLaC")):
+        return True
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return True
+    if header[4:8] == b"ftyp":
+        return header[8:12] in MP4_BRANDS
+    # Синхрослово кадра MPEG аудио или ADTS AAC (11 единичных бит);
+    # FF FE - BOM текста в UTF-16
+    return (
+        len(header) >= 2
+        and header[0] == 0xFF
+        and header[1] & 0xE0 == 0xE0
+        and not header.startswith(UTF16_LE_BOM)
+    )
+
+
+def _is_html(header: bytes, file_path: str) -> bool:
+    start = header.removeprefix(UTF8_BOM).lstrip()[:16].lower()
+    return start.startswith(HTML_PREFIXES)
+
+
+def _is_text(header: bytes) -> bool:
+    """Начало файла - текст в UTF-8 (без нулевых байт)."""
+    if b"\x00" in header:
+        return False
+    try:
+        # Инкрементальный декодер не считает ошибкой символ, обрезанный на границе
+        codecs.getincrementaldecoder("utf-8")().decode(header)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+TEXT_EXTRACTOR = FileExtractor(
+    name="text",
+    target="src.utils.files.text.read_text_file:read_text_file",
+    content_types=frozenset({"text/plain", "text/markdown", "text/x-markdown"}),
+)
+
+# Порядок важен: сигнатуры проверяются сверху вниз
+FILE_EXTRACTORS = (
+    FileExtractor(
+        name="pdf",
+        target="src.utils.files.text.extract_pdf_text:extract_pdf_document",
+        content_types=frozenset({"application/pdf"}),
+        magic=_is_pdf,
+    ),
+    FileExtractor(
+        name="image",
+        target="src.utils.files.image.ocr_image:ocr_image",
+        content_types=frozenset({"image/png", "image/jpeg", "image/jpg", "image/gif"}),
+        magic=_is_image,
+    ),
+    FileExtractor(
+        name="docx",
+        target="src.utils.files.text.extract_docx_text:extract_docx_text",
+        content_types=frozenset(
+            {
+                "application/vnd.openxmlformats-officedocument"
+                ".wordprocessingml.document"
+            }
+        ),
+        magic=_is_docx,
+    ),
+    FileExtractor(
+        name="audio",
+        target="src.utils.files.audio.extract_audio_text:extract_audio_text",
+        content_types=frozenset(
+            {
+                "audio/mpeg",
+                "audio/wav",
+                "audio/ogg",
+                "audio/mp3",
+                "audio/mp4",
+                "audio/x-m4a",
+                "audio/x-flac",
+                "audio/flac",
+            }
+        ),
+        magic=_is_audio,
+        pass_content_hash=True,
+    ),
+    FileExtractor(
+        name="html",
+        target="src.utils.files.text.extract_html_text:extract_html_text",
+        content_types=frozenset({"text/html"}),
+        magic=_is_html,
+    ),
+    TEXT_EXTRACTOR,
+)
+
+
+def detect_file_extractor(file_path: str, content_type: str | None) -> FileExtractor:
+    """Выбор плагина извлечения для файла.
+
+    Сначала тип определяется по сигнатуре в первых SNIFF_BYTES байтах, затем по
+    заявленному content type (параметры вроде charset отбрасываются). Файл
+    неизвестного типа, начало которого - текст UTF-8, читается как текст.
+    Иначе выбрасывается UnsupportedFileTypeError.
+    """
+    with open(file_path, "rb") as f:
+        header = f.read(SNIFF_BYTES)
+    declared = (content_type or "").split(";")[0].strip().lower()
+
+    for extractor in FILE_EXTRACTORS:
+        if extractor.magic is not None and extractor.magic(header, file_path):
+            if declared not in extractor.content_types:
+                logger.debug(
+                    f"Тип файла по сигнатуре: {extractor.name}, заявлен: {declared}"
+                )
+            return extractor
+
+    for extractor in FILE_EXTRACTORS:
+        if declared in extractor.content_types:
+            return extractor
+
+    if _is_text(header):
+        logger.debug(f"Файл типа {declared} читается как текст")
+        return TEXT_EXTRACTOR
+
+    raise UnsupportedFileTypeError(f"Неподдерживаемый тип файла: {content_type}")
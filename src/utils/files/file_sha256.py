@@ -0,0 +1,12 @@
+import hashlib
+
+FILE_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 содержимого файла, читаемого кусками."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(FILE_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
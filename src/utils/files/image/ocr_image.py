@@ -0,0 +1,56 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytesseract
+from PIL import Image
+
+from src.settings.config import settings
+from src.utils.files.image.preprocess_for_ocr import preprocess_for_ocr
+from src.utils.files.image.split_image_bands import split_image_bands
+from src.utils.files.image.tesseract_languages import ocr_language
+
+logger = logging.getLogger(__name__)
+
+
+def ocr_image(
+    file_path: str,
+    tile_height: int = settings.ocr_tile_height,
+    workers: int = settings.ocr_workers,
+) -> str:
+    """Распознавание текста на изображении из файла."""
+    with Image.open(file_path) as image:
+        return recognize_image(image, tile_height, workers)
+
+
+def recognize_image(
+    image: Image.Image,
+    tile_height: int = settings.ocr_tile_height,
+    workers: int = settings.ocr_workers,
+) -> str:
+    """Распознавание текста на изображении.
+
+    Изображение подготавливается (preprocess_for_ocr), высокие изображения
+    (фото доски, длинные скриншоты) режутся на полосы по пустым строкам, и
+    полосы распознаются параллельно: каждый вызов Tesseract - отдельный
+    процесс, поэтому потоков достаточно.
+    """
+    prepared = preprocess_for_ocr(image)
+
+    language = ocr_language()
+    bands = split_image_bands(prepared, tile_height)
+    logger.debug(
+        f"OCR {prepared.width}x{prepared.height}, полос: {len(bands)}, "
+        f"язык: {language or 'по умолчанию'}"
+    )
+
+    def recognize(band: Image.Image) -> str:
+        if language:
+            return pytesseract.image_to_string(band, lang=language)
+        return pytesseract.image_to_string(band)
+
+    if len(bands) == 1:
+        return recognize(bands[0])
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(bands))) as executor:
+        texts = list(executor.map(recognize, bands))
+    return "\n".join(text.strip("\n") for text in texts)
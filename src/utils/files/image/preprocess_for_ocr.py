@@ -0,0 +1,58 @@
+import numpy as np
+from PIL import Image, ImageOps
+
+from src.settings.config import settings
+
+
+def preprocess_for_ocr(
+    image: Image.Image,
+    target_dpi: int = settings.ocr_target_dpi,
+    max_pixels: int = settings.ocr_max_pixels,
+    binarize: bool = settings.ocr_binarize,
+) -> Image.Image:
+    """Подготовка изображения к OCR: поворот по EXIF, уменьшение, оттенки серого,
+    бинаризация.
+
+    Изображение уменьшается до target_dpi (если DPI известен и больше) и до
+    max_pixels пикселей - Tesseract не точнее на избыточном разрешении, а
+    время растет с числом пикселей. Ограничивается площадь, а не сторона,
+    чтобы не уменьшать текст длинных скриншотов. Порог бинаризации
+    выбирается методом Оцу по гистограмме.
+    """
+    image = ImageOps.exif_transpose(image)
+
+    scale = 1.0
+    dpi = image.info.get("dpi")
+    if dpi and dpi[0] and dpi[0] > target_dpi:
+        scale = target_dpi / float(dpi[0])
+    scale = min(scale, (max_pixels / (image.width * image.height)) ** 0.5)
+
+    image = image.convert("L")
+    if scale < 1:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.Resampling.LANCZOS)
+
+    if binarize:
+        threshold = otsu_threshold(image)
+        image = image.point(lambda value: 255 if value > threshold else 0)
+    return image
+
+
+def otsu_threshold(image: Image.Image) -> int:
+    """Порог Оцу для изображения в оттенках серого."""
+    histogram = np.asarray(image.histogram()[:256], dtype=np.float64)
+    total = histogram.sum()
+    if not total:
+        return 127
+
+    levels = np.arange(256)
+    weight_background = np.cumsum(histogram)
+    weight_foreground = total - weight_background
+    sum_background = np.cumsum(histogram * levels)
+    mean_background = sum_background / np.maximum(weight_background, 1)
+    mean_foreground = (sum_background[-1] - sum_background) / np.maximum(
+        weight_foreground, 1
+    )
+    between = weight_background * weight_foreground
+    between *= (mean_background - mean_foreground) ** 2
+    return int(np.argmax(between))
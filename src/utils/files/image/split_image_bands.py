@@ -0,0 +1,33 @@
+import numpy as np
+from PIL import Image
+
+# Доля темных пикселей, при которой строка изображения еще считается пустой
+BLANK_ROW_DARK_SHARE = 0.002
+
+
+def split_image_bands(image: Image.Image, max_height: int) -> list[Image.Image]:
+    """Разрезание высокого изображения на полосы во всю ширину не выше max_height.
+
+    Разрез ставится на самой нижней пустой строке во второй половине полосы,
+    чтобы не резать строки текста. Строка пустая, если темных пикселей в ней
+    не больше BLANK_ROW_DARK_SHARE ширины (одиночный шум после бинаризации).
+    Если пустой строки нет, полоса режется по max_height.
+    """
+    if image.height <= max_height:
+        return [image]
+
+    pixels = np.asarray(image.convert("L"))
+    blank = (pixels < 128).sum(axis=1) <= image.width * BLANK_ROW_DARK_SHARE
+
+    bands = []
+    top = 0
+    while image.height - top > max_height:
+        bottom = top + max_height
+        candidates = np.flatnonzero(blank[top + max_height // 2 : bottom])
+        if len(candidates):
+            bottom = top + max_height // 2 + int(candidates[-1]) + 1
+        bands.append(image.crop((0, top, image.width, bottom)))
+        top = bottom
+
+    bands.append(image.crop((0, top, image.width, image.height)))
+    return bands
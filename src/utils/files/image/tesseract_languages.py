@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+import pytesseract
+
+
+@lru_cache(maxsize=1)
+def tesseract_languages() -> frozenset[str]:
+    """Установленные языки Tesseract.
+
+    get_languages запускает процесс tesseract, поэтому список читается один
+    раз на процесс.
+    """
+    return frozenset(pytesseract.get_languages(config=""))
+
+
+def ocr_language() -> str | None:
+    """Языки распознавания: rus+eng, если установлены, иначе eng или по умолчанию."""
+    languages = tesseract_languages()
+    if "rus" in languages and "eng" in languages:
+        return "rus+eng"
+    if "eng" in languages:
+        return "eng"
+    return None
@@ -0,0 +1,65 @@
+import asyncio
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.settings.config import settings
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """Загружаемый файл превышает max_file_size."""
+
+
+class AsyncReadable(Protocol):
+    async def read(self, size: int = -1) -> bytes: ...
+
+
+@dataclass
+class SpooledUpload:
+    """Загрузка, сохраненная на диск."""
+
+    path: str
+    size: int
+    sha256: str
+
+
+async def spool_upload(
+    file: AsyncReadable,
+    path: str,
+    max_size: int = settings.max_file_size,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> SpooledUpload:
+    """Потоково сохраняет загрузку в path кусками по chunk_size.
+
+    Размер проверяется по мере чтения: как только он превышает max_size,
+    запись прерывается, частичный файл удаляется и выбрасывается
+    UploadTooLargeError. За тот же проход считается sha256 содержимого.
+    """
+    declared_size = getattr(file, "size", None)
+    if declared_size is not None and declared_size > max_size:
+        raise UploadTooLargeError(upload_too_large_message(max_size))
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as out:
+            while chunk := await file.read(chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(upload_too_large_message(max_size))
+                digest.update(chunk)
+                # Запись на диск не блокирует event loop
+                await asyncio.to_thread(out.write, chunk)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+
+    return SpooledUpload(path=path, size=size, sha256=digest.hexdigest())
+
+
+def upload_too_large_message(max_size: int) -> str:
+    return f"Файл превышает максимальный размер {max_size / (1024 * 1024):.1f}MB"
@@ -0,0 +1,81 @@
+import zipfile
+from collections.abc import Iterator
+from typing import IO
+from xml.etree.ElementTree import iterparse
+
+W_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+PARAGRAPH = f"{W_NAMESPACE}p"
+TEXT = f"{W_NAMESPACE}t"
+TAB = f"{W_NAMESPACE}tab"
+BREAKS = (f"{W_NAMESPACE}br", f"{W_NAMESPACE}cr")
+TABLE = f"{W_NAMESPACE}tbl"
+TABLE_ROW = f"{W_NAMESPACE}tr"
+TABLE_CELL = f"{W_NAMESPACE}tc"
+
+# Разделитель ячеек строки таблицы в извлеченном тексте
+TABLE_CELL_SEPARATOR = " | "
+
+
+def iter_docx_paragraphs(file_path: str) -> Iterator[str]:
+    """Абзацы DOCX по порядку документа, строка таблицы - одна строка текста.
+
+    word/document.xml читается из архива потоком (iterparse), разобранные
+    абзацы и таблицы сразу удаляются из дерева, поэтому память не зависит
+    от размера документа, а изображения и другие части архива не читаются.
+    Ячейки строки таблицы объединяются через TABLE_CELL_SEPARATOR.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open("word/document.xml") as document:
+            yield from _iter_paragraphs(document)
+
+
+def extract_docx_text(file_path: str) -> str:
+    """Текст DOCX, каждый абзац и строка таблицы заканчиваются переводом строки."""
+    return "".join(f"{paragraph}\n" for paragraph in iter_docx_paragraphs(file_path))
+
+
+def _iter_paragraphs(document: IO[bytes]) -> Iterator[str]:
+    # Открытые элементы от корня: родитель разобранного элемента - stack[-1]
+    stack = []
+    runs: list[str] = []
+    # Открытые строки таблиц и ячейки (таблицы могут быть вложенными)
+    rows: list[list[str]] = []
+    cells: list[list[str]] = []
+
+    for event, element in iterparse(document, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            stack.append(element)
+            if tag == TABLE_ROW:
+                rows.append([])
+            elif tag == TABLE_CELL:
+                cells.append([])
+            continue
+
+        stack.pop()
+        if tag == TEXT:
+            runs.append(element.text or "")
+        elif tag == TAB:
+            runs.append("\t")
+        elif tag in BREAKS:
+            runs.append("\n")
+        elif tag == PARAGRAPH:
+            text, runs = "".join(runs), []
+            if cells:
+                cells[-1].append(text)
+            else:
+                yield text
+        elif tag == TABLE_CELL:
+            rows[-1].append(" ".join(text for text in cells.pop() if text))
+        elif tag == TABLE_ROW:
+            row = TABLE_CELL_SEPARATOR.join(rows.pop())
+            if cells:
+                cells[-1].append(row)
+            else:
+                yield row
+
+        # Абзац, строка или таблица вне строки таблицы разобраны - удаляем их
+        # из родителя (тела документа или таблицы), чтобы дерево не росло:
+        # строки большой таблицы удаляются по одной, не дожидаясь ее конца
+        if not rows and stack and tag in (PARAGRAPH, TABLE_ROW, TABLE):
+            stack[-1].remove(element)
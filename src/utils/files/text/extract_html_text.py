@@ -0,0 +1,192 @@
+import re
+from html.parser import HTMLParser
+
+# Содержимое не видно читателю или это навигация по сайту
+SKIP_TAGS = frozenset(
+    {"script", "style", "noscript", "template", "nav", "svg", "iframe", "select"}
+)
+SKIP_ROLES = frozenset({"navigation", "banner", "contentinfo", "menu", "menubar"})
+# Блоки, отделяемые от соседних пустой строкой
+PARAGRAPH_TAGS = frozenset(
+    {"p", "pre", "blockquote", "table", "ul", "ol", "dl", "figure", "title"}
+)
+# Блоки, начинающиеся с новой строки
+LINE_TAGS = frozenset(
+    {
+        "div",
+        "section",
+        "article",
+        "main",
+        "header",
+        "footer",
+        "aside",
+        "tr",
+        "dt",
+        "dd",
+        "figcaption",
+        "form",
+        "fieldset",
+        "address",
+        "caption",
+        "hr",
+    }
+)
+HEADING_TAGS = {f"h{level}": level for level in range(1, 7)}
+VOID_TAGS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta"}
+    | {"source", "track", "wbr"}
+)
+
+READ_BLOCK_CHARS = 64 * 1024
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class HtmlTextExtractor(HTMLParser):
+    """Потоковое преобразование HTML в текст для промпта.
+
+    HTML подается фрагментами через feed. Скрипты, стили и навигация
+    отбрасываются, заголовки становятся строками "# ...", элементы списков -
+    "- ..." или "1. ..." с отступом по вложенности, ячейки строки таблицы
+    объединяются через " | ". Пробельные символы схлопываются везде, кроме
+    <pre>.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: list[str] = []
+        self._line: list[str] = []
+        # Маркер строки ("# ", "- ", "1. "), добавляется, только если в строке
+        # появился текст
+        self._prefix = ""
+        self._blank_pending = False
+        self._skip_tag: str | None = None
+        self._skip_depth = 0
+        self._pre_depth = 0
+        # Открытые списки: [тег, номер последнего элемента]
+        self._lists: list[list] = []
+        self._row_cells = 0
+
+    def text(self) -> str:
+        """Результат после close()."""
+        self._end_line()
+        return "\n".join(self.lines).strip("\n") + "\n" if self.lines else ""
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth += 1
+            return
+
+        if tag in SKIP_TAGS or dict(attrs).get("role") in SKIP_ROLES:
+            if tag not in VOID_TAGS:
+                self._skip_tag, self._skip_depth = tag, 1
+            return
+
+        if tag == "br":
+            self._end_line()
+        elif tag in HEADING_TAGS:
+            self._start_block(paragraph=True)
+            self._prefix = "#" * HEADING_TAGS[tag] + " "
+        elif tag in ("ul", "ol"):
+            if not self._lists:
+                self._start_block(paragraph=True)
+            self._lists.append([tag, 0])
+        elif tag == "li":
+            self._start_block()
+            indent = "  " * max(len(self._lists) - 1, 0)
+            if self._lists and self._lists[-1][0] == "ol":
+                self._lists[-1][1] += 1
+                self._prefix = f"{indent}{self._lists[-1][1]}. "
+            else:
+                self._prefix = f"{indent}- "
+        elif tag in ("td", "th"):
+            if self._row_cells:
+                self._line.append(" | ")
+            self._row_cells += 1
+        elif tag in PARAGRAPH_TAGS:
+            self._start_block(paragraph=True)
+        elif tag in LINE_TAGS:
+            self._start_block()
+
+        if tag == "tr":
+            self._row_cells = 0
+        elif tag == "pre":
+            self._pre_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        if self._skip_tag is None and tag == "br":
+            self._end_line()
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skip_tag is not None:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if not self._skip_depth:
+                    self._skip_tag = None
+            return
+
+        if tag in ("ul", "ol") and self._lists:
+            self._lists.pop()
+            if not self._lists:
+                self._start_block(paragraph=True)
+        elif tag in HEADING_TAGS or tag in PARAGRAPH_TAGS:
+            self._start_block(paragraph=True)
+        elif tag in LINE_TAGS or tag == "li":
+            self._end_line()
+
+        if tag in HEADING_TAGS or tag == "li":
+            # Маркер пустого элемента не переносится на следующий текст
+            self._prefix = ""
+        elif tag == "pre" and self._pre_depth:
+            self._pre_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_tag is not None:
+            return
+
+        if self._pre_depth:
+            lines = data.split("\n")
+            self._line.append(lines[0])
+            for line in lines[1:]:
+                self._end_line()
+                self._line.append(line)
+            return
+
+        data = WHITESPACE_PATTERN.sub(" ", data)
+        if not self._has_text() or self._line[-1].endswith(" "):
+            data = data.lstrip(" ")
+        if data:
+            self._line.append(data)
+
+    def _has_text(self) -> bool:
+        return any(part.strip() for part in self._line)
+
+    def _start_block(self, paragraph: bool = False) -> None:
+        self._end_line()
+        if paragraph:
+            self._blank_pending = True
+
+    def _end_line(self) -> None:
+        # Маркер без текста остается для текста вложенного блока (<li><p>...)
+        if not self._has_text():
+            self._line = []
+            return
+
+        line = (self._prefix + "".join(self._line)).rstrip()
+        self._prefix = ""
+        if self._blank_pending and self.lines and self.lines[-1]:
+            self.lines.append("")
+        self.lines.append(line)
+        self._line = []
+        self._blank_pending = False
+
+
+def extract_html_text(file_path: str) -> str:
+    """Видимый текст HTML файла, файл читается и разбирается блоками."""
+    parser = HtmlTextExtractor()
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        while block := f.read(READ_BLOCK_CHARS):
+            parser.feed(block)
+    parser.close()
+    return parser.text()
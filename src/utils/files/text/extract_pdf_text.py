@@ -0,0 +1,111 @@
+import logging
+from collections.abc import Iterable
+
+from pypdf import PageObject, PdfReader
+
+from src.settings.config import settings
+from src.utils.files.image.ocr_image import recognize_image
+
+logger = logging.getLogger(__name__)
+
+
+def pdf_page_count(file_path: str) -> int:
+    """Число страниц PDF (читается только дерево страниц)."""
+    return len(PdfReader(file_path).pages)
+
+
+def has_text_layer(text: str, min_chars: int = settings.pdf_min_text_chars) -> bool:
+    """Есть ли у страницы пригодный текстовый слой (не меньше min_chars символов)."""
+    return sum(not char.isspace() for char in text) >= min_chars
+
+
+def extract_pdf_pages(file_path: str, start: int, stop: int) -> list[str | None]:
+    """Текст страниц [start, stop) PDF, None - у страницы нет текстового слоя.
+
+    Файл открывается собственным PdfReader, поэтому диапазоны страниц можно
+    извлекать параллельно в разных процессах. Страницы без текста (сканы)
+    распознаются отдельно, ocr_pdf_page.
+    """
+    reader = PdfReader(file_path)
+    stop = min(stop, len(reader.pages))
+
+    pages = []
+    for number in range(start, stop):
+        page = reader.pages[number]
+        text = page.extract_text() or ""
+        pages.append(None if _needs_ocr(page, text) else text)
+    return pages
+
+
+def ocr_pdf_page(file_path: str, number: int) -> str:
+    """Распознавание изображений страницы number PDF (страница-скан).
+
+    Если на изображениях текст не найден, возвращается текстовый слой страницы.
+    """
+    page = PdfReader(file_path).pages[number]
+    return _ocr_page_images(page, number) or page.extract_text() or ""
+
+
+def extract_pdf_text(file_path: str, max_pages: int | None = None) -> str:
+    """Текст PDF постранично, не больше max_pages первых страниц.
+
+    Страницы после max_pages не разбираются. Страницы без текстового слоя,
+    но с изображениями распознаются по встроенным изображениям, страницы с
+    текстом OCR не проходят. Текст страниц собирается в список и объединяется один раз.
+    """
+    reader = PdfReader(file_path)
+    page_count = len(reader.pages)
+    if max_pages:
+        page_count = min(page_count, max_pages)
+
+    pages = []
+    for number in range(page_count):
+        page = reader.pages[number]
+        text = page.extract_text() or ""
+        if _needs_ocr(page, text):
+            text = _ocr_page_images(page, number) or text
+        pages.append(text)
+    return join_pdf_pages(pages)
+
+
+def extract_pdf_document(file_path: str) -> str:
+    """Текст PDF с ограничением settings.pdf_max_pages (плагин извлечения PDF)."""
+    return extract_pdf_text(file_path, max_pages=settings.pdf_max_pages)
+
+
+def join_pdf_pages(pages: Iterable[str]) -> str:
+    """Объединение текста страниц, страницы разделяются переводом строки."""
+    return "\n".join(pages)
+
+
+def pdf_page_ranges(page_count: int, parts: int, min_pages: int = 1) -> list[range]:
+    """Разбиение страниц на не больше parts диапазонов по min_pages и больше."""
+    if page_count <= 0:
+        return []
+
+    size = max(min_pages, -(-page_count // max(parts, 1)))
+    return [
+        range(start, min(start + size, page_count))
+        for start in range(0, page_count, size)
+    ]
+
+
+def _needs_ocr(page: PageObject, text: str) -> bool:
+    # Список изображений читается из ресурсов страницы, без декодирования
+    return not has_text_layer(text) and len(page.images) > 0
+
+
+def _ocr_page_images(page: PageObject, number: int) -> str:
+    texts = []
+    for image_file in page.images:
+        try:
+            texts.append(recognize_image(image_file.image).strip())
+        except Exception as e:
+            logger.warning(
+                f"Не удалось распознать изображение {image_file.name} "
+                f"на странице {number + 1}: {str(e)}"
+            )
+    logger.debug(
+        f"Страница {number + 1} без текста, распознано OCR: {len(texts)} изобр."
+    )
+    return "\n".join(text for text in texts if text)
@@ -0,0 +1,4 @@
+def read_text_file(file_path: str) -> str:
+    """Текст файла в UTF-8 (обычный текст, Markdown)."""
+    with open(file_path, encoding="utf-8") as f:
+        return f.read()
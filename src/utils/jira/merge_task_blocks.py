@@ -0,0 +1,79 @@
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+TASK_BLOCK_PATTERN = re.compile(
+    r"^### ([A-Z]+)-(\d+):\s*(.*?)(?=^### [A-Z]+-\d+:|\Z)", re.DOTALL | re.MULTILINE
+)
+DEPENDENCIES_PATTERN = re.compile(r"(\*\*Зависимости:\*\*)[^\n]*")
+TASK_ID_PATTERN = re.compile(r"[A-Z]+-\d+")
+TRAILING_SEPARATOR_PATTERN = re.compile(r"(\n\s*-{3,}\s*)+$")
+
+MERGED_PREFIX = "Предлагаю создать следующие задачи:"
+
+
+def normalize_title(title: str) -> str:
+    """Нормализованный заголовок задачи для поиска дубликатов."""
+    return " ".join(re.findall(r"\w+", title.lower()))
+
+
+def merge_task_blocks(texts: list[str]) -> str:
+    """Объединить задачи из ответов модели по частям текста.
+
+    Задачи с одинаковым заголовком объединяются, номера TASK-XXX
+    перенумеровываются с сохранением ролевой сотни (Backend 0XX, Frontend 1XX,
+    QA 2XX, PM 3XX), ссылки в зависимостях переписываются на новые номера.
+    """
+    merged: list[tuple[str, str, str]] = []  # (new_id, title, body)
+    seen_titles: dict[str, str] = {}
+    role_counters: dict[tuple[str, int], int] = {}
+    id_maps: list[dict[str, str]] = []
+
+    for text in texts:
+        id_map: dict[str, str] = {}
+        for prefix, number, block in TASK_BLOCK_PATTERN.findall(text):
+            old_id = f"{prefix}-{number}"
+            title, _, body = block.strip().partition("\n")
+            key = normalize_title(title)
+
+            if key in seen_titles:
+                id_map[old_id] = seen_titles[key]
+                continue
+
+            role = int(number) // 100
+            role_counters[(prefix, role)] = role_counters.get((prefix, role), 0) + 1
+            new_id = f"{prefix}-{role * 100 + role_counters[(prefix, role)]:03d}"
+
+            id_map[old_id] = new_id
+            seen_titles[key] = new_id
+            body = TRAILING_SEPARATOR_PATTERN.sub("", "\n" + body).strip()
+            merged.append((new_id, title.strip(), body))
+
+        id_maps.append(id_map)
+
+    # Зависимости ссылаются на номера внутри своей части текста
+    owners = {}
+    for id_map in id_maps:
+        for new_id in id_map.values():
+            owners.setdefault(new_id, id_map)
+
+    blocks = []
+    for new_id, title, body in merged:
+        body = _remap_dependencies(body, owners[new_id], new_id)
+        blocks.append(f"### {new_id}: {title}\n{body}".strip())
+
+    logger.info(f"Объединено {len(merged)} задач из {len(texts)} частей")
+    return "\n\n".join([MERGED_PREFIX, *blocks])
+
+
+def _remap_dependencies(body: str, id_map: dict[str, str], task_id: str) -> str:
+    def replace(match: re.Match) -> str:
+        dependencies = []
+        for old_id in TASK_ID_PATTERN.findall(match.group(0)):
+            new_id = id_map.get(old_id)
+            if new_id and new_id != task_id and new_id not in dependencies:
+                dependencies.append(new_id)
+        return f"{match.group(1)} {', '.join(dependencies) or 'Нет'}"
+
+    return DEPENDENCIES_PATTERN.sub(replace, body)
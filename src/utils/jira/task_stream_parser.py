@@ -0,0 +1,82 @@
+import logging
+import re
+
+from src.models.parsed_task import ParsedTask
+from src.utils.jira.parse_single_task import parse_single_task
+
+logger = logging.getLogger(__name__)
+
+TASK_HEADER_PATTERN = re.compile(r"^\s*### ([A-Z]+-\d+):\s*(.*)$")
+BLOCK_END_PATTERN = re.compile(r"^\s*(---+|\*\*Зависимости:\*\*.*)\s*$")
+
+
+class TaskStreamParser:
+    """Инкрементальный парсер задач из потокового ответа модели.
+
+    Текст подается фрагментами через feed. Блок ### TASK-XXX: считается
+    завершенным, когда начинается следующий заголовок, встречается разделитель
+    --- или дописана строка **Зависимости:** (последнее поле формата задачи).
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._task_key: str | None = None
+        self._block_lines: list[str] = []
+
+    def feed(self, text: str) -> list[ParsedTask]:
+        """Добавляет фрагмент текста и возвращает задачи, блоки которых закрылись."""
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+
+        tasks = []
+        for line in lines:
+            task = self._process_line(line)
+            if task:
+                tasks.append(task)
+        return tasks
+
+    def close(self) -> list[ParsedTask]:
+        """Завершает поток и возвращает последнюю незакрытую задачу."""
+        tasks = []
+        if self._buffer:
+            task = self._process_line(self._buffer)
+            self._buffer = ""
+            if task:
+                tasks.append(task)
+
+        task = self._close_block()
+        if task:
+            tasks.append(task)
+        return tasks
+
+    def _process_line(self, line: str) -> ParsedTask | None:
+        header = TASK_HEADER_PATTERN.match(line)
+        if header:
+            task = self._close_block()
+            self._task_key = header.group(1)
+            self._block_lines = [header.group(2)]
+            return task
+
+        if self._task_key is None:
+            return None
+
+        if BLOCK_END_PATTERN.match(line):
+            if not line.strip().startswith("---"):
+                self._block_lines.append(line)
+            return self._close_block()
+
+        self._block_lines.append(line)
+        return None
+
+    def _close_block(self) -> ParsedTask | None:
+        if self._task_key is None:
+            return None
+
+        task_key, block = self._task_key, "\n".join(self._block_lines).strip()
+        self._task_key = None
+        self._block_lines = []
+
+        task = parse_single_task(task_key, block)
+        if task:
+            logger.debug(f"Задача {task_key} получена из потока")
+        return task
@@ -0,0 +1,18 @@
+import math
+
+# Для русского текста BPE токенизаторы дают в среднем ~3 символа на токен
+CHARS_PER_TOKEN = 3
+
+
+def estimate_tokens(text: str) -> int:
+    """Грубая оценка количества токенов в тексте без загрузки токенизатора."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def estimate_file_tokens(file_path: str, block_chars: int = 64 * 1024) -> int:
+    """Оценка токенов текстового файла, файл читается блоками."""
+    chars = 0
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        while block := f.read(block_chars):
+            chars += len(block)
+    return math.ceil(chars / CHARS_PER_TOKEN)
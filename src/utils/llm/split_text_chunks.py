@@ -0,0 +1,52 @@
+import re
+
+from src.utils.llm.estimate_tokens import CHARS_PER_TOKEN, estimate_tokens
+
+# Границы абзацев и частей расшифровки аудио ([Часть N])
+SEGMENT_PATTERN = re.compile(r"\n\s*\n|(?=\[Часть \d+\])")
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?…])\s+")
+
+
+def split_text_chunks(text: str, max_tokens: int) -> list[str]:
+    """Разделить текст на части не больше max_tokens по границам абзацев.
+
+    Абзацы объединяются жадно, пока часть укладывается в бюджет. Слишком
+    длинный абзац делится по предложениям, а предложение - по символам.
+    """
+    chunks = []
+    current: list[str] = []
+    current_tokens = 0
+
+    for segment in _segments(text, max_tokens):
+        segment_tokens = estimate_tokens(segment)
+        if current and current_tokens + segment_tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+
+        current.append(segment)
+        current_tokens += segment_tokens
+
+    if current:
+        chunks.append("\n\n".join(current))
+
+    return chunks
+
+
+def _segments(text: str, max_tokens: int) -> list[str]:
+    segments = []
+    for paragraph in SEGMENT_PATTERN.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+
+        if estimate_tokens(paragraph) <= max_tokens:
+            segments.append(paragraph)
+            continue
+
+        for sentence in SENTENCE_PATTERN.split(paragraph):
+            max_chars = max_tokens * CHARS_PER_TOKEN
+            segments.extend(
+                sentence[i : i + max_chars] for i in range(0, len(sentence), max_chars)
+            )
+
+    return segments
@@ -0,0 +1,204 @@
+import contextvars
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+# Сборщик замеров текущего документа и текущий этап. Контекст копируется в
+# задачи asyncio и в asyncio.to_thread, поэтому параллельные элементы
+# конвейера пишут в общий сборщик, но каждый видит свой текущий этап.
+_current_timings: contextvars.ContextVar["StageTimings | None"] = (
+    contextvars.ContextVar("current_timings", default=None)
+)
+_current_stage: contextvars.ContextVar["StageTiming | None"] = contextvars.ContextVar(
+    "current_stage", default=None
+)
+
+
+@dataclass
+class StageTiming:
+    """Замер одного этапа обработки."""
+
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    # Изменение RSS процесса за этап (может быть отрицательным)
+    memory_delta_bytes: int = 0
+    # Пик выделенной Python памяти сверх уровня начала этапа (tracemalloc);
+    # None - трассировка выключена
+    traced_peak_bytes: int | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class ResourceUsage:
+    """CPU время и пиковая память вызова в процессе пула извлечения."""
+
+    cpu_seconds: float
+    peak_memory_bytes: int
+
+
+class StageTimings:
+    """Замеры этапов обработки одного документа.
+
+    CPU время считается по процессу, поэтому у параллельных этапов оно
+    пересекается. memory_delta_bytes - разница RSS процесса в конце и в начале
+    этапа: память, которую этап оставил за собой, а не его пик. Если включен
+    tracemalloc (timings_trace_memory), traced_peak_bytes - пик выделений
+    Python за этап. Пик tracemalloc общий для процесса, и reset_peak в
+    начале одного этапа сбрасывает его для всех, поэтому при параллельных
+    этапах и задачах (job_workers, pipeline_concurrency) значение
+    недостоверно. Работа, вынесенная в процессы пула извлечения, в эти
+    значения не входит: ее замеры (measure_call) добавляются к этапу через
+    annotate_worker_usage.
+    """
+
+    def __init__(self):
+        self.stages: list[StageTiming] = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageTiming]:
+        """Замер этапа: with timings.stage("extract_text"): ..."""
+        timing = StageTiming(name=name)
+        self.stages.append(timing)
+        token = _current_stage.set(timing)
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_started = tracemalloc.get_traced_memory()[0]
+        rss_started = _current_rss_bytes()
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield timing
+        finally:
+            timing.wall_seconds = round(time.perf_counter() - wall_started, 6)
+            timing.cpu_seconds = round(time.process_time() - cpu_started, 6)
+            timing.memory_delta_bytes = _current_rss_bytes() - rss_started
+            if tracing:
+                timing.traced_peak_bytes = max(
+                    0, tracemalloc.get_traced_memory()[1] - traced_started
+                )
+            _current_stage.reset(token)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_wall_seconds": round(time.perf_counter() - self._started, 6),
+            "stages": [timing.to_dict() for timing in self.stages],
+        }
+
+
+@contextmanager
+def collect_timings() -> Iterator[StageTimings]:
+    """Включает сбор замеров этапов для текущего контекста."""
+    timings = StageTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[StageTiming | None]:
+    """Замер этапа в текущем сборщике. Без collect_timings ничего не делает."""
+    timings = _current_timings.get()
+    if timings is None:
+        yield None
+        return
+
+    with timings.stage(name) as timing:
+        yield timing
+
+
+def annotate_stage(**values: Any) -> None:
+    """Добавляет значения (байты, счетчики модели) к текущему этапу."""
+    timing = _current_stage.get()
+    if timing is not None:
+        timing.extra.update(values)
+
+
+def annotate_worker_usage(usage: ResourceUsage) -> None:
+    """Добавляет к текущему этапу замер вызова в процессе пула.
+
+    Этап может отправить в пул несколько вызовов (диапазоны страниц PDF):
+    CPU время суммируется, пиковая память - максимум по вызовам.
+    """
+    timing = _current_stage.get()
+    if timing is None:
+        return
+
+    extra = timing.extra
+    extra["worker_cpu_seconds"] = round(
+        extra.get("worker_cpu_seconds", 0.0) + usage.cpu_seconds, 6
+    )
+    extra["worker_peak_memory_bytes"] = max(
+        extra.get("worker_peak_memory_bytes", 0), usage.peak_memory_bytes
+    )
+
+
+def measure_call(func: Callable[..., Any], *args: Any) -> tuple[Any, ResourceUsage]:
+    """Вызов func с замером CPU времени и пиковой памяти процесса.
+
+    Предназначен для процессов пула, где вызовы выполняются по одному. В CPU
+    время входят дочерние процессы (tesseract, ffmpeg), которых дождался
+    вызов. Пик RSS сбрасывается перед вызовом (Linux), иначе это максимум
+    за время жизни процесса.
+    """
+    _reset_peak_rss()
+    cpu_started = _cpu_seconds()
+    result = func(*args)
+    usage = ResourceUsage(
+        cpu_seconds=round(_cpu_seconds() - cpu_started, 6),
+        peak_memory_bytes=_peak_rss_bytes(),
+    )
+    return result, usage
+
+
+def _cpu_seconds() -> float:
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+def _reset_peak_rss() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return _max_rss_bytes()
+
+
+def _current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Текущий RSS недоступен (не Linux): изменение памяти не считается
+        return 0
+
+
+def _max_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux отдает килобайты, macOS - байты
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -0,0 +1,70 @@
+import threading
+from collections import deque
+from typing import Any
+
+from src.settings.config import settings
+from src.utils.metrics.stage_timer import StageTimings
+
+
+class TimingRegistry:
+    """Агрегация замеров этапов по всем обработанным документам."""
+
+    def __init__(self, history_size: int = 100):
+        self._history: deque[dict[str, Any]] = deque(maxlen=history_size)
+        self._stages: dict[str, dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, timings: StageTimings, **labels: Any) -> None:
+        """Сохраняет замеры документа и обновляет агрегаты по этапам."""
+        data = {**labels, **timings.to_dict()}
+        with self._lock:
+            self._history.append(data)
+            for timing in timings.stages:
+                stats = self._stages.setdefault(
+                    timing.name,
+                    {
+                        "count": 0,
+                        "total_wall_seconds": 0.0,
+                        "max_wall_seconds": 0.0,
+                        "total_cpu_seconds": 0.0,
+                        "max_memory_delta_bytes": 0,
+                        "max_traced_peak_bytes": 0,
+                    },
+                )
+                stats["count"] += 1
+                stats["total_wall_seconds"] += timing.wall_seconds
+                stats["max_wall_seconds"] = max(
+                    stats["max_wall_seconds"], timing.wall_seconds
+                )
+                stats["total_cpu_seconds"] += timing.cpu_seconds
+                stats["max_memory_delta_bytes"] = max(
+                    stats["max_memory_delta_bytes"], timing.memory_delta_bytes
+                )
+                stats["max_traced_peak_bytes"] = max(
+                    stats["max_traced_peak_bytes"], timing.traced_peak_bytes or 0
+                )
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            stages = {
+                name: {
+                    **stats,
+                    "avg_wall_seconds": stats["total_wall_seconds"] / stats["count"],
+                    "avg_cpu_seconds": stats["total_cpu_seconds"] / stats["count"],
+                }
+                for name, stats in self._stages.items()
+            }
+            return {"stages": stages, "recent": list(self._history)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._history.clear()
+            self._stages.clear()
+
+
+timing_registry = TimingRegistry(history_size=settings.timings_history_size)
+
+
+def get_timing_registry() -> TimingRegistry:
+    """Получение глобального реестра замеров."""
+    return timing_registry